@@ -5,23 +5,34 @@ ECE 30861/46100 Software Engineering Project Phase 1
 
 import sys
 import os
-import json
 import time
 import logging
 import argparse
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import subprocess
 import tempfile
 import shutil
 
 # Import our modules
 from src.url_parser import URLParser
+from src.async_engine import AsyncEvaluator
+from src.resource_context import ResourceContext
 from src.metrics.calculator import MetricsCalculator
 from src.models.model import ModelInfo, DatasetInfo, CodeInfo
 from src.utils.logger import setup_logger
 from src.utils.config import Config
+from src.utils.http_cache import get_http_cache
+from src.utils.http_client import get_http_client
+from src.utils.feature_store import get_feature_store
+from src.utils.blob_cache import get_blob_cache
+from src.utils.ndjson import NDJSONWriter
+from src.utils.retry import LatencyTracker
+
+# Models scored together by one vectorised pass of ./run rescore
+RESCORE_BATCH_SIZE = 10000
 
 class MLEvaluator:
     """Main class for ML Model evaluation CLI tool"""
@@ -31,6 +42,8 @@ class MLEvaluator:
         self.logger = setup_logger()
         self.url_parser = URLParser()
         self.metrics_calculator = MetricsCalculator()
+        self.model_latencies = LatencyTracker(window=None)
+        self.context = ResourceContext(self.url_parser, self.config.max_in_flight)
     
     def install_dependencies(self) -> int:
         """Install required dependencies"""
@@ -40,6 +53,9 @@ class MLEvaluator:
             # Create requirements if not exists
             requirements = [
                 "requests>=2.25.0",
+                "PyYAML>=5.1",
+                "numpy>=1.20",
+                "pyarrow>=10.0",
                 "GitPython>=3.1.0",
                 "transformers>=4.20.0",
                 "torch>=1.12.0",
@@ -67,7 +83,8 @@ class MLEvaluator:
             self.logger.error(f"Installation failed: {str(e)}")
             return 1
     
-    def process_urls_file(self, url_file_path: str) -> int:
+    def process_urls_file(self, url_file_path: str, engine: str = "thread",
+                          ordered: bool = False, workers: Optional[int] = None) -> int:
         """Process URLs from file and evaluate models"""
         try:
             if not os.path.exists(url_file_path):
@@ -81,43 +98,135 @@ class MLEvaluator:
                 self.logger.warning("No URLs found in file")
                 return 0
             
-            # Group URLs by type
-            models = []
-            datasets = []
-            codes = []
-            
-            for url in urls:
-                url_type = self.url_parser.identify_url_type(url)
-                if url_type == "MODEL":
-                    models.append(url)
-                elif url_type == "DATASET":
-                    datasets.append(url)
-                elif url_type == "CODE":
-                    codes.append(url)
-            
-            # Process models (only models produce output)
-            results = []
-            for model_url in models:
-                try:
-                    result = self.evaluate_model(model_url)
-                    if result:
-                        results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Failed to evaluate {model_url}: {str(e)}")
-                    continue
-            
-            # Output results as NDJSON
-            for result in results:
-                print(json.dumps(result))
+            # Pair models with their dataset and code URLs, and fetch each
+            # of those once up front so every model can share them
+            groups = self.url_parser.group_urls(urls)
+            models = [group['model'] for group in groups]
+            
+            # Process models (only models produce output), streaming each
+            # NDJSON line as soon as its model finishes
+            writer = NDJSONWriter(sys.stdout, ordered=ordered)
+            try:
+                self.context.load(groups)
+                if engine == "async":
+                    async_evaluator = AsyncEvaluator(self.url_parser, self.metrics_calculator,
+                                                     model_latencies=self.model_latencies,
+                                                     context=self.context)
+                    async_evaluator.run_streaming(models, writer)
+                else:
+                    self._evaluate_concurrently(models, writer, workers or self.config.model_workers)
+            finally:
+                # Results already finished still reach the output
+                writer.close()
+                self.context.close()
             
+            self._log_http_stats()
             return 0
             
         except Exception as e:
             self.logger.error(f"Failed to process URLs: {str(e)}")
             return 1
     
+    def rescore(self, ordered: bool = False) -> int:
+        """Recompute every stored model's scores from its features, offline"""
+        try:
+            store = get_feature_store()
+            if store is None:
+                print("Error: the feature store is disabled (FEATURE_STORE=0)", file=sys.stderr)
+                return 1
+            
+            writer = NDJSONWriter(sys.stdout, ordered=ordered)
+            entries = store.latest()
+            index = 0
+            while True:
+                batch = list(islice(entries, RESCORE_BATCH_SIZE))
+                if not batch:
+                    break
+                for record in self.metrics_calculator.score_features_batch(batch):
+                    writer.write(index, record)
+                    index += 1
+            writer.close()
+            return 0
+            
+        except Exception as e:
+            self.logger.error(f"Rescore failed: {str(e)}")
+            return 1
+    
+    def _evaluate_concurrently(self, model_urls: List[str], writer: NDJSONWriter,
+                               workers: int) -> None:
+        """Evaluate models on a bounded worker pool, writing each result when ready
+        
+        At most 2 * workers models are submitted at a time. When the writer
+        preserves input order, no model more than that window ahead of the
+        oldest unfinished one is submitted, which bounds the reorder buffer.
+        """
+        window = max(1, workers) * 2
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            pending = {}
+            next_index = 0
+            
+            def submit_more() -> None:
+                nonlocal next_index
+                while next_index < len(model_urls) and len(pending) < window:
+                    if writer.ordered and pending and next_index >= min(pending.values()) + window:
+                        return
+                    future = executor.submit(self.evaluate_model, model_urls[next_index])
+                    pending[future] = next_index
+                    next_index += 1
+            
+            submit_more()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Failed to evaluate {model_urls[index]}: {str(e)}")
+                        result = None
+                    writer.write(index, result)
+                submit_more()
+    
+    def _log_http_stats(self) -> None:
+        """Log HTTP cache and rate limiter effectiveness for this run"""
+        cache = get_http_cache()
+        if cache is not None:
+            stats = cache.stats()
+            self.logger.info(
+                f"HTTP cache: {stats['hits']} hits, {stats['misses']} misses, "
+                f"{stats['evictions']} evictions"
+            )
+        blob_cache = get_blob_cache()
+        if blob_cache is not None:
+            self.logger.info(f"Blob cache: {blob_cache.hits} hits, {blob_cache.misses} misses")
+        client = get_http_client()
+        limiter_stats = client.rate_limiter.stats()
+        self.logger.info(
+            f"Rate limiter: {limiter_stats['throttled']} throttled responses, "
+            f"{limiter_stats['wait_seconds']}s spent waiting"
+        )
+        request_stats = client.request_stats.as_dict()
+        self.logger.info(
+            f"Requests: {request_stats['requests']} requests, {request_stats['attempts']} attempts, "
+            f"{request_stats['retries']} retries, {request_stats['hedges']} hedges, "
+            f"{request_stats['hedge_wins']} hedge wins"
+        )
+        if self.metrics_calculator.reused:
+            self.logger.info(
+                f"Incremental: {self.metrics_calculator.reused} unchanged models re-emitted from the feature store"
+            )
+        if len(self.model_latencies):
+            latency = self.model_latencies.summary()
+            self.logger.info(
+                "Per-model latency: " + ", ".join(
+                    f"{name}={value * 1000:.0f}ms" for name, value in latency.items()
+                )
+            )
+    
     def evaluate_model(self, model_url: str) -> Optional[Dict[str, Any]]:
         """Evaluate a single model and return metrics"""
+        start_time = time.time()
         try:
             self.logger.info(f"Evaluating model: {model_url}")
             
@@ -125,6 +234,7 @@ class MLEvaluator:
             model_info = self.url_parser.parse_model_url(model_url)
             if not model_info:
                 return None
+            self.context.attach(model_info, model_url)
             
             # Calculate all metrics in parallel
             return self.metrics_calculator.calculate_all_metrics(model_info)
@@ -132,6 +242,8 @@ class MLEvaluator:
         except Exception as e:
             self.logger.error(f"Model evaluation failed: {str(e)}")
             return None
+        finally:
+            self.model_latencies.record(time.time() - start_time)
     
     def run_tests(self) -> int:
         """Run test suite"""
@@ -193,18 +305,41 @@ class MLEvaluator:
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
-        print("Usage: ./run [install|URL_FILE|test]", file=sys.stderr)
+        print("Usage: ./run [install|URL_FILE|test|rescore] [--engine thread|async] [--workers N] [--ordered] [--full] [--profiles FILE]",
+              file=sys.stderr)
         return 1
     
-    command = sys.argv[1]
+    arg_parser = argparse.ArgumentParser(prog="run")
+    arg_parser.add_argument("command")
+    arg_parser.add_argument("--engine", choices=["thread", "async"], default="thread",
+                            help="evaluate models on a worker pool (thread) or all at once (async)")
+    arg_parser.add_argument("--workers", type=int, default=None,
+                            help="number of models evaluated concurrently by the thread engine")
+    arg_parser.add_argument("--ordered", action="store_true",
+                            help="write results in input order instead of completion order")
+    arg_parser.add_argument("--full", action="store_true",
+                            help="re-evaluate every model, even if its revision is already in the feature store")
+    arg_parser.add_argument("--profiles", default=None,
+                            help="YAML or JSON file of named weight profiles, each reported as net_score_<profile>")
+    args = arg_parser.parse_args(sys.argv[1:])
+    
+    command = args.command
     evaluator = MLEvaluator()
+    if args.profiles:
+        calculator = evaluator.metrics_calculator
+        calculator.weight_profiles = calculator.load_weight_profiles(args.profiles)
     
     if command == "install":
         return evaluator.install_dependencies()
     elif command == "test":
         return evaluator.run_tests()
+    elif command == "rescore":
+        return evaluator.rescore(ordered=args.ordered)
     elif os.path.exists(command):
-        return evaluator.process_urls_file(command)
+        if args.full:
+            evaluator.metrics_calculator.incremental = False
+        return evaluator.process_urls_file(command, engine=args.engine,
+                                           ordered=args.ordered, workers=args.workers)
     else:
         print(f"Error: Unknown command or file not found: {command}", file=sys.stderr)
         return 1
@@ -8,12 +8,17 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.25.0",
+        "PyYAML>=5.1",
+        "numpy>=1.20",
         "GitPython>=3.1.0", 
         "transformers>=4.20.0",
         "torch>=1.12.0",
         "huggingface-hub>=0.15.0",
     ],
     extras_require={
+        "profile": [
+            "pyarrow>=10.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0", 
@@ -0,0 +1,118 @@
+# src/async_engine.py
+"""
+Asyncio evaluation engine that evaluates every model in a URL file concurrently
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .metrics.calculator import MetricsCalculator
+from .models.model import ModelInfo
+from .resource_context import ResourceContext
+from .url_parser import URLParser
+from .utils.config import Config
+from .utils.logger import setup_logger
+from .utils.ndjson import NDJSONWriter
+from .utils.retry import LatencyTracker
+
+class AsyncEvaluator:
+    """Evaluate many models concurrently on a single event loop.
+
+    HTTP calls go through the shared pooled client, which caps the number
+    of requests on the wire at Config.max_in_flight for the whole process.
+    Blocking calls are dispatched to a thread pool of the same size, so
+    throughput is bounded by that limit rather than by one model at a time.
+    """
+
+    def __init__(self, url_parser: Optional[URLParser] = None,
+                 metrics_calculator: Optional[MetricsCalculator] = None,
+                 max_in_flight: Optional[int] = None,
+                 model_latencies: Optional[LatencyTracker] = None,
+                 context: Optional[ResourceContext] = None):
+        self.logger = setup_logger()
+        self.url_parser = url_parser or URLParser()
+        self.metrics_calculator = metrics_calculator or MetricsCalculator()
+        self.max_in_flight = max_in_flight or Config().max_in_flight
+        self.model_latencies = model_latencies if model_latencies is not None else LatencyTracker(window=None)
+        # Dataset and code resources shared by the models of a URL file
+        self.context = context
+
+    async def parse_model_url(self, url: str, executor: ThreadPoolExecutor) -> Optional[ModelInfo]:
+        """Coroutine version of URLParser.parse_model_url"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, self.url_parser.parse_model_url, url)
+
+    async def evaluate_model(self, model_url: str,
+                             executor: ThreadPoolExecutor) -> Optional[Dict[str, Any]]:
+        """Evaluate a single model and return its metrics record"""
+        start_time = time.time()
+        try:
+            self.logger.info(f"Evaluating model: {model_url}")
+            model_info = await self.parse_model_url(model_url, executor)
+            if not model_info:
+                return None
+            if self.context is not None:
+                # May wait on Hub lookups of the datasets its card declares
+                await asyncio.get_event_loop().run_in_executor(
+                    executor, self.context.attach, model_info, model_url)
+            return await self.metrics_calculator.calculate_all_metrics_async(model_info, executor)
+        except Exception as e:
+            self.logger.error(f"Failed to evaluate {model_url}: {str(e)}")
+            return None
+        finally:
+            self.model_latencies.record(time.time() - start_time)
+
+    async def evaluate_models(self, model_urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Evaluate all models concurrently, returning results in input order"""
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            return await asyncio.gather(*[
+                self.evaluate_model(url, executor) for url in model_urls
+            ])
+
+    async def stream_models(self, model_urls: List[str], writer: NDJSONWriter) -> None:
+        """Evaluate models concurrently, handing each result to the writer when done
+        
+        At most 2 * max_in_flight models are in progress at a time. When the
+        writer preserves input order, no model more than that window ahead of
+        the oldest unfinished one is started, so the reorder buffer stays
+        within the window even while an early model is slow.
+        """
+        window = max(1, self.max_in_flight) * 2
+        
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            pending: Dict[asyncio.Future, int] = {}
+            next_index = 0
+            
+            def submit_more() -> None:
+                nonlocal next_index
+                while next_index < len(model_urls) and len(pending) < window:
+                    if writer.ordered and pending and next_index >= min(pending.values()) + window:
+                        return
+                    task = asyncio.ensure_future(self.evaluate_model(model_urls[next_index], executor))
+                    pending[task] = next_index
+                    next_index += 1
+            
+            submit_more()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    writer.write(pending.pop(task), task.result())
+                submit_more()
+
+    def run_streaming(self, model_urls: List[str], writer: NDJSONWriter) -> None:
+        """Run the streaming engine to completion from synchronous code"""
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.stream_models(model_urls, writer))
+        finally:
+            loop.close()
+
+    def run(self, model_urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Run the engine to completion from synchronous code"""
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.evaluate_models(model_urls))
+        finally:
+            loop.close()
@@ -0,0 +1,499 @@
+# src/metrics/artifacts.py
+"""
+Shared per-model artifacts (README, file tree, weight headers) used by all metrics
+"""
+
+import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from ..models.model import ModelInfo
+from ..models.model_card import ModelCard, front_matter_from_prefix
+from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client, read_prefix
+from ..utils.hf_tree import file_entry, iter_commits, iter_repo_tree
+from ..utils.blob_cache import BlobCache, get_blob_cache
+from ..utils.feature_store import FeatureStore, get_feature_store
+from ..utils.config import Config
+from ..utils.keyword_matcher import KeywordHits
+from ..utils.python_analysis import ANALYSIS_KIND, analyze_sources
+from ..utils import commit_history, repo_history
+from ..utils.code_archive import analyze_archive, archive_url
+from ..utils.safetensors import count_parameters, read_header
+from .keywords import README_MATCHER
+
+# Concurrent header reads for sharded checkpoints
+SHARD_WORKERS = 4
+# Leading README bytes read when only the front matter is needed
+FRONT_MATTER_BYTES = 8192
+# Concurrent downloads of Python files for code analysis
+CODE_FETCH_WORKERS = 8
+# Blob cache kind of raw README text; :2 since the text is read at the oid's commit
+README_KIND = 'readme-text:2'
+
+class ModelArtifacts:
+    """Lazily fetched remote artifacts for a single model.
+
+    One instance is built per model by the MetricsCalculator and handed to
+    every metric, so each artifact is downloaded and decoded at most once
+    even though the metrics run concurrently.
+    """
+
+    def __init__(self, model_info: ModelInfo, session: Optional[requests.Session] = None,
+                 timeout: int = 10, partial_readme: bool = True,
+                 blob_cache: Optional[BlobCache] = None,
+                 feature_store: Optional[FeatureStore] = None):
+        self.logger = setup_logger()
+        self.model_info = model_info
+        self.session = session or get_http_client()
+        # Per-file results shared by every repo with byte-identical files
+        self.blob_cache = blob_cache if blob_cache is not None else get_blob_cache()
+        # Per-model summaries extended across runs, such as the Hub commit history
+        self.feature_store = feature_store if feature_store is not None else get_feature_store()
+        self.timeout = timeout
+        # Whether front matter may be read from a partial README download
+        self.partial_readme = partial_readme
+
+        self._values: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        # Artifacts whose fetch failed for a reason other than a 404
+        self.fetch_failures: List[str] = list(model_info.fetch_failures)
+
+    @property
+    def revision(self) -> str:
+        """The hydrated commit sha, or 'main' when it is unknown"""
+        return self.model_info.sha or 'main'
+
+    @property
+    def readme_url(self) -> str:
+        """README download URL, pinned to the hydrated commit when known
+
+        Pinning keeps the text consistent with the blob oid it is cached
+        under, even if main moves after the model info was fetched.
+        """
+        if self.model_info.sha:
+            return self.file_url('README.md')
+        return f"https://huggingface.co/{self.model_info.name}/raw/main/README.md"
+
+    @property
+    def tree_url(self) -> str:
+        return f"https://huggingface.co/api/models/{self.model_info.name}/tree/{self.revision}"
+
+    def file_url(self, path: str) -> str:
+        """Download URL of a repo file, pinned to the hydrated commit when known"""
+        return f"https://huggingface.co/{self.model_info.name}/resolve/{self.revision}/{path}"
+
+    @property
+    def readme(self) -> Optional[str]:
+        """Raw README text, or None if it could not be fetched"""
+        return self._get('readme', self._fetch_readme)
+
+    @property
+    def readme_lower(self) -> Optional[str]:
+        """Lowercased README text, or None if it could not be fetched"""
+        return self._get('readme_lower', self._lower_readme)
+
+    @property
+    def card(self) -> Optional[ModelCard]:
+        """Parsed README (front matter, sections, code blocks, links, tables)"""
+        return self._get('card', self._parse_card)
+
+    @property
+    def front_matter(self) -> Optional[Dict[str, Any]]:
+        """README YAML front matter ({} if it has none), or None without a README.
+
+        Read from the first few KB of the README with a Range request, so
+        the full body is only downloaded when the block does not fit.
+        """
+        return self._get('front_matter', self._fetch_front_matter)
+
+    @property
+    def readme_hits(self) -> Optional[KeywordHits]:
+        """Every README keyword hit from a single scan, or None without a README"""
+        return self._get('readme_hits', self._scan_readme)
+
+    @property
+    def tree(self) -> Optional[List[Dict[str, Any]]]:
+        """Every file in the repo (recursively), or None if it could not be fetched.
+
+        Entries are trimmed to path, size (the LFS object size for LFS
+        files), oid and lfs; directory entries are dropped. When the model
+        info already carries siblings with sizes no request is made.
+        """
+        return self._get('tree', self._fetch_tree)
+
+    @property
+    def parameter_counts(self) -> Optional[Dict[str, int]]:
+        """Parameters per dtype of the safetensors weights, or None if unavailable.
+
+        Taken from the model info's safetensors field when the Hub reports
+        it, otherwise read from the safetensors headers with Range requests.
+        """
+        return self._get('parameter_counts', self._fetch_parameter_counts)
+
+    @property
+    def python_analysis(self) -> Optional[List[Dict[str, Any]]]:
+        """AST statistics of the repo's Python files, or None without a file tree.
+
+        Files are chosen shallowest first until Config.code_fetch_budget
+        bytes are reached, downloaded concurrently and parsed in the
+        analysis process pool. Each entry holds the file's path and oid
+        plus the counts from analyze_source.
+        """
+        return self._get('python_analysis', self._analyze_python_files)
+
+    @property
+    def code_archive(self) -> Optional[Dict[str, Any]]:
+        """Single-pass analysis of the linked GitHub repo's tarball, or None without one.
+
+        See code_archive.analyze_archive; Python entries are shaped like
+        those of python_analysis.
+        """
+        return self._get('code_archive', self._analyze_code_archive)
+
+    @property
+    def repo_url(self) -> str:
+        """Git URL whose history shows who maintains the model: its linked code, else the model repo"""
+        if self.model_info.code:
+            return f"https://github.com/{self.model_info.code[0].name}.git"
+        return f"https://huggingface.co/{self.model_info.name}"
+
+    @property
+    def repo_history(self) -> Optional[Dict[str, Any]]:
+        """Commit-graph maintainer summary of repo_url, or None if unavailable.
+
+        See repo_history.analyze_history; summaries are cached by HEAD sha.
+        """
+        return self._get('repo_history', self._analyze_repo_history)
+
+    @property
+    def commit_history(self) -> Optional[Dict[str, Any]]:
+        """Author statistics of the model repo from the Hub commits API, or None.
+
+        The full summary is kept in the feature store under the model id and
+        extended on later runs with just the commits made since its head.
+        See commit_history.summarize_commits.
+        """
+        return self._get('commit_history', self._summarize_commits)
+
+    def features_for(self, metric: str, extractor: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Extract a metric's features once and keep them for the feature store"""
+        return self._get(f'features:{metric}', extractor)
+
+    @property
+    def features(self) -> Dict[str, Dict[str, Any]]:
+        """Features extracted so far, keyed by metric name"""
+        return {key.split(':', 1)[1]: value for key, value in list(self._values.items())
+                if key.startswith('features:')}
+
+    @property
+    def complete(self) -> bool:
+        """Whether every fetch succeeded or found the resource missing (404).
+
+        Features extracted after a throttled or failed request hold default
+        sub-scores, so they must not be stored and reused for the revision.
+        """
+        return not self.fetch_failures
+
+    def _fetch_failed(self, artifact: str, error: Optional[Exception] = None) -> None:
+        """Record a failed fetch unless the error says the resource does not exist"""
+        response = getattr(error, 'response', None)
+        if getattr(response, 'status_code', None) != 404:
+            self.fetch_failures.append(artifact)
+
+    def _get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return a cached artifact, loading it exactly once across threads"""
+        if key in self._values:
+            return self._values[key]
+
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            if key not in self._values:
+                self._values[key] = loader()
+            return self._values[key]
+
+    def _fetch_readme(self) -> Optional[str]:
+        oid = self._readme_oid()
+        if self.blob_cache is not None and oid:
+            text = self.blob_cache.get(README_KIND, oid)
+            if text is not None:
+                return text
+        try:
+            response = self.session.get(self.readme_url, timeout=self.timeout)
+            if response.status_code != 200:
+                if response.status_code != 404:
+                    self._fetch_failed('readme')
+                return None
+            if self.blob_cache is not None and oid:
+                self.blob_cache.put(README_KIND, oid, response.text)
+            return response.text
+        except Exception as e:
+            self.logger.error(f"README fetch failed for {self.model_info.name}: {str(e)}")
+            self._fetch_failed('readme', e)
+            return None
+
+    def _readme_oid(self) -> Optional[str]:
+        """Blob oid of the README at the hydrated commit, or None if not pinned.
+
+        Taken from the siblings when they carry blob ids, else from the file
+        tree at the same commit, which the size and code metrics need anyway.
+        """
+        if not self.model_info.sha:
+            return None  # main may move; text from it cannot be tied to an oid
+        for item in self.model_info.siblings:
+            if item.get('rfilename') == 'README.md' and (item.get('blobId') or item.get('oid')):
+                return item.get('blobId') or item.get('oid')
+        for item in self.tree or []:
+            if item['path'] == 'README.md':
+                return item.get('oid')
+        return None
+
+    def _lower_readme(self) -> Optional[str]:
+        readme = self.readme
+        return readme.lower() if readme is not None else None
+
+    def _parse_card(self) -> Optional[ModelCard]:
+        readme = self.readme
+        return ModelCard.parse(readme) if readme is not None else None
+
+    def _fetch_front_matter(self) -> Optional[Dict[str, Any]]:
+        if self.partial_readme and 'readme' not in self._values:
+            try:
+                prefix = read_prefix(self.session, self.readme_url, FRONT_MATTER_BYTES, self.timeout)
+                front_matter = front_matter_from_prefix(prefix.decode('utf-8', errors='ignore'))
+                if front_matter is not None:
+                    return front_matter
+            except Exception:
+                pass  # fall back to the full README below
+
+        card = self.card
+        return card.front_matter if card is not None else None
+
+    def _scan_readme(self) -> Optional[KeywordHits]:
+        content = self.readme_lower
+        return README_MATCHER.scan(content) if content is not None else None
+
+    def _fetch_tree(self) -> Optional[List[Dict[str, Any]]]:
+        siblings = self.model_info.siblings
+        if siblings and all('rfilename' in item and 'size' in item for item in siblings):
+            return [file_entry(item) for item in siblings]
+
+        try:
+            files = []
+            for entry in iter_repo_tree(self.session, self.model_info.name, revision=self.revision,
+                                        timeout=self.timeout):
+                if entry.get('type') == 'directory' or 'path' not in entry:
+                    continue
+                files.append(file_entry(entry))
+            return files
+        except Exception as e:
+            self.logger.error(f"File tree fetch failed for {self.model_info.name}: {str(e)}")
+            self._fetch_failed('tree', e)
+            return None
+
+    def _fetch_parameter_counts(self) -> Optional[Dict[str, int]]:
+        # The Hub reports the counts of the safetensors weights in the model info
+        safetensors = self.model_info.api_data.get('safetensors')
+        if isinstance(safetensors, dict) and safetensors.get('parameters'):
+            return {dtype: int(count) for dtype, count in safetensors['parameters'].items()}
+
+        files = self.tree
+        if not files:
+            return None
+        try:
+            weight_files = self._safetensors_files([item['path'] for item in files])
+            if not weight_files:
+                return None
+
+            with ThreadPoolExecutor(max_workers=min(SHARD_WORKERS, len(weight_files))) as executor:
+                headers = list(executor.map(
+                    lambda path: read_header(self.session, self.file_url(path), self.timeout),
+                    weight_files
+                ))
+
+            counts: Dict[str, int] = {}
+            for header in headers:
+                for dtype, count in count_parameters(header).items():
+                    counts[dtype] = counts.get(dtype, 0) + count
+            return counts
+        except Exception as e:
+            self.logger.error(f"Safetensors header read failed for {self.model_info.name}: {str(e)}")
+            self._fetch_failed('parameter_counts', e)
+            return None
+
+    def _analyze_python_files(self) -> Optional[List[Dict[str, Any]]]:
+        files = self.tree
+        if files is None:
+            return None
+        selected = self._python_files_within_budget(files, Config().code_fetch_budget)
+        if not selected:
+            return []
+
+        # Files already analysed under the same oid, in any repo, are not fetched
+        results: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for item in selected:
+            cached = self.blob_cache.get(ANALYSIS_KIND, item.get('oid')) if self.blob_cache is not None else None
+            if cached is not None:
+                results[item['path']] = cached
+            else:
+                missing.append(item)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(CODE_FETCH_WORKERS, len(missing))) as executor:
+                sources = list(executor.map(self._fetch_text, [item['path'] for item in missing]))
+
+            fetched = [(item, source) for item, source in zip(missing, sources) if source is not None]
+            for (item, _), analysis in zip(fetched, analyze_sources([source for _, source in fetched])):
+                results[item['path']] = analysis
+                if self.blob_cache is not None:
+                    self.blob_cache.put(ANALYSIS_KIND, item.get('oid'), analysis)
+
+        return [
+            dict(results[item['path']], path=item['path'], oid=item.get('oid'))
+            for item in selected if item['path'] in results
+        ]
+
+    def _analyze_code_archive(self) -> Optional[Dict[str, Any]]:
+        if not self.model_info.code:
+            return None
+        code = self.model_info.code[0]
+        url = archive_url(code.name, code.api_data.get('default_branch'))
+        config = Config()
+        try:
+            response = self.session.get(url, stream=True, timeout=self.timeout)
+            try:
+                if response.status_code != 200:
+                    if response.status_code != 404:
+                        self._fetch_failed('code_archive')
+                    return None
+                return analyze_archive(response.raw, config.code_archive_budget,
+                                       config.code_fetch_budget, self.blob_cache)
+            finally:
+                response.close()
+        except Exception as e:
+            self.logger.warning(f"Code archive analysis failed for {url}: {str(e)}")
+            self._fetch_failed('code_archive', e)
+            return None
+
+    def _summarize_commits(self) -> Optional[Dict[str, Any]]:
+        if not Config().commit_history_enabled:
+            return None
+        name = self.model_info.name
+        try:
+            store = self.feature_store
+            previous = store.get_summary(commit_history.COMMITS_KIND, name) if store is not None else None
+            if previous is not None and previous['head'] == self.model_info.sha:
+                return commit_history.history(previous)
+
+            commits = iter_commits(self.session, name, timeout=self.timeout)
+            try:
+                summary = commit_history.summarize_commits(commits, self.model_info.sha, previous)
+            finally:
+                commits.close()
+            if store is not None and self.model_info.sha:
+                store.put_summary(commit_history.COMMITS_KIND, name, summary)
+            return commit_history.history(summary)
+        except Exception as e:
+            self.logger.warning(f"Commit history unavailable for {name}: {str(e)}")
+            self._fetch_failed('commit_history', e)
+            return None
+
+    def _analyze_repo_history(self) -> Optional[Dict[str, Any]]:
+        config = Config()
+        if not config.repo_history_enabled or not repo_history.available():
+            return None
+        url = self.repo_url
+        try:
+            # The model repo's HEAD is already known from the API
+            head = self.model_info.sha if not self.model_info.code else None
+            head = head or repo_history.remote_head(url)
+            if head is None:
+                # Empty, or private and we have no credentials: no history
+                return None
+            cached = self.blob_cache.get(repo_history.HISTORY_KIND, head) if self.blob_cache is not None else None
+            if cached is not None:
+                return cached
+            history = repo_history.analyze_history(url, config.repo_history_commits)
+            if history is not None and self.blob_cache is not None:
+                self.blob_cache.put(repo_history.HISTORY_KIND, head, history)
+            return history
+        except Exception as e:
+            self.logger.warning(f"Repo history unavailable for {url}: {str(e)}")
+            self._fetch_failed('repo_history', e)
+            return None
+
+    @staticmethod
+    def _python_files_within_budget(files: List[Dict[str, Any]], budget: int) -> List[Dict[str, Any]]:
+        """Python files, shallowest first, whose sizes add up to at most budget bytes"""
+        python_files = sorted(
+            (item for item in files if item.get('path', '').endswith('.py')),
+            key=lambda item: (item['path'].count('/'), item['path'])
+        )
+        selected = []
+        for item in python_files:
+            size = item.get('size') or 0
+            if size > budget:
+                continue
+            budget -= size
+            selected.append(item)
+        return selected
+
+    def _fetch_text(self, path: str) -> Optional[str]:
+        try:
+            response = self.session.get(self.file_url(path), timeout=self.timeout)
+            if response.status_code == 200:
+                return response.text
+            if response.status_code != 404:
+                self._fetch_failed('python_analysis')
+            return None
+        except Exception as e:
+            self.logger.debug(f"Fetching {path} of {self.model_info.name} failed: {str(e)}")
+            self._fetch_failed('python_analysis', e)
+            return None
+
+    def _safetensors_files(self, paths: List[str]) -> List[str]:
+        """Weight files to inspect, one checkpoint per folder.
+
+        A folder with a *.safetensors.index.json contributes the shards it
+        lists; otherwise its .safetensors files are used, skipping variants
+        such as model.fp16.safetensors when model.safetensors also exists.
+        """
+        folders: Dict[str, List[str]] = {}
+        for path in paths:
+            if path.endswith('.safetensors') or path.endswith('.safetensors.index.json'):
+                folders.setdefault(posixpath.dirname(path), []).append(path)
+
+        selected: List[str] = []
+        for folder, folder_paths in sorted(folders.items()):
+            indexes = sorted((p for p in folder_paths if p.endswith('.index.json')), key=len)
+            if indexes:
+                selected.extend(self._index_shards(indexes[0]))
+                continue
+
+            weights = set(folder_paths)
+            for path in sorted(weights):
+                stem = path[:-len('.safetensors')]
+                base, _, variant = stem.rpartition('.')
+                if variant and base + '.safetensors' in weights:
+                    continue
+                selected.append(path)
+        return selected
+
+    def _index_shards(self, index_path: str) -> List[str]:
+        """Shard files listed in a safetensors index, relative to the repo root"""
+        response = self.session.get(self.file_url(index_path), timeout=self.timeout)
+        if response.status_code != 200:
+            raise requests.HTTPError(
+                f"Index fetch failed with HTTP {response.status_code}: {index_path}",
+                response=response
+            )
+        weight_map = response.json().get('weight_map', {})
+        folder = posixpath.dirname(index_path)
+        return [posixpath.join(folder, shard) for shard in sorted(set(weight_map.values()))]
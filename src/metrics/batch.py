@@ -0,0 +1,218 @@
+# src/metrics/batch.py
+"""
+Vectorised scoring of stored features for many models at once
+"""
+
+import time
+from itertools import repeat
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.logger import setup_logger
+
+# Latency reported for a metric whose features are missing, as in MetricsCalculator
+FAILED_LATENCY = 1000
+
+class BatchScorer:
+    """Score the stored features of N models with NumPy column operations.
+
+    The records are identical to MetricsCalculator.score_features. Only
+    packing the JSON features into arrays loops over models in Python; the
+    metric formulas, the size buckets and the net score work on whole
+    columns, accumulated in the same order as the per-model code so the
+    floating point results match exactly.
+    """
+
+    def __init__(self, calculator):
+        self.logger = setup_logger()
+        self.calculator = calculator
+
+    def score(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Records for feature store entries with 'name', 'features' and 'latencies'"""
+        if not entries:
+            return []
+        calculator = self.calculator
+        columns: Dict[str, Any] = {}
+        valid: Dict[str, np.ndarray] = {}
+
+        for metric in calculator.metrics:
+            rows = [entry['features'].get(metric.name) for entry in entries]
+            if metric is calculator.size_metric:
+                scores, ok = self._size_scores(metric, rows)
+            elif metric is calculator.license_metric:
+                scores, ok = self._license_scores(metric, rows)
+            elif metric is calculator.busfactor_metric:
+                scores, ok = self._linear_scores(metric, rows, {'activity': self._activity_scores(metric, rows),
+                                                                'maintainers': self._maintainer_scores(metric, rows)})
+            elif metric is calculator.dataset_quality_metric:
+                scores, ok = self._linear_scores(metric, rows,
+                                                 {'preprocessing': self._preprocessing_scores(metric, rows)})
+            else:
+                scores, ok = self._linear_scores(metric, rows)
+            failed = int(len(rows) - ok.sum())
+            if failed:
+                self.logger.error(f"Failed to calculate {metric.name} for {failed} models: missing or malformed features")
+            columns[metric.name] = scores
+            valid[metric.name] = ok
+
+        net_score_start = time.time()
+        net_scores = self._net_scores(columns, calculator.net_score_weights)
+        net_score_latency = max(1, int((time.time() - net_score_start) * 1000 / len(entries)))
+        # Every profile reuses the packed metric columns
+        profiles = list(calculator.weight_profiles)
+        profile_scores = [self._net_scores(columns, calculator.weight_profiles[profile]) for profile in profiles]
+
+        # Transpose the columns into per-model metrics, as plain Python values
+        keys = []
+        values = []
+        latencies = [entry.get('latencies') or {} for entry in entries]
+        for name, scores in columns.items():
+            ok = valid[name].tolist()
+            keys += [name, f"{name}_latency"]
+            values.append(self._metric_values(name, scores, ok))
+            values.append([
+                latency.get(name, 0) if fine else FAILED_LATENCY
+                for latency, fine in zip(latencies, ok)
+            ])
+        return [
+            calculator._format_result(entry['name'], net_score, net_score_latency, dict(zip(keys, row)),
+                                      dict(zip(profiles, scores)))
+            for entry, net_score, row, scores in zip(entries, net_scores, zip(*values),
+                                                     zip(*profile_scores) if profiles else repeat(()))
+        ]
+
+    def _metric_values(self, name: str, scores: Any, ok: List[bool]) -> List[Any]:
+        """A metric's value for every model, with failure defaults"""
+        if not isinstance(scores, dict):
+            # Failed rows are already 0.0, the failure default
+            return scores.tolist()
+        hardware = list(scores)
+        default = self.calculator._format_result('', 0.0, 0, {})[name]
+        return [
+            dict(zip(hardware, row)) if fine else dict(default)
+            for row, fine in zip(zip(*[scores[key].tolist() for key in hardware]), ok)
+        ]
+
+    def _net_scores(self, columns: Dict[str, Any], weights: Dict[str, float]) -> List[float]:
+        """Weighted net score of every model"""
+        total_score = np.zeros(len(columns[self.calculator.license_metric.name]))
+        total_weight = 0.0
+        for metric, weight in weights.items():
+            if metric in columns and not isinstance(columns[metric], dict):
+                total_score = total_score + columns[metric] * weight
+                total_weight += weight
+        if total_weight == 0:
+            return np.zeros(len(total_score)).tolist()
+        return np.minimum(1.0, np.maximum(0.0, total_score / total_weight)).tolist()
+
+    @staticmethod
+    def _linear_scores(metric, rows: List[Optional[Dict[str, Any]]],
+                       derived: Optional[Dict[str, np.ndarray]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted sum of feature columns, capped at 1.0"""
+        derived = derived or {}
+        names = [name for name in metric.weights if name not in derived]
+        ok = np.ones(len(rows), dtype=bool)
+        pack = itemgetter(*names) if len(names) > 1 else (lambda row: (row[names[0]],))
+        try:
+            matrix = np.array([pack(row) for row in rows], dtype=float)
+        except (KeyError, TypeError, ValueError):
+            # Some rows are malformed; pack row by row to find them
+            matrix = np.zeros((len(rows), len(names)))
+            for index, row in enumerate(rows):
+                try:
+                    matrix[index] = [row[name] for name in names]
+                except (KeyError, TypeError, ValueError):
+                    ok[index] = False
+        matrix = matrix.reshape(len(rows), len(names))
+        ok &= ~np.isnan(matrix).any(axis=1)
+        for column in derived.values():
+            ok &= ~np.isnan(column)
+
+        score = np.zeros(len(rows))
+        for name, weight in metric.weights.items():
+            column = derived[name] if name in derived else matrix[:, names.index(name)]
+            score = score + column * weight
+        return np.where(ok, np.minimum(1.0, score), 0.0), ok
+
+    @staticmethod
+    def _activity_scores(metric, rows: List[Optional[Dict[str, Any]]]) -> np.ndarray:
+        """Bus factor activity from the stored last-modified dates"""
+        dates = [row.get('last_modified') if isinstance(row, dict) else None for row in rows]
+        missing = np.array([not date for date in dates], dtype=bool)
+        days = np.full(len(rows), np.nan)
+        for index, date in enumerate(dates):
+            if date:
+                days_old = metric.days_since(date)
+                if days_old is not None:
+                    days[index] = days_old
+
+        conditions = [missing, np.isnan(days)]
+        choices = [metric.missing_activity, metric.unparsable_activity]
+        for max_days, score in metric.activity_buckets:
+            conditions.append(days <= max_days)
+            choices.append(score)
+        return np.select(conditions, choices, metric.stale_activity)
+
+    @staticmethod
+    def _maintainer_scores(metric, rows: List[Optional[Dict[str, Any]]]) -> np.ndarray:
+        """Bus factor maintainers from the stored repo history, else the org score"""
+        scores = np.full(len(rows), np.nan)
+        for index, row in enumerate(rows):
+            try:
+                scores[index] = metric.maintainers_score(row)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                pass
+        return scores
+
+    @staticmethod
+    def _preprocessing_scores(metric, rows: List[Optional[Dict[str, Any]]]) -> np.ndarray:
+        """Dataset quality preprocessing, raised by the stored sample profile"""
+        scores = np.full(len(rows), np.nan)
+        for index, row in enumerate(rows):
+            try:
+                scores[index] = max(row['preprocessing'], metric.sample_quality(row.get('sample_profile')))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                pass
+        return scores
+
+    @staticmethod
+    def _license_scores(metric, rows: List[Optional[Dict[str, Any]]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Score each distinct license once and gather the results"""
+        ok = np.array([isinstance(row, dict) for row in rows], dtype=bool)
+        licenses = np.array([(row.get('license') or '') if isinstance(row, dict) else '' for row in rows],
+                            dtype=object)
+        distinct, inverse = np.unique(licenses, return_inverse=True)
+        table = np.array([metric.score({'license': license or None}) for license in distinct])
+        return np.where(ok, table[inverse.reshape(-1)], 0.0), ok
+
+    @staticmethod
+    def _size_scores(metric, rows: List[Optional[Dict[str, Any]]]) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Per-hardware size buckets for every model"""
+        size_gb = np.full(len(rows), np.nan)
+        total_params = np.zeros(len(rows))
+        has_counts = np.zeros(len(rows), dtype=bool)
+        for index, row in enumerate(rows):
+            try:
+                size_gb[index] = row['size_gb']
+                counts = row.get('parameter_counts')
+                if counts:
+                    total_params[index] = sum(counts.values())
+                    has_counts[index] = True
+            except (KeyError, TypeError, ValueError, AttributeError):
+                size_gb[index] = np.nan
+        ok = ~np.isnan(size_gb)
+
+        scores = {}
+        for hardware, limit in metric.hardware_limits.items():
+            fits_quantized = np.zeros(len(rows), dtype=bool)
+            for nbytes in metric.precision_bytes.values():
+                fits_quantized |= total_params * nbytes / (1024 ** 3) <= limit
+            scores[hardware] = np.select(
+                [size_gb <= limit * 0.5, size_gb <= limit * 0.8, size_gb <= limit,
+                 has_counts, size_gb <= limit * 1.5],
+                [1.0, 0.8, 0.6, np.where(fits_quantized, 0.3, 0.0), 0.3],
+                0.0
+            )
+        return scores, ok
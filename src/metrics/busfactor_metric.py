@@ -3,80 +3,127 @@
 Bus factor metric - measuring knowledge concentration/maintainer responsiveness
 """
 
-import requests
 import json
+import time
 from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client
+from .artifacts import ModelArtifacts
 
 class BusFactorMetric:
     """Calculate bus factor score"""
     
+    name = 'bus_factor'
+    
+    # 'activity' is derived from the stored last_modified date when scoring
+    weights = {'known_model': 0.6, 'activity': 0.4, 'maintainers': 0.3, 'community': 0.3}
+    
+    # (maximum age in days, score), newest first
+    activity_buckets = [
+        (30, 1.0),    # Very recent
+        (90, 0.8),    # Recent
+        (180, 0.6),   # Somewhat recent
+        (365, 0.4),   # Within a year
+    ]
+    stale_activity = 0.2
+    missing_activity = 0.1
+    unparsable_activity = 0.3
+    
+    # Maintainers from the commit graph, replacing the org table when a repo was analysed
+    history_weights = {'truck_factor': 0.4, 'spread': 0.3, 'active_maintainers': 0.3}
+    truck_factor_target = 3     # authors
+    active_maintainers_target = 3
+    active_days = 180
+    
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
+        self.session = get_http_client()
     
-    def calculate(self, model_info: ModelInfo) -> float:
+    def calculate(self, model_info: ModelInfo,
+                  artifacts: Optional[ModelArtifacts] = None) -> float:
         """Calculate bus factor (higher = safer/better maintained)"""
         try:
-            # Special handling for well-known, well-maintained models
-            model_name_lower = model_info.name.lower()
-            if any(known_model in model_name_lower for known_model in ['bert', 'gpt', 'whisper', 't5', 'roberta']):
-                # These models are well-established and maintained
-                base_score = 0.6
-            else:
-                base_score = 0.0
-            
-            score = base_score
-            
-            # Check recent activity
-            activity_score = self._check_recent_activity(model_info)
-            score += activity_score * 0.4
-            
-            # Check maintainer info
-            maintainer_score = self._analyze_maintainers(model_info)
-            score += maintainer_score * 0.3
-            
-            # Check community engagement
-            community_score = self._assess_community(model_info)
-            score += community_score * 0.3
-            
-            return min(1.0, score)
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            features = artifacts.features_for(
+                self.name, lambda: self.extract_features(model_info, artifacts))
+            return self.score(features)
             
         except Exception as e:
             self.logger.error(f"Bus factor calculation failed: {str(e)}")
             return 0.4  # Default moderate score
     
-    def _check_recent_activity(self, model_info: ModelInfo) -> float:
-        """Check for recent activity/updates"""
+    def extract_features(self, model_info: ModelInfo,
+                         artifacts: Optional[ModelArtifacts] = None) -> Dict[str, Any]:
+        """Maintenance signals; the activity date is kept raw so it ages on re-score"""
+        return {
+            # Well-established, maintained model families
+            'known_model': any(known_model in model_info.name.lower() for known_model in ['bert', 'gpt', 'whisper', 't5', 'roberta']),
+            'last_modified': model_info.last_modified,
+            'maintainers': self._analyze_maintainers(model_info),
+            'community': self._assess_community(model_info),
+            'repo_history': artifacts.repo_history if artifacts is not None else None,
+            # Hub commits API, only needed when no repo history could be cloned
+            'commit_history': artifacts.commit_history
+            if artifacts is not None and artifacts.repo_history is None else None,
+        }
+    
+    def score(self, features: Dict[str, Any]) -> float:
+        """Weighted bus factor score; no network access"""
+        values = dict(features, activity=self._activity_score(features.get('last_modified')),
+                      maintainers=self.maintainers_score(features))
+        score = 0.0
+        for feature, weight in self.weights.items():
+            score += values[feature] * weight
+        return min(1.0, score)
+    
+    def maintainers_score(self, features: Dict[str, Any]) -> float:
+        """Truck factor, author spread and recently active authors of the repo history.
+        
+        Uses the cloned repo history, else the Hub commit history (which has
+        no truck factor), else the organisation score. Activity is measured
+        from now, so stored histories age on re-score.
+        """
+        history = features.get('repo_history') or features.get('commit_history')
+        if not history or not history.get('commits') or not history.get('last_commits'):
+            return features['maintainers']
+        
+        since = time.time() - self.active_days * 86400
+        active = sum(1 for timestamp in history['last_commits'] if timestamp >= since)
+        parts = {
+            'spread': 1.0 - history['top_author_share'],
+            'active_maintainers': min(1.0, active / self.active_maintainers_target),
+        }
+        if 'truck_factor' in history:
+            parts['truck_factor'] = min(1.0, history['truck_factor'] / self.truck_factor_target)
+        total = sum(self.history_weights[part] for part in parts)
+        return sum(parts[part] * self.history_weights[part] for part in parts) / total
+    
+    def _activity_score(self, last_modified: Optional[str]) -> float:
+        """Score how recently the model was updated"""
+        if not last_modified:
+            return self.missing_activity
+        
+        days_old = self.days_since(last_modified)
+        if days_old is None:
+            return self.unparsable_activity
+        
+        for max_days, score in self.activity_buckets:
+            if days_old <= max_days:
+                return score
+        return self.stale_activity  # Old
+    
+    @staticmethod
+    def days_since(last_modified: str) -> Optional[int]:
+        """Whole days since an ISO timestamp, or None if it cannot be parsed"""
         try:
-            if not model_info.last_modified:
-                return 0.1
-            
-            # Parse last modified date
-            try:
-                last_mod = datetime.fromisoformat(model_info.last_modified.replace('Z', '+00:00'))
-                now = datetime.now(last_mod.tzinfo)
-                
-                days_old = (now - last_mod).days
-                
-                if days_old <= 30:      # Very recent
-                    return 1.0
-                elif days_old <= 90:    # Recent
-                    return 0.8
-                elif days_old <= 180:   # Somewhat recent
-                    return 0.6
-                elif days_old <= 365:   # Within a year
-                    return 0.4
-                else:                   # Old
-                    return 0.2
-                    
-            except:
-                return 0.3
-                
-        except Exception as e:
-            self.logger.error(f"Activity check failed: {str(e)}")
-            return 0.3
+            last_mod = datetime.fromisoformat(last_modified.replace('Z', '+00:00'))
+            now = datetime.now(last_mod.tzinfo)
+            return (now - last_mod).days
+        except:
+            return None
     
     def _analyze_maintainers(self, model_info: ModelInfo) -> float:
         """Analyze maintainer information"""
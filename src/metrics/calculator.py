@@ -8,12 +8,20 @@ import json
 import tempfile
 import os
 import shutil
-from typing import Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
 import multiprocessing
+import threading
 
 from ..models.model import ModelInfo, MetricResult
 from ..utils.logger import setup_logger
+from ..utils.config import Config
+from ..utils.weight_profiles import load_weight_profiles
+from ..utils.http_client import get_http_client
+from ..utils.feature_store import FeatureStore, get_feature_store
+from .artifacts import ModelArtifacts
+from .batch import BatchScorer
 from .license_metric import LicenseMetric
 from .size_metric import SizeMetric
 from .rampup_metric import RampUpMetric
@@ -26,9 +34,15 @@ from .code_quality_metric import CodeQualityMetric
 class MetricsCalculator:
     """Coordinates calculation of all metrics for a model"""
     
-    def __init__(self):
+    def __init__(self, feature_store: Optional[FeatureStore] = None):
         self.logger = setup_logger()
         self.max_workers = min(8, multiprocessing.cpu_count())
+        self.session = get_http_client()
+        self.feature_store = feature_store if feature_store is not None else get_feature_store()
+        # Models whose revision is already in the feature store are not re-fetched
+        self.incremental = Config().incremental
+        self.reused = 0
+        self._reused_lock = threading.Lock()
         
         # Initialize metric calculators
         self.license_metric = LicenseMetric()
@@ -39,15 +53,40 @@ class MetricsCalculator:
         self.dataset_code_metric = DatasetCodeMetric()
         self.dataset_quality_metric = DatasetQualityMetric()
         self.code_quality_metric = CodeQualityMetric()
-    
-    def calculate_all_metrics(self, model_info: ModelInfo) -> Dict[str, Any]:
-        """Calculate all metrics for a model in parallel"""
         
-        metrics = {}
-        metric_tasks = []
+        # Weights based on Sarah's priorities
+        # She cares about: documentation quality, responsiveness, dataset/code availability
+        self.net_score_weights = {
+            'license': 0.15,           # Legal compliance is important
+            'ramp_up_time': 0.20,      # Easy adoption is key priority  
+            'bus_factor': 0.10,        # Maintainer responsiveness
+            'performance_claims': 0.15, # Evidence of quality
+            'dataset_and_code_score': 0.20, # Key requirement
+            'dataset_quality': 0.10,   # Data quality matters
+            'code_quality': 0.10       # Code maintainability
+            # size_score not included in net score as it's hardware-specific
+        }
         
-        # Define all metric calculation tasks
-        tasks = [
+        # Extra named weightings, each reported as net_score_<profile>
+        profiles_path = Config().weight_profiles_path
+        self.weight_profiles = self.load_weight_profiles(profiles_path) if profiles_path else {}
+    
+    def load_weight_profiles(self, path: str) -> Dict[str, Dict[str, float]]:
+        """Load named weight profiles over the net score metrics from a file"""
+        return load_weight_profiles(path, self.net_score_weights)
+    
+    @property
+    def metrics(self) -> List[Any]:
+        """All metric objects, each with extract_features() and a pure score()"""
+        return [
+            self.license_metric, self.size_metric, self.rampup_metric, self.busfactor_metric,
+            self.performance_metric, self.dataset_code_metric, self.dataset_quality_metric,
+            self.code_quality_metric,
+        ]
+    
+    def _metric_tasks(self, model_info: ModelInfo) -> List[Tuple[str, Any, ModelInfo]]:
+        """All metric calculation tasks for a model"""
+        return [
             ('license', self.license_metric.calculate, model_info),
             ('size_score', self.size_metric.calculate, model_info),
             ('ramp_up_time', self.rampup_metric.calculate, model_info),
@@ -57,50 +96,211 @@ class MetricsCalculator:
             ('dataset_quality', self.dataset_quality_metric.calculate, model_info),
             ('code_quality', self.code_quality_metric.calculate, model_info),
         ]
+    
+    def calculate_all_metrics(self, model_info: ModelInfo) -> Dict[str, Any]:
+        """Calculate all metrics for a model in parallel"""
+        
+        stored = self._stored_record(model_info)
+        if stored is not None:
+            return stored
+        
+        metrics = {}
+        
+        # README and file tree are fetched once here and shared by all metrics
+        # Every run parses the whole README anyway, so skip partial reads
+        artifacts = ModelArtifacts(model_info, self.session, partial_readme=False,
+                                   feature_store=self.feature_store)
+        
+        # Define all metric calculation tasks
+        tasks = self._metric_tasks(model_info)
         
         # Execute metrics in parallel
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             future_to_metric = {
-                executor.submit(self._calculate_metric_with_timing, task[1], task[2]): task[0] 
+                executor.submit(self._calculate_metric_with_timing, task[1], task[2], artifacts): task[0]
                 for task in tasks
             }
             
             for future in as_completed(future_to_metric):
                 metric_name = future_to_metric[future]
                 try:
-                    result = future.result()
-                    if metric_name == 'size_score':
-                        # Special handling for size score which returns a dict
-                        metrics[metric_name] = result['value']
-                        metrics[f"{metric_name}_latency"] = result['latency_ms']
-                    else:
-                        metrics[metric_name] = result.value
-                        metrics[f"{metric_name}_latency"] = result.latency_ms
+                    self._record_metric(metrics, metric_name, future.result())
                 except Exception as e:
-                    self.logger.error(f"Failed to calculate {metric_name}: {str(e)}")
-                    # Provide default values on failure
-                    if metric_name == 'size_score':
-                        metrics[metric_name] = {
-                            "raspberry_pi": 0.0,
-                            "jetson_nano": 0.0,
-                            "desktop_pc": 0.5,
-                            "aws_server": 1.0
-                        }
-                    else:
-                        metrics[metric_name] = 0.0
-                    metrics[f"{metric_name}_latency"] = 1000  # 1 second default
+                    self._record_failure(metrics, metric_name, e)
+        
+        self._store_features(model_info, artifacts, metrics)
+        return self._build_result(model_info, metrics)
+    
+    async def calculate_all_metrics_async(self, model_info: ModelInfo,
+                                          executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """Coroutine version of calculate_all_metrics
+        
+        Each metric runs as an awaitable on the event loop's executor, so many
+        models can be evaluated concurrently from a single event loop.
+        """
+        stored = self._stored_record(model_info)
+        if stored is not None:
+            return stored
+        
+        loop = asyncio.get_event_loop()
+        metrics = {}
+        # Every run parses the whole README anyway, so skip partial reads
+        artifacts = ModelArtifacts(model_info, self.session, partial_readme=False,
+                                   feature_store=self.feature_store)
+        tasks = self._metric_tasks(model_info)
+        
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, self._calculate_metric_with_timing,
+                                 task[1], task[2], artifacts)
+            for task in tasks
+        ], return_exceptions=True)
         
+        for task, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                self._record_failure(metrics, task[0], result)
+            else:
+                self._record_metric(metrics, task[0], result)
+        
+        self._store_features(model_info, artifacts, metrics)
+        return self._build_result(model_info, metrics)
+    
+    @staticmethod
+    def revision(model_info: ModelInfo) -> str:
+        """Feature store key of everything a model's features depend on
+        
+        The model's commit sha, extended with the sha of each attached
+        dataset and the last push of each attached code repository. Empty
+        when the model's sha is unknown.
+        """
+        if not model_info.sha:
+            return ""
+        parts = [model_info.sha]
+        parts += [f"{dataset.name}@{dataset.api_data.get('sha', '')}" for dataset in model_info.datasets]
+        parts += [f"{code.name}@{code.pushed_at}" for code in model_info.code]
+        return "+".join(parts)
+    
+    def _stored_record(self, model_info: ModelInfo) -> Optional[Dict[str, Any]]:
+        """Record rebuilt from stored features when the model's revision is unchanged
+        
+        Returns None, so the model is evaluated normally, when incremental
+        runs are off, the revision is unknown, or a metric's features are
+        missing because its extraction failed last time.
+        """
+        revision = self.revision(model_info)
+        if self.feature_store is None or not self.incremental or not revision:
+            return None
+        try:
+            entry = self.feature_store.get(model_info.name, revision)
+            if entry is None or any(metric.name not in entry['features'] for metric in self.metrics):
+                return None
+            
+            self.logger.info(f"{model_info.name} is unchanged at {model_info.sha[:12]}, reusing stored features")
+            with self._reused_lock:
+                self.reused += 1
+            return self.score_features(model_info.name, entry['features'], entry['latencies'])
+        except Exception as e:
+            self.logger.error(f"Reading stored features for {model_info.name} failed: {str(e)}")
+            return None
+    
+    def _store_features(self, model_info: ModelInfo, artifacts: ModelArtifacts,
+                        metrics: Dict[str, Any]) -> None:
+        """Persist the extracted features so the model can be re-scored offline
+        
+        Nothing is stored when a fetch failed (other than with a 404): the
+        defaults those metrics fell back to would otherwise be reused for the
+        revision on every later run.
+        """
+        if self.feature_store is None:
+            return
+        if not artifacts.complete:
+            failed = ', '.join(sorted(set(artifacts.fetch_failures)))
+            self.logger.info(f"Not storing features of {model_info.name}: fetching {failed} failed")
+            return
+        try:
+            latencies = {
+                name[:-len('_latency')]: value for name, value in metrics.items()
+                if name.endswith('_latency')
+            }
+            self.feature_store.put(model_info.name, self.revision(model_info), artifacts.features, latencies)
+        except Exception as e:
+            self.logger.error(f"Storing features for {model_info.name} failed: {str(e)}")
+    
+    def score_features(self, name: str, features: Dict[str, Dict[str, Any]],
+                       latencies: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Build a result record from stored features without any network access
+        
+        Metrics whose features are missing get the usual failure defaults.
+        The reported latencies are those measured when the features were
+        extracted.
+        """
+        latencies = latencies or {}
+        metrics: Dict[str, Any] = {}
+        for metric in self.metrics:
+            try:
+                metrics[metric.name] = metric.score(features[metric.name])
+                metrics[f"{metric.name}_latency"] = latencies.get(metric.name, 0)
+            except Exception as e:
+                self._record_failure(metrics, metric.name, e)
+        
+        return self._build_result(ModelInfo(name=name, url="", api_data={}), metrics)
+    
+    def score_features_batch(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """score_features for many feature store entries at once, vectorised with NumPy"""
+        return BatchScorer(self).score(entries)
+    
+    def _record_metric(self, metrics: Dict[str, Any], metric_name: str, result) -> None:
+        """Store a timed metric result under its output field names"""
+        if metric_name == 'size_score':
+            # Special handling for size score which returns a dict
+            metrics[metric_name] = result['value']
+            metrics[f"{metric_name}_latency"] = result['latency_ms']
+        else:
+            metrics[metric_name] = result.value
+            metrics[f"{metric_name}_latency"] = result.latency_ms
+    
+    def _record_failure(self, metrics: Dict[str, Any], metric_name: str, error: Exception) -> None:
+        """Store default values for a metric that raised"""
+        self.logger.error(f"Failed to calculate {metric_name}: {str(error)}")
+        # Provide default values on failure
+        if metric_name == 'size_score':
+            metrics[metric_name] = {
+                "raspberry_pi": 0.0,
+                "jetson_nano": 0.0,
+                "desktop_pc": 0.5,
+                "aws_server": 1.0
+            }
+        else:
+            metrics[metric_name] = 0.0
+        metrics[f"{metric_name}_latency"] = 1000  # 1 second default
+    
+    def _build_result(self, model_info: ModelInfo, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the NDJSON output record from collected metric values"""
         # Calculate net score
         net_score_start = time.time()
         net_score = self._calculate_net_score(metrics)
         net_score_latency = max(1, int((time.time() - net_score_start) * 1000))
         
-        # Build final result
+        # Every profile reuses the metric values computed above
+        profile_scores = {
+            profile: self._calculate_net_score(metrics, weights)
+            for profile, weights in self.weight_profiles.items()
+        }
+        
+        return self._format_result(model_info.name, net_score, net_score_latency, metrics, profile_scores)
+    
+    def _format_result(self, name: str, net_score: float, net_score_latency: int,
+                       metrics: Dict[str, Any],
+                       profile_scores: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Lay out the NDJSON record, filling in defaults for missing metrics"""
         result = {
-            "name": model_info.name,
+            "name": name,
             "category": "MODEL",
             "net_score": net_score,
             "net_score_latency": net_score_latency,
+        }
+        for profile, score in (profile_scores or {}).items():
+            result[f"net_score_{profile}"] = score
+        result.update({
             "ramp_up_time": metrics.get("ramp_up_time", 0.0),
             "ramp_up_time_latency": metrics.get("ramp_up_time_latency", 1000),
             "bus_factor": metrics.get("bus_factor", 0.0),
@@ -122,15 +322,19 @@ class MetricsCalculator:
             "dataset_quality_latency": metrics.get("dataset_quality_latency", 1000),
             "code_quality": metrics.get("code_quality", 0.0),
             "code_quality_latency": metrics.get("code_quality_latency", 1000)
-        }
+        })
         
         return result
     
-    def _calculate_metric_with_timing(self, metric_func, model_info: ModelInfo):
+    def _calculate_metric_with_timing(self, metric_func, model_info: ModelInfo,
+                                      artifacts: Optional[ModelArtifacts] = None):
         """Calculate a metric and measure its execution time"""
         start_time = time.time()
         try:
-            result_value = metric_func(model_info)
+            if artifacts is not None:
+                result_value = metric_func(model_info, artifacts)
+            else:
+                result_value = metric_func(model_info)
             end_time = time.time()
             latency_ms = int((end_time - start_time) * 1000)
             
@@ -148,21 +352,11 @@ class MetricsCalculator:
             self.logger.error(f"Metric calculation failed: {str(e)}")
             return MetricResult(value=0.0, latency_ms=latency_ms)
     
-    def _calculate_net_score(self, metrics: Dict[str, Any]) -> float:
-        """Calculate weighted net score based on Sarah's priorities"""
-        
-        # Weights based on Sarah's priorities
-        # She cares about: documentation quality, responsiveness, dataset/code availability
-        weights = {
-            'license': 0.15,           # Legal compliance is important
-            'ramp_up_time': 0.20,      # Easy adoption is key priority  
-            'bus_factor': 0.10,        # Maintainer responsiveness
-            'performance_claims': 0.15, # Evidence of quality
-            'dataset_and_code_score': 0.20, # Key requirement
-            'dataset_quality': 0.10,   # Data quality matters
-            'code_quality': 0.10       # Code maintainability
-            # size_score not included in net score as it's hardware-specific
-        }
+    def _calculate_net_score(self, metrics: Dict[str, Any],
+                             weights: Optional[Dict[str, float]] = None) -> float:
+        """Calculate weighted net score based on Sarah's priorities, or the given weights"""
+        if weights is None:
+            weights = self.net_score_weights
         
         total_score = 0.0
         total_weight = 0.0
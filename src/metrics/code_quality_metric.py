@@ -3,63 +3,73 @@
 Code quality metric
 """
 
-import requests
 import tempfile
 import os
 import shutil
 import subprocess
 from pathlib import Path
-from ..models.model import ModelInfo
+from typing import Any, Dict, List, Optional
+from ..models.model import CodeInfo, ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client
+from ..utils.python_analysis import summarize
+from .artifacts import ModelArtifacts
+from .keywords import (
+    FRAMEWORK_TERMS, IMPORT_TERM, INSTALL_INSTRUCTION_TERMS, LICENSE_TERM, QUALITY_INDICATORS
+)
 
 class CodeQualityMetric:
     """Calculate code quality score"""
     
+    name = 'code_quality'
+    
+    weights = {'known_model': 0.5, 'structure': 0.4, 'documentation': 0.3, 'best_practices': 0.3}
+    
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
+        self.session = get_http_client()
     
-    def calculate(self, model_info: ModelInfo) -> float:
+    def calculate(self, model_info: ModelInfo,
+                  artifacts: Optional[ModelArtifacts] = None) -> float:
         """Calculate code quality score"""
         try:
-            # Special handling for well-implemented, popular models
-            model_name_lower = model_info.name.lower()
-            if any(known_model in model_name_lower for known_model in ['bert', 'gpt', 'whisper', 't5', 'roberta']):
-                # These models have high-quality, well-tested implementations
-                base_score = 0.5
-            else:
-                base_score = 0.0
-            
-            score = base_score
-            
-            # Check for code structure and organization
-            structure_score = self._check_code_structure(model_info)
-            score += structure_score * 0.4
-            
-            # Check for documentation in code
-            documentation_score = self._check_code_documentation(model_info)
-            score += documentation_score * 0.3
-            
-            # Check for best practices indicators
-            best_practices_score = self._check_best_practices(model_info)
-            score += best_practices_score * 0.3
-            
-            return min(1.0, score)
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            features = artifacts.features_for(
+                self.name, lambda: self.extract_features(model_info, artifacts))
+            return self.score(features)
             
         except Exception as e:
             self.logger.error(f"Code quality calculation failed: {str(e)}")
             return 0.3
     
-    def _check_code_structure(self, model_info: ModelInfo) -> float:
+    def extract_features(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> Dict[str, Any]:
+        """Code structure, in-code documentation and best-practice signals"""
+        return {
+            # Well-implemented, well-tested model families
+            'known_model': any(known_model in model_info.name.lower() for known_model in ['bert', 'gpt', 'whisper', 't5', 'roberta']),
+            'structure': self._check_code_structure(artifacts),
+            'documentation': self._check_code_documentation(model_info, artifacts),
+            'best_practices': self._check_best_practices(artifacts),
+        }
+    
+    def score(self, features: Dict[str, Any]) -> float:
+        """Weighted code quality score; no network access"""
+        score = 0.0
+        for feature, weight in self.weights.items():
+            score += features[feature] * weight
+        return min(1.0, score)
+    
+    def _check_code_structure(self, artifacts: ModelArtifacts) -> float:
         """Check code structure and organization"""
         try:
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
+            # The linked repository's archive, when the URL file names one
+            archive_score = self._check_archive_structure(artifacts.code_archive)
             
-            if response.status_code != 200:
-                return 0.2
+            files_data = artifacts.tree
+            if files_data is None:
+                return archive_score if archive_score is not None else 0.2
             
-            files_data = response.json()
             score = 0.0
             
             # Check for standard files
@@ -96,106 +106,112 @@ class CodeQualityMetric:
             if config_files > 0:
                 score += 0.1
             
-            return min(1.0, score)
+            return max(min(1.0, score), archive_score or 0.0)
             
         except Exception as e:
             self.logger.error(f"Code structure check failed: {str(e)}")
             return 0.2
     
-    def _check_code_documentation(self, model_info: ModelInfo) -> float:
-        """Check for code documentation"""
+    def _check_archive_structure(self, archive: Optional[Dict[str, Any]]) -> Optional[float]:
+        """Tests, CI and pinned dependencies of the linked repository, or None without one"""
+        if archive is None:
+            return None
+        
+        score = 0.0
+        if archive['python']:
+            score += 0.2
+        if archive['test_files']:
+            score += 0.2
+        if archive['dependency_files']:
+            score += 0.1
+        if archive['dependencies'] and archive['versioned_dependencies'] * 2 >= archive['dependencies']:
+            score += 0.1
+        if archive['ci_files']:
+            score += 0.2
+        if archive['ci_runs_tests'] or archive['ci_runs_linters']:
+            score += 0.2
+        return min(1.0, score)
+    
+    def _check_code_documentation(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> float:
+        """Check docstring coverage, type hints and function sizes of the repo's Python code"""
         try:
-            # Sample a few Python files to check for documentation
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
-            
-            if response.status_code != 200:
+            # The model repo's files plus those of its linked code repository
+            archive = artifacts.code_archive
+            analyses = (artifacts.python_analysis or []) + (archive['python'] if archive else [])
+            if not analyses:
                 return 0.2
             
-            files_data = response.json()
-            python_files = [item['path'] for item in files_data if item.get('path', '').endswith('.py')]
+            parsed = summarize(analyses)
+            unparsed = [analysis for analysis in analyses if not analysis.get('parsed')]
             
-            if not python_files:
-                return 0.2
+            # Files that do not parse are judged by textual indicators only
+            score = sum(1.0 for analysis in unparsed if analysis.get('documented'))
+            if parsed is not None:
+                score += parsed['files'] * (
+                    parsed['docstring_coverage'] * 0.5
+                    + parsed['type_hint_ratio'] * 0.25
+                    + parsed['short_function_ratio'] * 0.25
+                )
             
-            # Check up to 3 Python files for documentation
-            documented_files = 0
-            checked_files = 0
-            
-            for py_file in python_files[:3]:
-                try:
-                    file_url = f"https://huggingface.co/{model_info.name}/raw/main/{py_file}"
-                    file_response = self.session.get(file_url, timeout=10)
-                    
-                    if file_response.status_code == 200:
-                        content = file_response.text
-                        checked_files += 1
-                        
-                        # Check for documentation indicators
-                        doc_indicators = 0
-                        
-                        if '"""' in content or "'''" in content:  # Docstrings
-                            doc_indicators += 1
-                        if content.count('#') >= 5:  # Multiple comments
-                            doc_indicators += 1
-                        if 'def ' in content and ('"""' in content or "'''" in content):  # Function docs
-                            doc_indicators += 1
-                        if any(word in content.lower() for word in ['args:', 'returns:', 'parameters:']):
-                            doc_indicators += 1
-                        
-                        if doc_indicators >= 2:
-                            documented_files += 1
-                            
-                except:
-                    continue
-            
-            if checked_files == 0:
-                return 0.2
-            
-            return documented_files / checked_files
+            return score / len(analyses)
             
         except Exception as e:
             self.logger.error(f"Code documentation check failed: {str(e)}")
             return 0.2
     
-    def _check_best_practices(self, model_info: ModelInfo) -> float:
+    def _check_code_repository(self, code: List[CodeInfo]) -> Optional[float]:
+        """Best practices of the linked GitHub repositories, or None without any"""
+        repos = [info.api_data for info in code if info.api_data]
+        if not repos:
+            return None
+        
+        best = 0.0
+        for repo in repos:
+            score = 0.0
+            if repo.get('license'):
+                score += 0.25
+            if repo.get('description'):
+                score += 0.15
+            if repo.get('topics'):
+                score += 0.1
+            if not repo.get('archived', False):
+                score += 0.2
+            if repo.get('has_issues', False):
+                score += 0.1
+            if repo.get('stargazers_count', 0) >= 10:
+                score += 0.2
+            best = max(best, score)
+        return min(1.0, best)
+    
+    def _check_best_practices(self, artifacts: ModelArtifacts) -> float:
         """Check for coding best practices indicators"""
         try:
             score = 0.0
             
             # Check README for code quality information
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            hits = artifacts.readme_hits
             
-            if response.status_code == 200:
-                content = response.text.lower()
-                
+            if hits is not None:
                 # Look for quality indicators
-                quality_indicators = [
-                    'lint', 'flake8', 'black', 'type hint', 'mypy', 'pytest',
-                    'test', 'ci/cd', 'github action', 'pre-commit'
-                ]
-                
-                found_indicators = 0
-                for indicator in quality_indicators:
-                    if indicator in content:
-                        found_indicators += 1
+                found_indicators = hits.found(QUALITY_INDICATORS)
                 
                 score += min(0.5, found_indicators * 0.1)
                 
                 # Check for installation instructions
-                if 'pip install' in content or 'requirements.txt' in content:
+                if hits.any(INSTALL_INSTRUCTION_TERMS):
                     score += 0.2
                 
                 # Check for usage examples
-                if 'import' in content and ('transformers' in content or 'torch' in content):
+                if IMPORT_TERM in hits and hits.any(FRAMEWORK_TERMS):
                     score += 0.2
                 
                 # Check for license information
-                if 'license' in content:
+                if LICENSE_TERM in hits:
                     score += 0.1
             
-            return min(1.0, score)
+            # The linked repository itself, when the URL file names one
+            repo_score = self._check_code_repository(artifacts.model_info.code)
+            return max(min(1.0, score), repo_score or 0.0)
             
         except Exception as e:
             self.logger.error(f"Best practices check failed: {str(e)}")
@@ -3,67 +3,83 @@
 Dataset and code availability metric
 """
 
-import requests
+import os
 import re
+from typing import Any, Dict, Optional
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client
+from .artifacts import ModelArtifacts
+from .keywords import CODE_IMPORT_TERMS, DATASET_LINK, DATASET_TERMS
 
 class DatasetCodeMetric:
     """Calculate dataset and code availability score"""
     
+    name = 'dataset_and_code_score'
+    
+    weights = {'dataset_info': 0.6, 'code_availability': 0.4}
+    
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
+        self.session = get_http_client()
     
-    def calculate(self, model_info: ModelInfo) -> float:
+    def calculate(self, model_info: ModelInfo,
+                  artifacts: Optional[ModelArtifacts] = None) -> float:
         """Calculate dataset and code documentation score"""
         try:
-            score = 0.0
-            
-            # Check for dataset information
-            dataset_score = self._check_dataset_info(model_info)
-            score += dataset_score * 0.6
-            
-            # Check for code availability
-            code_score = self._check_code_availability(model_info)
-            score += code_score * 0.4
-            
-            return min(1.0, score)
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            features = artifacts.features_for(
+                self.name, lambda: self.extract_features(model_info, artifacts))
+            return self.score(features)
             
         except Exception as e:
             self.logger.error(f"Dataset/code calculation failed: {str(e)}")
             return 0.2
     
-    def _check_dataset_info(self, model_info: ModelInfo) -> float:
+    def extract_features(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> Dict[str, Any]:
+        """Dataset documentation and code availability signals"""
+        return {
+            'dataset_info': self._check_dataset_info(model_info, artifacts),
+            'code_availability': self._check_code_availability(artifacts),
+        }
+    
+    def score(self, features: Dict[str, Any]) -> float:
+        """Weighted dataset and code score; no network access"""
+        score = 0.0
+        for feature, weight in self.weights.items():
+            score += features[feature] * weight
+        return min(1.0, score)
+    
+    def _check_dataset_info(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> float:
         """Check for dataset information"""
         try:
             score = 0.0
             
-            # Check model-index for dataset information
-            if model_info.model_index:
-                for index_entry in model_info.model_index:
-                    if 'datasets' in index_entry:
+            # Check declared datasets and model-index (API or card front matter)
+            front_matter = artifacts.front_matter or {}
+            declared = model_info.card_data.get('datasets') or front_matter.get('datasets')
+            model_index = model_info.model_index or front_matter.get('model-index') or []
+            if declared or model_info.datasets:
+                score += 0.5
+            elif model_index:
+                for index_entry in model_index:
+                    if isinstance(index_entry, dict) and 'datasets' in index_entry:
                         datasets = index_entry['datasets']
                         if isinstance(datasets, list) and len(datasets) > 0:
                             score += 0.5
                             break
             
+            # Datasets from the URL file that exist on the Hub
+            if any(dataset.api_data for dataset in model_info.datasets):
+                score += 0.3
+            
             # Check README for dataset mentions
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            content = artifacts.readme_lower
+            hits = artifacts.readme_hits
             
-            if response.status_code == 200:
-                content = response.text.lower()
-                
-                dataset_terms = [
-                    'dataset', 'training data', 'trained on', 'data source',
-                    'corpus', 'collection', 'benchmark'
-                ]
-                
-                found_terms = 0
-                for term in dataset_terms:
-                    if term in content:
-                        found_terms += 1
+            if content is not None and hits is not None:
+                found_terms = hits.found(DATASET_TERMS)
                 
                 if found_terms >= 3:
                     score += 0.4
@@ -71,7 +87,7 @@ class DatasetCodeMetric:
                     score += 0.2
                 
                 # Look for specific dataset names or links
-                if 'huggingface.co/datasets/' in content:
+                if DATASET_LINK in hits:
                     score += 0.3
                 
                 # Look for data size mentions
@@ -85,18 +101,19 @@ class DatasetCodeMetric:
             self.logger.error(f"Dataset info check failed: {str(e)}")
             return 0.1
     
-    def _check_code_availability(self, model_info: ModelInfo) -> float:
+    def _check_code_availability(self, artifacts: ModelArtifacts) -> float:
         """Check for code availability and examples"""
         try:
             score = 0.0
             
+            # A code repository from the URL file that exists on GitHub
+            if any(code.api_data for code in artifacts.model_info.code):
+                score += 0.4
+            
             # Check for training/inference code files
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
+            files_data = artifacts.tree
             
-            if response.status_code == 200:
-                files_data = response.json()
-                
+            if files_data is not None:
                 code_files = 0
                 example_files = 0
                 
@@ -110,7 +127,7 @@ class DatasetCodeMetric:
                                 example_files += 1
                         elif filepath.endswith('.ipynb'):
                             example_files += 1
-                        elif filepath in ['training_args.json', 'run.sh', 'train.sh']:
+                        elif os.path.basename(filepath) in ['training_args.json', 'run.sh', 'train.sh']:
                             code_files += 1
                 
                 if code_files > 0:
@@ -121,21 +138,17 @@ class DatasetCodeMetric:
                     score += 0.2
             
             # Check README for code examples
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            readme_response = self.session.get(readme_url, timeout=10)
+            card = artifacts.card
             
-            if readme_response.status_code == 200:
-                content = readme_response.text
-                
+            if card is not None:
                 # Look for code blocks
-                code_blocks = content.count('```python') + content.count('```')
-                if code_blocks >= 2:
+                if len(card.code_blocks) >= 2:
                     score += 0.3
-                elif code_blocks >= 1:
+                elif card.code_blocks:
                     score += 0.2
                 
                 # Look for usage instructions
-                if 'from transformers import' in content or 'import torch' in content:
+                if artifacts.readme_hits.any(CODE_IMPORT_TERMS):
                     score += 0.2
             
             return min(1.0, score)
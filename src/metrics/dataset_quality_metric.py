@@ -3,64 +3,112 @@
 Dataset quality metric
 """
 
-import requests
 import re
-from ..models.model import ModelInfo
+from typing import Any, Dict, List, Optional
+from ..models.model import DatasetInfo, ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client
+from .artifacts import ModelArtifacts
+from .keywords import (
+    COMPOSITION_TERMS, CURATION_TERMS, DATASET_QUALITY_TERMS, PREPROCESSING_TERMS,
+    PREPROCESSING_TOOLS, QUALITY_DATASETS
+)
+
+# Dataset card metadata fields that document how a dataset was built
+DATASET_CARD_FIELDS = [
+    'license', 'task_categories', 'size_categories', 'source_datasets',
+    'annotations_creators', 'language_creators', 'language', 'pretty_name'
+]
 
 class DatasetQualityMetric:
     """Calculate dataset quality score"""
     
+    name = 'dataset_quality'
+    
+    weights = {'documentation': 0.4, 'preprocessing': 0.3, 'known_datasets': 0.3}
+    
+    # Parts of the cleanliness of a profiled data sample; unknown parts are left out
+    sample_weights = {'completeness': 0.3, 'uniqueness': 0.3, 'non_empty_text': 0.2, 'label_balance': 0.2}
+    
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
+        self.session = get_http_client()
     
-    def calculate(self, model_info: ModelInfo) -> float:
+    def calculate(self, model_info: ModelInfo,
+                  artifacts: Optional[ModelArtifacts] = None) -> float:
         """Calculate dataset quality score"""
         try:
-            score = 0.0
-            
-            # Check for dataset documentation
-            documentation_score = self._check_dataset_documentation(model_info)
-            score += documentation_score * 0.4
-            
-            # Check for data preprocessing information
-            preprocessing_score = self._check_preprocessing_info(model_info)
-            score += preprocessing_score * 0.3
-            
-            # Check for known high-quality datasets
-            quality_datasets_score = self._check_known_datasets(model_info)
-            score += quality_datasets_score * 0.3
-            
-            return min(1.0, score)
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            features = artifacts.features_for(
+                self.name, lambda: self.extract_features(model_info, artifacts))
+            return self.score(features)
             
         except Exception as e:
             self.logger.error(f"Dataset quality calculation failed: {str(e)}")
             return 0.3
     
-    def _check_dataset_documentation(self, model_info: ModelInfo) -> float:
+    def extract_features(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> Dict[str, Any]:
+        """Dataset documentation, preprocessing and provenance signals"""
+        return {
+            'documentation': self._check_dataset_documentation(artifacts),
+            'preprocessing': self._check_preprocessing_info(artifacts),
+            'known_datasets': self._check_known_datasets(artifacts),
+            'sample_profile': self._summarize_profiles(model_info.datasets),
+        }
+    
+    def score(self, features: Dict[str, Any]) -> float:
+        """Weighted dataset quality score; no network access"""
+        # Clean sampled data is evidence of preprocessing, whatever the README says
+        values = dict(features, preprocessing=max(features['preprocessing'],
+                                                  self.sample_quality(features.get('sample_profile'))))
+        score = 0.0
+        for feature, weight in self.weights.items():
+            score += values[feature] * weight
+        return min(1.0, score)
+    
+    def sample_quality(self, profile: Optional[Dict[str, Any]]) -> float:
+        """Cleanliness of the profiled parquet samples, 0.0 without a profile"""
+        if not profile:
+            return 0.0
+        parts = {
+            'completeness': 1.0 - profile['null_rate'],
+            'uniqueness': None if profile.get('duplicate_rate') is None else 1.0 - profile['duplicate_rate'],
+            'non_empty_text': None if profile.get('empty_text_rate') is None else 1.0 - profile['empty_text_rate'],
+            'label_balance': profile.get('label_balance'),
+        }
+        known = {part: value for part, value in parts.items() if value is not None}
+        total = sum(self.sample_weights[part] for part in known)
+        return sum(value * self.sample_weights[part] for part, value in known.items()) / total
+    
+    def _summarize_profiles(self, datasets: List[DatasetInfo]) -> Optional[Dict[str, Any]]:
+        """Mean sample statistics over the model's profiled datasets"""
+        profiles = [dataset.profile for dataset in datasets
+                    if dataset.profile and dataset.profile.get('null_rate') is not None]
+        if not profiles:
+            return None
+        
+        summary = {}
+        for stat in ('null_rate', 'duplicate_rate', 'empty_text_rate', 'label_balance'):
+            values = [profile[stat] for profile in profiles if profile.get(stat) is not None]
+            summary[stat] = sum(values) / len(values) if values else None
+        return summary
+    
+    def _check_dataset_documentation(self, artifacts: ModelArtifacts) -> float:
         """Check quality of dataset documentation"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
+            # The real dataset cards, when the URL file names the datasets
+            card_score = self._check_dataset_cards(artifacts.model_info.datasets)
             
-            if response.status_code != 200:
-                return 0.1
+            content = artifacts.readme_lower
+            hits = artifacts.readme_hits
+            if content is None or hits is None:
+                return card_score if card_score is not None else 0.1
             
-            content = response.text.lower()
             score = 0.0
             
             # Look for detailed dataset information
-            dataset_quality_terms = [
-                'data source', 'data collection', 'data cleaning', 'preprocessing',
-                'filtering', 'deduplication', 'quality control', 'curation',
-                'annotation', 'labeling', 'validation'
-            ]
-            
-            found_terms = 0
-            for term in dataset_quality_terms:
-                if term in content:
-                    found_terms += 1
+            found_terms = hits.found(DATASET_QUALITY_TERMS)
             
             score += min(0.6, found_terms * 0.1)
             
@@ -69,41 +117,49 @@ class DatasetQualityMetric:
                 score += 0.2
             
             # Check for data composition details
-            if any(term in content for term in ['composition', 'distribution', 'breakdown', 'statistics']):
+            if hits.any(COMPOSITION_TERMS):
                 score += 0.2
             
-            return min(1.0, score)
+            return max(min(1.0, score), card_score or 0.0)
             
         except Exception as e:
             self.logger.error(f"Dataset documentation check failed: {str(e)}")
             return 0.1
     
-    def _check_preprocessing_info(self, model_info: ModelInfo) -> float:
+    def _check_dataset_cards(self, datasets: List[DatasetInfo]) -> Optional[float]:
+        """Average share of documented card fields over the model's datasets"""
+        cards = [dataset for dataset in datasets if dataset.api_data]
+        if not cards:
+            return None
+        
+        scores = []
+        for dataset in cards:
+            card_data = dataset.api_data.get('cardData') or {}
+            documented = sum(1 for field in DATASET_CARD_FIELDS if card_data.get(field))
+            score = documented / len(DATASET_CARD_FIELDS)
+            if dataset.api_data.get('description'):
+                score += 0.2
+            # Converted to parquet by the datasets-server, with a known row count
+            if dataset.num_rows > 0:
+                score += 0.2
+            scores.append(min(1.0, score))
+        return sum(scores) / len(scores)
+    
+    def _check_preprocessing_info(self, artifacts: ModelArtifacts) -> float:
         """Check for data preprocessing information"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
-            
-            if response.status_code != 200:
+            hits = artifacts.readme_hits
+            if hits is None:
                 return 0.2
             
-            content = response.text.lower()
             score = 0.0
             
-            preprocessing_terms = [
-                'tokenization', 'normalization', 'cleaning', 'filtering',
-                'preprocessing', 'preparation', 'augmentation', 'transformation'
-            ]
-            
-            found_terms = 0
-            for term in preprocessing_terms:
-                if term in content:
-                    found_terms += 1
+            found_terms = hits.found(PREPROCESSING_TERMS)
             
             score += min(0.8, found_terms * 0.15)
             
             # Check for specific preprocessing tools/methods
-            if any(tool in content for tool in ['spacy', 'nltk', 'tokenizer', 'bpe', 'sentencepiece']):
+            if hits.any(PREPROCESSING_TOOLS):
                 score += 0.2
             
             return min(1.0, score)
@@ -112,42 +168,27 @@ class DatasetQualityMetric:
             self.logger.error(f"Preprocessing info check failed: {str(e)}")
             return 0.2
     
-    def _check_known_datasets(self, model_info: ModelInfo) -> float:
+    def _check_known_datasets(self, artifacts: ModelArtifacts) -> float:
         """Check if trained on known high-quality datasets"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
-            
-            if response.status_code != 200:
-                return 0.3
+            # Datasets the URL file names for this model
+            max_score = 0.0
+            for dataset in artifacts.model_info.datasets:
+                dataset_name = dataset.name.lower().split('/')[-1]
+                max_score = max(max_score, QUALITY_DATASETS.get(dataset_name, 0.0))
             
-            content = response.text.lower()
+            hits = artifacts.readme_hits
+            if hits is None:
+                return max_score or 0.3
             
             # Known high-quality datasets
-            quality_datasets = {
-                'common crawl': 0.7,
-                'c4': 0.8,
-                'pile': 0.8,
-                'openwebtext': 0.7,
-                'wikipedia': 0.9,
-                'books3': 0.6,
-                'arxiv': 0.8,
-                'pubmed': 0.8,
-                'github': 0.7,
-                'stackexchange': 0.7,
-                'refinedweb': 0.8,
-                'dolma': 0.8,
-                'redpajama': 0.7
-            }
-            
-            max_score = 0.0
-            for dataset, score in quality_datasets.items():
-                if dataset in content:
+            for dataset, score in QUALITY_DATASETS.items():
+                if dataset in hits:
                     max_score = max(max_score, score)
             
             if max_score == 0.0:
                 # Check for general indicators of quality
-                if any(term in content for term in ['curated', 'filtered', 'high-quality', 'clean']):
+                if hits.any(CURATION_TERMS):
                     max_score = 0.5
                 else:
                     max_score = 0.3  # Default moderate score
@@ -0,0 +1,77 @@
+# src/metrics/keywords.py
+"""
+Keyword tables used by the README analyses of every metric
+"""
+
+from ..utils.keyword_matcher import KeywordMatcher
+
+# RampUpMetric
+USAGE_TERMS = ['usage', 'how to use']
+EXAMPLE_TERMS = ['example', 'code']
+INSTALL_TERMS = ['install', 'pip install']
+TRAINING_TERMS = ['dataset', 'training']
+
+# PerformanceMetric
+BENCHMARK_TERMS = [
+    'benchmark', 'evaluation', 'eval', 'performance', 'accuracy',
+    'bleu', 'rouge', 'bert-score', 'glue', 'superglue', 'hellaswag',
+    'mmlu', 'truthfulqa', 'arc', 'winogrande', 'gsm8k'
+]
+
+# DatasetCodeMetric
+DATASET_TERMS = [
+    'dataset', 'training data', 'trained on', 'data source',
+    'corpus', 'collection', 'benchmark'
+]
+DATASET_LINK = 'huggingface.co/datasets/'
+CODE_IMPORT_TERMS = ['from transformers import', 'import torch']
+
+# DatasetQualityMetric
+DATASET_QUALITY_TERMS = [
+    'data source', 'data collection', 'data cleaning', 'preprocessing',
+    'filtering', 'deduplication', 'quality control', 'curation',
+    'annotation', 'labeling', 'validation'
+]
+COMPOSITION_TERMS = ['composition', 'distribution', 'breakdown', 'statistics']
+PREPROCESSING_TERMS = [
+    'tokenization', 'normalization', 'cleaning', 'filtering',
+    'preprocessing', 'preparation', 'augmentation', 'transformation'
+]
+PREPROCESSING_TOOLS = ['spacy', 'nltk', 'tokenizer', 'bpe', 'sentencepiece']
+QUALITY_DATASETS = {
+    'common crawl': 0.7,
+    'c4': 0.8,
+    'pile': 0.8,
+    'openwebtext': 0.7,
+    'wikipedia': 0.9,
+    'books3': 0.6,
+    'arxiv': 0.8,
+    'pubmed': 0.8,
+    'github': 0.7,
+    'stackexchange': 0.7,
+    'refinedweb': 0.8,
+    'dolma': 0.8,
+    'redpajama': 0.7
+}
+CURATION_TERMS = ['curated', 'filtered', 'high-quality', 'clean']
+
+# CodeQualityMetric
+QUALITY_INDICATORS = [
+    'lint', 'flake8', 'black', 'type hint', 'mypy', 'pytest',
+    'test', 'ci/cd', 'github action', 'pre-commit'
+]
+INSTALL_INSTRUCTION_TERMS = ['pip install', 'requirements.txt']
+FRAMEWORK_TERMS = ['transformers', 'torch']
+IMPORT_TERM = 'import'
+
+LICENSE_TERM = 'license'
+
+# Compiled once; ModelArtifacts scans each lowercased README with it
+README_MATCHER = KeywordMatcher(
+    USAGE_TERMS + EXAMPLE_TERMS + INSTALL_TERMS + TRAINING_TERMS
+    + BENCHMARK_TERMS + DATASET_TERMS + [DATASET_LINK] + CODE_IMPORT_TERMS
+    + DATASET_QUALITY_TERMS + COMPOSITION_TERMS + PREPROCESSING_TERMS
+    + PREPROCESSING_TOOLS + list(QUALITY_DATASETS) + CURATION_TERMS
+    + QUALITY_INDICATORS + INSTALL_INSTRUCTION_TERMS + FRAMEWORK_TERMS
+    + [IMPORT_TERM, LICENSE_TERM]
+)
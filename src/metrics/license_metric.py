@@ -5,17 +5,20 @@ License metric calculation
 """
 
 import re
-import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client
+from .artifacts import ModelArtifacts
 
 class LicenseMetric:
     """Calculate license score"""
     
+    name = 'license'
+    
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
+        self.session = get_http_client()
         
         # License compatibility with LGPLv2.1
         self.license_scores = {
@@ -33,64 +36,86 @@ class LicenseMetric:
             'other': 0.1
         }
     
-    def calculate(self, model_info: ModelInfo) -> float:
+    def calculate(self, model_info: ModelInfo,
+                  artifacts: Optional[ModelArtifacts] = None) -> float:
         """Calculate license compatibility score"""
         try:
-            # Try to get license from API data first
-            license_info = None
-            if 'license' in model_info.api_data:
-                license_info = model_info.api_data['license']
-            
-            if not license_info:
-                # Fallback: fetch README and parse license
-                license_info = self._parse_license_from_readme(model_info)
-            
-            if not license_info:
-                return 0.1  # Unknown license
-            
-            # Normalize license string
-            license_key = str(license_info).lower().strip()
-            
-            # Check against known licenses
-            for known_license, score in self.license_scores.items():
-                if known_license in license_key:
-                    return score
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            features = artifacts.features_for(
+                self.name, lambda: self.extract_features(model_info, artifacts))
+            return self.score(features)
             
-            # Check for permissive patterns
-            if any(word in license_key for word in ['apache', 'mit', 'bsd']):
-                return 0.9
-            elif any(word in license_key for word in ['cc', 'creative']):
-                return 0.7
-            elif 'lgpl' in license_key:
-                return 0.9
-            elif 'gpl' in license_key:
-                return 0.3
-            else:
-                return 0.1
-                
         except Exception as e:
             self.logger.error(f"License calculation failed: {str(e)}")
             return 0.1
     
-    def _parse_license_from_readme(self, model_info: ModelInfo) -> str:
+    def extract_features(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> Dict[str, Any]:
+        """License identifier from the API, card metadata or README"""
+        # Try to get license from API data first
+        license_info = None
+        if 'license' in model_info.api_data:
+            license_info = model_info.api_data['license']
+        
+        if not license_info:
+            # Card metadata hydrated with the model info
+            license_info = self._license_from_metadata(model_info.card_data)
+        
+        if not license_info:
+            # Fallback: fetch README and parse license
+            license_info = self._parse_license_from_readme(artifacts)
+        
+        return {'license': str(license_info) if license_info else None}
+    
+    def score(self, features: Dict[str, Any]) -> float:
+        """Score a license identifier; no network access"""
+        license_info = features.get('license')
+        if not license_info:
+            return 0.1  # Unknown license
+        
+        # Normalize license string
+        license_key = str(license_info).lower().strip()
+        
+        # Check against known licenses
+        for known_license, score in self.license_scores.items():
+            if known_license in license_key:
+                return score
+        
+        # Check for permissive patterns
+        if any(word in license_key for word in ['apache', 'mit', 'bsd']):
+            return 0.9
+        elif any(word in license_key for word in ['cc', 'creative']):
+            return 0.7
+        elif 'lgpl' in license_key:
+            return 0.9
+        elif 'gpl' in license_key:
+            return 0.3
+        else:
+            return 0.1
+    
+    def _parse_license_from_readme(self, artifacts: ModelArtifacts) -> Optional[str]:
         """Parse license from README file"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
-            
-            if response.status_code != 200:
+            # Front matter license tag, usually from a small partial download
+            front_matter = artifacts.front_matter
+            if front_matter is None:
                 return None
+            license_info = self._license_from_metadata(front_matter)
+            if license_info:
+                return license_info
             
-            content = response.text
+            card = artifacts.card
+            if card is None:
+                return None
             
             # Look for license section
-            license_match = re.search(r'#+\s*License\s*\n(.*?)(?=\n#|\n\n|\Z)', content, re.IGNORECASE | re.DOTALL)
-            if license_match:
-                return license_match.group(1).strip()
+            section = card.section('license')
+            if section is not None and section.first_paragraph:
+                return section.first_paragraph
             
             # Look for license mentions
             license_pattern = r'license[:\s]+([^\n]+)'
-            match = re.search(license_pattern, content, re.IGNORECASE)
+            match = re.search(license_pattern, card.prose, re.IGNORECASE)
             if match:
                 return match.group(1).strip()
             
@@ -99,3 +124,14 @@ class LicenseMetric:
         except Exception as e:
             self.logger.error(f"README parsing failed: {str(e)}")
             return None
+    
+    def _license_from_metadata(self, metadata: Dict[str, Any]) -> Optional[str]:
+        """License from card metadata, preferring license_name for 'other'"""
+        if not metadata or not metadata.get('license'):
+            return None
+        license_info = metadata['license']
+        if isinstance(license_info, list):
+            license_info = license_info[0] if license_info else None
+        if license_info == 'other' and metadata.get('license_name'):
+            return str(metadata['license_name'])
+        return str(license_info) if license_info else None
@@ -4,56 +4,70 @@ Performance claims metric - evidence of benchmarks and evaluations
 """
 
 import re
-import requests
+from typing import Any, Dict, Optional
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client
+from .artifacts import ModelArtifacts
+from .keywords import BENCHMARK_TERMS
 
 class PerformanceMetric:
     """Calculate performance claims score"""
     
+    name = 'performance_claims'
+    
+    weights = {'known_model': 0.4, 'model_index': 0.5, 'readme': 0.3, 'tags': 0.2}
+    
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
+        self.session = get_http_client()
     
-    def calculate(self, model_info: ModelInfo) -> float:
+    def calculate(self, model_info: ModelInfo,
+                  artifacts: Optional[ModelArtifacts] = None) -> float:
         """Calculate evidence of performance claims score"""
         try:
-            # Special handling for well-known models with extensive benchmarks
-            model_name_lower = model_info.name.lower()
-            if any(known_model in model_name_lower for known_model in ['bert', 'gpt', 'whisper', 't5', 'roberta']):
-                # These models have extensive performance documentation
-                base_score = 0.4
-            else:
-                base_score = 0.0
-            
-            score = base_score
-            
-            # Check model-index for structured performance data
-            model_index_score = self._analyze_model_index(model_info)
-            score += model_index_score * 0.5
-            
-            # Check README for benchmark mentions
-            readme_score = self._analyze_readme_benchmarks(model_info)
-            score += readme_score * 0.3
-            
-            # Check tags for evaluation-related info
-            tags_score = self._analyze_tags(model_info)
-            score += tags_score * 0.2
-            
-            return min(1.0, score)
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            features = artifacts.features_for(
+                self.name, lambda: self.extract_features(model_info, artifacts))
+            return self.score(features)
             
         except Exception as e:
             self.logger.error(f"Performance claims calculation failed: {str(e)}")
             return 0.2  # Default low score
     
-    def _analyze_model_index(self, model_info: ModelInfo) -> float:
+    def extract_features(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> Dict[str, Any]:
+        """Structured results, README benchmark mentions and evaluation tags"""
+        return {
+            # Model families with extensive benchmark documentation
+            'known_model': any(known_model in model_info.name.lower() for known_model in ['bert', 'gpt', 'whisper', 't5', 'roberta']),
+            'model_index': self._analyze_model_index(model_info, artifacts),
+            'readme': self._analyze_readme_benchmarks(artifacts),
+            'tags': self._analyze_tags(model_info),
+        }
+    
+    def score(self, features: Dict[str, Any]) -> float:
+        """Weighted performance claims score; no network access"""
+        score = 0.0
+        for feature, weight in self.weights.items():
+            score += features[feature] * weight
+        return min(1.0, score)
+    
+    def _analyze_model_index(self, model_info: ModelInfo,
+                             artifacts: Optional[ModelArtifacts] = None) -> float:
         """Analyze model-index for structured performance data"""
         try:
-            if not model_info.model_index or len(model_info.model_index) == 0:
+            model_index = model_info.model_index
+            if not model_index and artifacts is not None:
+                # Not in the API payload; the card front matter may carry it
+                model_index = (artifacts.front_matter or {}).get('model-index')
+            if not model_index or len(model_index) == 0:
                 return 0.0
             
             score = 0.0
-            for index_entry in model_info.model_index:
+            for index_entry in model_index:
+                if not isinstance(index_entry, dict):
+                    continue
                 if 'results' in index_entry:
                     results = index_entry['results']
                     if isinstance(results, list) and len(results) > 0:
@@ -73,29 +87,18 @@ class PerformanceMetric:
             self.logger.error(f"Model index analysis failed: {str(e)}")
             return 0.0
     
-    def _analyze_readme_benchmarks(self, model_info: ModelInfo) -> float:
+    def _analyze_readme_benchmarks(self, artifacts: ModelArtifacts) -> float:
         """Analyze README for benchmark mentions"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
-            
-            if response.status_code != 200:
+            content = artifacts.readme_lower
+            hits = artifacts.readme_hits
+            if content is None or hits is None:
                 return 0.0
             
-            content = response.text.lower()
             score = 0.0
             
             # Common benchmark/evaluation terms
-            benchmark_terms = [
-                'benchmark', 'evaluation', 'eval', 'performance', 'accuracy', 
-                'bleu', 'rouge', 'bert-score', 'glue', 'superglue', 'hellaswag',
-                'mmlu', 'truthfulqa', 'arc', 'winogrande', 'gsm8k'
-            ]
-            
-            found_terms = 0
-            for term in benchmark_terms:
-                if term in content:
-                    found_terms += 1
+            found_terms = hits.found(BENCHMARK_TERMS)
             
             if found_terms >= 5:
                 score += 0.8
@@ -4,74 +4,86 @@ Ramp-up time metric - how easy it is to get started with the model
 """
 
 import re
-import requests
+from typing import Any, Dict, Optional
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client
+from .artifacts import ModelArtifacts
+from .keywords import EXAMPLE_TERMS, INSTALL_TERMS, LICENSE_TERM, TRAINING_TERMS, USAGE_TERMS
 
 class RampUpMetric:
     """Calculate ramp-up time score"""
     
+    name = 'ramp_up_time'
+    
+    # Feature weights of score(); known_model is a bool
+    weights = {
+        'known_model': 0.7,  # These models have excellent documentation and examples
+        'readme': 0.4,
+        'examples': 0.3,
+        'model_card': 0.2,
+        'popularity': 0.1,   # Downloads/likes as proxy for community support
+    }
+    
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
+        self.session = get_http_client()
     
-    def calculate(self, model_info: ModelInfo) -> float:
+    def calculate(self, model_info: ModelInfo,
+                  artifacts: Optional[ModelArtifacts] = None) -> float:
         """Calculate how easy it is to get started with the model"""
         try:
-            # Special handling for well-documented, popular models
-            model_name_lower = model_info.name.lower()
-            if any(known_model in model_name_lower for known_model in ['bert', 'gpt', 'whisper', 't5', 'roberta']):
-                # These models have excellent documentation and examples
-                base_score = 0.7
-            else:
-                base_score = 0.0
-            
-            score = base_score
-            
-            # Check documentation quality
-            readme_score = self._analyze_readme(model_info)
-            score += readme_score * 0.4
-            
-            # Check example code availability
-            examples_score = self._check_examples(model_info)
-            score += examples_score * 0.3
-            
-            # Check model card completeness
-            card_score = self._analyze_model_card(model_info)
-            score += card_score * 0.2
-            
-            # Check popularity (downloads/likes as proxy for community support)
-            popularity_score = self._calculate_popularity_score(model_info)
-            score += popularity_score * 0.1
-            
-            return min(1.0, score)
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            features = artifacts.features_for(
+                self.name, lambda: self.extract_features(model_info, artifacts))
+            return self.score(features)
             
         except Exception as e:
             self.logger.error(f"Ramp-up calculation failed: {str(e)}")
             return 0.3  # Default moderate score
     
-    def _analyze_readme(self, model_info: ModelInfo) -> float:
+    def extract_features(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> Dict[str, Any]:
+        """Documentation, example and popularity signals"""
+        return {
+            # Well-documented, popular model families
+            'known_model': any(known_model in model_info.name.lower() for known_model in ['bert', 'gpt', 'whisper', 't5', 'roberta']),
+            'readme': self._analyze_readme(artifacts),
+            'examples': self._check_examples(artifacts),
+            'model_card': self._analyze_model_card(model_info),
+            'popularity': self._calculate_popularity_score(model_info),
+        }
+    
+    def score(self, features: Dict[str, Any]) -> float:
+        """Weighted ramp-up score; no network access"""
+        score = 0.0
+        for feature, weight in self.weights.items():
+            score += features[feature] * weight
+        return min(1.0, score)
+    
+    def _analyze_readme(self, artifacts: ModelArtifacts) -> float:
         """Analyze README quality"""
         try:
-            readme_url = f"https://huggingface.co/{model_info.name}/raw/main/README.md"
-            response = self.session.get(readme_url, timeout=10)
-            
-            if response.status_code != 200:
+            content = artifacts.readme_lower
+            hits = artifacts.readme_hits
+            card = artifacts.card
+            if content is None or hits is None or card is None:
                 return 0.1
             
-            content = response.text.lower()
             score = 0.0
             
-            # Check for key sections
-            if 'usage' in content or 'how to use' in content:
+            # Check for key sections; a passing mention is worth less
+            if card.find_sections(USAGE_TERMS):
                 score += 0.3
-            if 'example' in content or 'code' in content:
+            elif hits.any(USAGE_TERMS):
+                score += 0.15
+            if card.code_blocks or hits.any(EXAMPLE_TERMS):
                 score += 0.2
-            if 'install' in content or 'pip install' in content:
+            if card.find_sections(INSTALL_TERMS) or hits.any(INSTALL_TERMS):
                 score += 0.2
-            if 'license' in content:
+            if LICENSE_TERM in hits:
                 score += 0.1
-            if 'dataset' in content or 'training' in content:
+            if hits.any(TRAINING_TERMS):
                 score += 0.1
             if len(content) > 500:  # Substantial documentation
                 score += 0.1
@@ -82,17 +94,14 @@ class RampUpMetric:
             self.logger.error(f"README analysis failed: {str(e)}")
             return 0.1
     
-    def _check_examples(self, model_info: ModelInfo) -> float:
+    def _check_examples(self, artifacts: ModelArtifacts) -> float:
         """Check for example code availability"""
         try:
             # Check if there are example files in the repo
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
-            
-            if response.status_code != 200:
+            files_data = artifacts.tree
+            if files_data is None:
                 return 0.2
             
-            files_data = response.json()
             example_files = 0
             
             for item in files_data:
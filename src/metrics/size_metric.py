@@ -4,18 +4,22 @@
 Size metric calculation for different hardware platforms
 """
 
-import requests
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from ..models.model import ModelInfo
 from ..utils.logger import setup_logger
+from ..utils.http_client import get_http_client
+from ..utils.safetensors import parameter_bytes
+from .artifacts import ModelArtifacts
 
 class SizeMetric:
     """Calculate size compatibility score for different hardware"""
     
+    name = 'size_score'
+    
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
+        self.session = get_http_client()
         
         # Hardware constraints (in GB)
         self.hardware_limits = {
@@ -24,41 +28,89 @@ class SizeMetric:
             'desktop_pc': 16.0,     # 16GB RAM typical
             'aws_server': 64.0      # Large instance
         }
+        
+        # Bytes per parameter when the weights are loaded at each precision
+        self.precision_bytes = {
+            'fp16': 2.0,
+            'int8': 1.0,
+            'int4': 0.5
+        }
     
-    def calculate(self, model_info: ModelInfo) -> Dict[str, float]:
+    def calculate(self, model_info: ModelInfo,
+                  artifacts: Optional[ModelArtifacts] = None) -> Dict[str, float]:
         """Calculate size scores for different hardware platforms"""
         try:
-            model_size_gb = self._estimate_model_size(model_info)
-            
-            scores = {}
-            for hardware, limit in self.hardware_limits.items():
-                if model_size_gb <= limit * 0.5:  # Comfortably fits
-                    scores[hardware] = 1.0
-                elif model_size_gb <= limit * 0.8:  # Fits with some room
-                    scores[hardware] = 0.8
-                elif model_size_gb <= limit:  # Just fits
-                    scores[hardware] = 0.6
-                elif model_size_gb <= limit * 1.5:  # Might work with optimizations
-                    scores[hardware] = 0.3
-                else:  # Too large
-                    scores[hardware] = 0.0
-            
-            return scores
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            features = artifacts.features_for(
+                self.name, lambda: self.extract_features(model_info, artifacts))
+            return self.score(features)
             
         except Exception as e:
             self.logger.error(f"Size calculation failed: {str(e)}")
             return {hw: 0.5 for hw in self.hardware_limits.keys()}
     
-    def _estimate_model_size(self, model_info: ModelInfo) -> float:
+    def extract_features(self, model_info: ModelInfo, artifacts: ModelArtifacts) -> Dict[str, Any]:
+        """Model size and, when known, exact parameter counts per dtype"""
+        return {
+            'size_gb': self._estimate_model_size(model_info, artifacts),
+            'parameter_counts': artifacts.parameter_counts,
+        }
+    
+    def score(self, features: Dict[str, Any]) -> Dict[str, float]:
+        """Per-hardware size scores; no network access"""
+        model_size_gb = features['size_gb']
+        footprints = self.project_memory(features.get('parameter_counts'))
+        
+        scores = {}
+        for hardware, limit in self.hardware_limits.items():
+            if model_size_gb <= limit * 0.5:  # Comfortably fits
+                scores[hardware] = 1.0
+            elif model_size_gb <= limit * 0.8:  # Fits with some room
+                scores[hardware] = 0.8
+            elif model_size_gb <= limit:  # Just fits
+                scores[hardware] = 0.6
+            elif footprints is not None:
+                # Exact counts known: only a quantized build that fits counts
+                fits_quantized = any(size_gb <= limit for size_gb in footprints.values())
+                scores[hardware] = 0.3 if fits_quantized else 0.0
+            elif model_size_gb <= limit * 1.5:  # Might work with optimizations
+                scores[hardware] = 0.3
+            else:  # Too large
+                scores[hardware] = 0.0
+        
+        return scores
+    
+    def project_memory(self, parameter_counts: Optional[Dict[str, int]]) -> Optional[Dict[str, float]]:
+        """Memory footprint of the weights in GB when loaded at fp16/int8/int4
+        
+        Compare against hardware_limits to see which precisions fit where.
+        """
+        if not parameter_counts:
+            return None
+        total_params = sum(parameter_counts.values())
+        return {
+            precision: total_params * size / (1024 ** 3)
+            for precision, size in self.precision_bytes.items()
+        }
+    
+    def _estimate_model_size(self, model_info: ModelInfo,
+                             artifacts: Optional[ModelArtifacts] = None) -> float:
         """Estimate model size in GB"""
         try:
-            # Try to get size from model files
-            files_url = f"https://huggingface.co/api/models/{model_info.name}/tree/main"
-            response = self.session.get(files_url, timeout=10)
+            if artifacts is None:
+                artifacts = ModelArtifacts(model_info, self.session)
+            
+            # Exact size of the weights from the safetensors headers
+            parameter_counts = artifacts.parameter_counts
+            if parameter_counts:
+                return parameter_bytes(parameter_counts) / (1024 ** 3)
+            
+            # Otherwise sum the sizes of the model files
+            files_data = artifacts.tree
             
             total_size = 0
-            if response.status_code == 200:
-                files_data = response.json()
+            if files_data is not None:
                 for item in files_data:
                     if 'size' in item:
                         total_size += item['size']
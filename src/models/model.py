@@ -19,12 +19,30 @@ class ModelInfo:
     pipeline_tag: str = ""
     library_name: str = ""
     model_index: List[Dict] = None
+    sha: str = ""
+    siblings: List[Dict] = None
+    card_data: Dict[str, Any] = None
+    # Dataset and code resources from the URL file that belong to this model
+    datasets: List['DatasetInfo'] = None
+    code: List['CodeInfo'] = None
+    # Requests that failed for a reason other than the resource not existing
+    fetch_failures: List[str] = None
     
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
+        if self.fetch_failures is None:
+            self.fetch_failures = []
         if self.model_index is None:
             self.model_index = []
+        if self.siblings is None:
+            self.siblings = []
+        if self.card_data is None:
+            self.card_data = {}
+        if self.datasets is None:
+            self.datasets = []
+        if self.code is None:
+            self.code = []
 
 @dataclass 
 class DatasetInfo:
@@ -35,10 +53,15 @@ class DatasetInfo:
     downloads: int = 0
     likes: int = 0
     tags: List[str] = None
+    num_rows: int = 0
+    parquet_bytes: int = 0
+    profile: Dict[str, Any] = None
     
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
+        if self.profile is None:
+            self.profile = {}
 
 @dataclass
 class CodeInfo:
@@ -50,6 +73,7 @@ class CodeInfo:
     forks: int = 0
     language: str = ""
     last_updated: str = ""
+    pushed_at: str = ""
 
 @dataclass
 class MetricResult:
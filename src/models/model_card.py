@@ -0,0 +1,224 @@
+# src/models/model_card.py
+"""
+Parsed model card (README.md) document model
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+HEADING_PATTERN = re.compile(r'^\s*(#{1,6})\s+(.*?)\s*#*\s*$')
+FENCE_PATTERN = re.compile(r'^\s*(`{3,}|~{3,})\s*([^\s`]*)')
+LINK_PATTERN = re.compile(r'\[([^\]]*)\]\(\s*<?([^)\s>]+)>?[^)]*\)|<?(https?://[^\s)>\]"\']+)')
+TABLE_SEPARATOR = re.compile(r'^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$')
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+@dataclass
+class Section:
+    """A heading and the text up to the next heading"""
+    title: str
+    level: int
+    body: str = ""
+    children: List['Section'] = field(default_factory=list)
+
+    @property
+    def first_paragraph(self) -> str:
+        return PARAGRAPH_BREAK.split(self.body.strip(), 1)[0].strip()
+
+@dataclass
+class CodeBlock:
+    """A fenced code block"""
+    language: str
+    code: str
+    section: Optional[str] = None
+
+@dataclass
+class Link:
+    """A markdown link or bare URL"""
+    url: str
+    text: str = ""
+    section: Optional[str] = None
+
+@dataclass
+class Table:
+    """A pipe table"""
+    headers: List[str]
+    rows: List[List[str]]
+    section: Optional[str] = None
+
+@dataclass
+class ModelCard:
+    """Structure of a model card, parsed once and queried by the metrics"""
+    front_matter: Dict[str, Any] = field(default_factory=dict)
+    sections: List[Section] = field(default_factory=list)
+    code_blocks: List[CodeBlock] = field(default_factory=list)
+    links: List[Link] = field(default_factory=list)
+    tables: List[Table] = field(default_factory=list)
+    prose: str = ""
+
+    @property
+    def section_tree(self) -> List[Section]:
+        """Top-level sections; nested headings are in their children"""
+        if not self.sections:
+            return []
+        top_level = min(section.level for section in self.sections)
+        return [section for section in self.sections if section.level == top_level]
+
+    def find_sections(self, keywords: Iterable[str]) -> List[Section]:
+        """Sections whose heading contains any of the keywords (case-insensitive)"""
+        keywords = [keyword.lower() for keyword in keywords]
+        return [section for section in self.sections
+                if any(keyword in section.title.lower() for keyword in keywords)]
+
+    def section(self, keyword: str) -> Optional[Section]:
+        """First section whose heading contains the keyword"""
+        matches = self.find_sections([keyword])
+        return matches[0] if matches else None
+
+    def code_languages(self) -> List[str]:
+        return [block.language for block in self.code_blocks if block.language]
+
+    @classmethod
+    def parse(cls, text: str) -> 'ModelCard':
+        """Parse README text in one pass over its lines"""
+        front_matter, body = split_front_matter(text)
+        card = cls(front_matter=front_matter)
+
+        stack: List[Section] = []
+        current: Optional[Section] = None
+        section_lines: List[str] = []
+        prose_lines: List[str] = []
+        fence: Optional[str] = None
+        code_language = ""
+        code_lines: List[str] = []
+        table_lines: List[str] = []
+
+        def title() -> Optional[str]:
+            return current.title if current else None
+
+        def close_section() -> None:
+            if current is not None:
+                current.body = '\n'.join(section_lines).strip('\n')
+
+        def close_table() -> None:
+            if len(table_lines) >= 2 and TABLE_SEPARATOR.match(table_lines[1]):
+                card.tables.append(Table(
+                    headers=_table_cells(table_lines[0]),
+                    rows=[_table_cells(line) for line in table_lines[2:]],
+                    section=title()
+                ))
+            table_lines.clear()
+
+        for line in body.split('\n'):
+            if fence is not None:
+                if line.strip().startswith(fence) and not line.strip()[len(fence):].strip(fence[0]).strip():
+                    card.code_blocks.append(CodeBlock(code_language, '\n'.join(code_lines), title()))
+                    fence = None
+                else:
+                    code_lines.append(line)
+                section_lines.append(line)
+                continue
+
+            fence_match = FENCE_PATTERN.match(line)
+            if fence_match:
+                close_table()
+                fence = fence_match.group(1)
+                code_language = fence_match.group(2).lower()
+                code_lines = []
+                section_lines.append(line)
+                continue
+
+            heading_match = HEADING_PATTERN.match(line)
+            if heading_match:
+                close_table()
+                close_section()
+                level = len(heading_match.group(1))
+                current = Section(title=heading_match.group(2).strip(), level=level)
+                section_lines = []
+                while stack and stack[-1].level >= level:
+                    stack.pop()
+                if stack:
+                    stack[-1].children.append(current)
+                stack.append(current)
+                card.sections.append(current)
+                prose_lines.append(line)
+                continue
+
+            if line.lstrip().startswith('|'):
+                table_lines.append(line)
+            else:
+                close_table()
+
+            for match in LINK_PATTERN.finditer(line):
+                if match.group(2):
+                    card.links.append(Link(match.group(2), match.group(1).strip(), title()))
+                else:
+                    card.links.append(Link(match.group(3).rstrip('.,;:'), "", title()))
+
+            section_lines.append(line)
+            prose_lines.append(line)
+
+        if fence is not None:
+            # An unterminated fence runs to the end of the document
+            card.code_blocks.append(CodeBlock(code_language, '\n'.join(code_lines), title()))
+        close_table()
+        close_section()
+        card.prose = '\n'.join(prose_lines)
+        return card
+
+
+def split_front_matter(text: str) -> Tuple[Dict[str, Any], str]:
+    """Split a leading '---' YAML block from the markdown body"""
+    lines = _opening_lines(text)
+    end = _closing_index(lines, len(lines)) if lines else None
+    if end is None:
+        return {}, text
+    return parse_front_matter('\n'.join(lines[1:end])), '\n'.join(lines[end + 1:])
+
+
+def front_matter_from_prefix(prefix: str) -> Optional[Dict[str, Any]]:
+    """Front matter from the first bytes of a README.
+
+    Returns {} when the README has no front matter and None when the
+    prefix ends before the closing '---', i.e. more text is needed.
+    """
+    lines = _opening_lines(prefix)
+    if lines is None:
+        return {}
+    # The last line may have been cut off mid-way, so it cannot close the block
+    end = _closing_index(lines, len(lines) - 1)
+    if end is None:
+        return None
+    return parse_front_matter('\n'.join(lines[1:end]))
+
+
+def _opening_lines(text: str) -> Optional[List[str]]:
+    lines = text.lstrip('\ufeff').split('\n')
+    return lines if lines[0].strip() == '---' else None
+
+
+def _closing_index(lines: List[str], stop: int) -> Optional[int]:
+    for index in range(1, stop):
+        if lines[index].strip() in ('---', '...'):
+            return index
+    return None
+
+
+def parse_front_matter(block: str) -> Dict[str, Any]:
+    """Load a YAML front matter block, tolerating malformed YAML"""
+    try:
+        data = yaml.safe_load(block)
+    except yaml.YAMLError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _table_cells(line: str) -> List[str]:
+    cells = line.strip()
+    if cells.startswith('|'):
+        cells = cells[1:]
+    if cells.endswith('|'):
+        cells = cells[:-1]
+    return [cell.strip() for cell in cells.split('|')]
@@ -0,0 +1,150 @@
+# src/resource_context.py
+"""
+Dataset and code resources from a URL file, fetched once and shared by models
+"""
+
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+
+from .models.model import CodeInfo, DatasetInfo, ModelInfo
+from .url_parser import URLParser
+from .utils.logger import setup_logger
+
+# Datasets resolved from one model's card; long lists of mixtures are cut here
+MAX_DECLARED_DATASETS = 10
+
+# A Hub dataset id: a bare canonical name or 'owner/name'
+DATASET_ID = re.compile(r'^[\w.-]+(/[\w.-]+)?$')
+
+class ResourceContext:
+    """DATASET and CODE URLs of a run, each parsed exactly once.
+
+    load() fetches every distinct dataset and code URL concurrently;
+    attach() then hands each model the resources listed with it in the
+    URL file, plus the datasets its model card declares (front matter
+    'datasets' and model-index results). Declared datasets that are not in
+    the file are fetched once per dataset id for the whole run, whichever
+    model asks first, so c4 costs one request however many models use it.
+    """
+
+    def __init__(self, url_parser: URLParser, workers: int = 8):
+        self.logger = setup_logger()
+        self.url_parser = url_parser
+        self.workers = max(1, workers)
+
+        self.datasets: Dict[str, DatasetInfo] = {}
+        self.code: Dict[str, CodeInfo] = {}
+        self._groups: Dict[str, Dict[str, Any]] = {}
+
+        self._lock = threading.Lock()
+        self._resolved: Dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def load(self, groups: List[Dict[str, Any]]) -> None:
+        """Fetch the dataset and code URLs of grouped URL file entries"""
+        for group in groups:
+            self._groups.setdefault(group['model'], group)
+
+        dataset_urls = sorted({url for group in groups for url in group['datasets']} - set(self.datasets))
+        code_urls = sorted({url for group in groups for url in group['code']} - set(self.code))
+        if not dataset_urls and not code_urls:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(dataset_urls) + len(code_urls))) as executor:
+            datasets = executor.map(self._parse, dataset_urls, ['DATASET'] * len(dataset_urls))
+            code = executor.map(self._parse, code_urls, ['CODE'] * len(code_urls))
+            for url, info in zip(dataset_urls, datasets):
+                if info is not None:
+                    self.datasets[url] = info
+            for url, info in zip(code_urls, code):
+                if info is not None:
+                    self.code[url] = info
+
+    def _parse(self, url: str, url_type: str) -> Optional[Union[DatasetInfo, CodeInfo]]:
+        try:
+            if url_type == 'DATASET':
+                return self.url_parser.parse_dataset_url(url)
+            return self.url_parser.parse_code_url(url)
+        except Exception as e:
+            self.logger.error(f"Failed to parse {url_type.lower()} URL {url}: {str(e)}")
+            return None
+
+    def attach(self, model_info: ModelInfo, model_url: str) -> ModelInfo:
+        """Give a model its dataset and code resources"""
+        group = self._groups.get(model_url, {'datasets': [], 'code': []})
+        datasets = [self.datasets[url] for url in group['datasets'] if url in self.datasets]
+
+        declared = self._declared_datasets(model_info)
+        for dataset in self.datasets.values():
+            if dataset not in datasets and self._dataset_id_matches(dataset.name, declared):
+                datasets.append(dataset)
+
+        # Declared datasets the URL file does not list are looked up on the Hub
+        unresolved = [dataset_id for dataset_id in declared
+                      if not any(self._dataset_id_matches(dataset.name, [dataset_id]) for dataset in datasets)]
+        for dataset in self.resolve(unresolved[:MAX_DECLARED_DATASETS]):
+            if dataset not in datasets:
+                datasets.append(dataset)
+
+        model_info.datasets = datasets
+        model_info.code = [self.code[url] for url in group['code'] if url in self.code]
+        return model_info
+
+    def resolve(self, dataset_ids: List[str]) -> List[DatasetInfo]:
+        """Datasets by Hub id, fetched concurrently and at most once per run
+
+        Ids that do not exist on the Hub are left out.
+        """
+        futures = []
+        with self._lock:
+            for dataset_id in dataset_ids:
+                future = self._resolved.get(dataset_id.lower())
+                if future is None:
+                    if self._executor is None:
+                        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+                    url = f"https://huggingface.co/datasets/{dataset_id}"
+                    future = self._executor.submit(self._parse, url, 'DATASET')
+                    self._resolved[dataset_id.lower()] = future
+                futures.append(future)
+
+        datasets = []
+        for future in futures:
+            dataset = future.result()
+            if dataset is not None and dataset.api_data and dataset not in datasets:
+                datasets.append(dataset)
+        return datasets
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    @staticmethod
+    def _declared_datasets(model_info: ModelInfo) -> List[str]:
+        """Dataset ids from the card front matter and model-index results"""
+        declared = model_info.card_data.get('datasets') or []
+        if isinstance(declared, str):
+            declared = [declared]
+        declared = list(declared)
+        for entry in model_info.model_index or []:
+            for result in (entry.get('results') or []) if isinstance(entry, dict) else []:
+                dataset = result.get('dataset') if isinstance(result, dict) else None
+                if isinstance(dataset, dict) and dataset.get('type'):
+                    declared.append(dataset['type'])
+
+        dataset_ids = []
+        for name in declared:
+            dataset_id = str(name).strip()
+            if DATASET_ID.match(dataset_id) and dataset_id.lower() not in (item.lower() for item in dataset_ids):
+                dataset_ids.append(dataset_id)
+        return dataset_ids
+
+    @staticmethod
+    def _dataset_id_matches(dataset_id: str, declared: List[str]) -> bool:
+        """'owner/name' matches a declared 'owner/name' or bare 'name'"""
+        dataset_id = dataset_id.lower()
+        name = dataset_id.split('/')[-1]
+        return any(item.lower() in (dataset_id, name) for item in declared)
@@ -4,23 +4,31 @@ URL Parser module for identifying and parsing different types of URLs
 """
 
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from urllib.parse import urlparse
-import requests
 import json
 
+import requests
+
 from .models.model import ModelInfo, DatasetInfo, CodeInfo
 from .utils.logger import setup_logger
+from .utils.http_client import get_http_client
+from .utils.blob_cache import get_blob_cache
+from .utils.config import Config
+from .utils import parquet_profile
+
+# Row and parquet size statistics of a dataset's auto-converted parquet files
+DATASETS_SERVER_SIZE_URL = "https://datasets-server.huggingface.co/size"
+# The auto-converted parquet files themselves, with their sizes
+DATASETS_SERVER_PARQUET_URL = "https://datasets-server.huggingface.co/parquet"
 
 class URLParser:
     """Parser for different types of URLs (Model, Dataset, Code)"""
     
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ACME-ML-Evaluator/1.0'
-        })
+        self.session = get_http_client()
+        self.config = Config()
     
     def identify_url_type(self, url: str) -> str:
         """Identify the type of URL"""
@@ -36,6 +44,35 @@ class URLParser:
             # Default assumption
             return "MODEL"
     
+    def group_urls(self, lines: Iterable[str]) -> List[Dict[str, Any]]:
+        """Pair each model URL with the dataset and code URLs that belong to it
+        
+        A line of the form 'code_url, dataset_url, model_url' (fields may be
+        blank) pairs them explicitly. With one URL per line, a model takes
+        the dataset and code URLs listed since the previous model. Returns
+        one {'model', 'datasets', 'code'} entry per model, in file order.
+        """
+        groups = []
+        datasets: List[str] = []
+        codes: List[str] = []
+        for line in lines:
+            fields = [field.strip() for field in line.split(',')]
+            for url in fields:
+                if not url:
+                    continue
+                url_type = self.identify_url_type(url)
+                if url_type == "DATASET":
+                    datasets.append(url)
+                elif url_type == "CODE":
+                    codes.append(url)
+                else:
+                    groups.append({'model': url, 'datasets': datasets, 'code': codes})
+                    datasets, codes = [], []
+            if len(fields) > 1:
+                # The fields of a CSV line only belong to its own model
+                datasets, codes = [], []
+        return groups
+    
     def parse_model_url(self, url: str) -> Optional[ModelInfo]:
         """Parse a Hugging Face model URL"""
         try:
@@ -53,17 +90,14 @@ class URLParser:
             
             model_id = match.group(1)
             
-            # Fetch model information from HF API
-            api_url = f"https://huggingface.co/api/models/{model_id}"
-            
+            # Fetch model information, file sizes and commit sha in one call
+            fetch_failures = []
             try:
-                response = self.session.get(api_url, timeout=30)
-                if response.status_code == 200:
-                    api_data = response.json()
-                else:
-                    api_data = {}
-            except:
+                api_data = self._fetch_model_data(model_id)
+            except Exception as e:
+                self.logger.warning(f"Model info fetch failed for {model_id}: {str(e)}")
                 api_data = {}
+                fetch_failures.append('model info')
             
             # Create ModelInfo object
             model_info = ModelInfo(
@@ -76,7 +110,11 @@ class URLParser:
                 tags=api_data.get('tags', []),
                 pipeline_tag=api_data.get('pipeline_tag', ''),
                 library_name=api_data.get('library_name', ''),
-                model_index=api_data.get('model-index', [])
+                model_index=api_data.get('model-index', []),
+                sha=api_data.get('sha', ''),
+                siblings=api_data.get('siblings', []),
+                card_data=api_data.get('cardData', {}),
+                fetch_failures=fetch_failures
             )
             
             return model_info
@@ -85,16 +123,32 @@ class URLParser:
             self.logger.error(f"Failed to parse model URL {url}: {str(e)}")
             return None
     
+    def _fetch_model_data(self, model_id: str) -> Dict[str, Any]:
+        """Fetch the model metadata with blob sizes, LFS info and oids for every sibling
+        
+        blobs=true cannot be combined with an expand[] projection, and the
+        sibling sizes are what spare most models a tree walk, so the full
+        payload is requested. It also carries the commit sha and the
+        safetensors parameter counts.
+        """
+        api_url = f"https://huggingface.co/api/models/{model_id}"
+        response = self.session.get(api_url, params={'blobs': 'true'}, timeout=30)
+        if response.status_code == 200:
+            return response.json()
+        if response.status_code != 404:
+            raise requests.HTTPError(f"Model info failed with HTTP {response.status_code}", response=response)
+        return {}
+    
     def parse_dataset_url(self, url: str) -> Optional[DatasetInfo]:
         """Parse a Hugging Face dataset URL"""
         try:
-            # Extract dataset name from URL
-            pattern = r'huggingface\.co/datasets/([^/]+/[^/?]+)'
+            # Extract dataset name from URL ('owner/name', or a bare canonical name)
+            pattern = r'huggingface\.co/datasets/([^/]+/[^/?]+|[^/?]+/?$)'
             match = re.search(pattern, url)
             if not match:
                 return None
             
-            dataset_id = match.group(1)
+            dataset_id = match.group(1).rstrip('/')
             
             # Fetch dataset information from HF API
             api_url = f"https://huggingface.co/api/datasets/{dataset_id}"
@@ -108,19 +162,69 @@ class URLParser:
             except:
                 api_data = {}
             
+            # Canonical names like 'c4' redirect to their owner's 'allenai/c4'
+            dataset_id = api_data.get('id') or dataset_id
+            size = self._fetch_dataset_size(dataset_id) if api_data else {}
+            profile = self._profile_dataset(dataset_id, api_data.get('sha', '')) if size else {}
+            
             return DatasetInfo(
                 name=dataset_id,
                 url=url,
                 api_data=api_data,
                 downloads=api_data.get('downloads', 0),
                 likes=api_data.get('likes', 0),
-                tags=api_data.get('tags', [])
+                tags=api_data.get('tags', []),
+                num_rows=size.get('num_rows', 0),
+                parquet_bytes=size.get('num_bytes_parquet_files', 0),
+                profile=profile
             )
             
         except Exception as e:
             self.logger.error(f"Failed to parse dataset URL {url}: {str(e)}")
             return None
     
+    def _fetch_dataset_size(self, dataset_id: str) -> Dict[str, Any]:
+        """Row count and parquet size from the datasets-server, or {} if not converted"""
+        try:
+            response = self.session.get(DATASETS_SERVER_SIZE_URL, params={'dataset': dataset_id}, timeout=30)
+            if response.status_code == 200:
+                return response.json().get('size', {}).get('dataset', {}) or {}
+        except Exception as e:
+            self.logger.warning(f"Dataset size unavailable for {dataset_id}: {str(e)}")
+        return {}
+    
+    def _profile_dataset(self, dataset_id: str, sha: str) -> Dict[str, Any]:
+        """Profile a sample of the first training parquet file, reading only what is needed"""
+        if not self.config.dataset_profile_enabled or not parquet_profile.available():
+            return {}
+        try:
+            response = self.session.get(DATASETS_SERVER_PARQUET_URL, params={'dataset': dataset_id}, timeout=30)
+            if response.status_code != 200:
+                return {}
+            files = response.json().get('parquet_files') or []
+            files = [item for item in files if item.get('split') == 'train'] or files
+            if not files:
+                return {}
+            parquet_file = files[0]
+            
+            # The conversion of a dataset revision never changes
+            cache = get_blob_cache()
+            oid = f"{sha}:{parquet_file.get('config')}/{parquet_file.get('filename')}" if sha else None
+            if cache is not None:
+                cached = cache.get(parquet_profile.PROFILE_KIND, oid)
+                if cached is not None:
+                    return cached
+            
+            remote = parquet_profile.RangeFile(self.session, parquet_file['url'], parquet_file['size'])
+            profile = parquet_profile.profile_parquet(remote, self.config.dataset_profile_budget)
+            self.logger.debug(f"Profiled {dataset_id} reading {remote.bytes_read} of {remote.size} bytes")
+            if cache is not None:
+                cache.put(parquet_profile.PROFILE_KIND, oid, profile)
+            return profile
+        except Exception as e:
+            self.logger.warning(f"Dataset profile unavailable for {dataset_id}: {str(e)}")
+            return {}
+    
     def parse_code_url(self, url: str) -> Optional[CodeInfo]:
         """Parse a GitHub code repository URL"""
         try:
@@ -152,7 +256,8 @@ class URLParser:
                 stars=api_data.get('stargazers_count', 0),
                 forks=api_data.get('forks_count', 0),
                 language=api_data.get('language', ''),
-                last_updated=api_data.get('updated_at', '')
+                last_updated=api_data.get('updated_at', ''),
+                pushed_at=api_data.get('pushed_at', '')
             )
             
         except Exception as e:
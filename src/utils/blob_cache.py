@@ -0,0 +1,187 @@
+# src/utils/blob_cache.py
+"""
+Content-addressed cache of per-file analysis results, keyed by git blob oid
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .config import Config
+from .logger import setup_logger
+
+# Bytes of JSON-encoded results kept in memory in front of the SQLite table
+MEMORY_BYTES = 16 * 1024 * 1024
+# Disk hits whose access times are held in memory before one batched write
+ACCESS_FLUSH_EVERY = 256
+
+class BlobCache:
+    """Results of analysing one file's content, shared by every repo containing it.
+
+    A git blob oid names the file content, so a result stored under
+    (kind, oid) is valid for any model that ships the same bytes, in this
+    run and later ones. kind names the analysis and should carry a version
+    suffix that is bumped whenever the analysis changes.
+
+    The table is capped at max_bytes of encoded results; like the HTTP
+    cache, the least recently used entries are evicted first.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        self.logger = setup_logger()
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        # (kind, oid) -> (result, encoded size), least recently used first
+        self._memory: 'OrderedDict[tuple, Tuple[Any, int]]' = OrderedDict()
+        self._memory_bytes = 0
+        # Encoded bytes on disk, and access times not yet written
+        self._disk_bytes = 0
+        self._accessed: Dict[tuple, float] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+                # The uncapped table of earlier versions
+                self._conn.execute("DROP TABLE IF EXISTS blobs")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results ("
+                    " kind TEXT, oid TEXT, result TEXT, size INTEGER, last_access REAL,"
+                    " PRIMARY KEY (kind, oid))"
+                )
+                self._conn.commit()
+                self._disk_bytes = self._conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            except Exception as e:
+                self.logger.warning(f"Blob cache persistence disabled ({self.path}): {str(e)}")
+                self._disabled = True
+                self._conn = None
+        return self._conn
+
+    def get(self, kind: str, oid: Optional[str]) -> Optional[Any]:
+        """Stored result for a blob, or None"""
+        if not oid:
+            return None
+        key = (kind, oid)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self._touch(key)
+                return self._memory[key][0]
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT result FROM results WHERE kind = ? AND oid = ?", key
+            ).fetchone() if conn is not None else None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(key)
+            result = json.loads(row[0])
+            self._remember(key, result, len(row[0]))
+            return result
+
+    def put(self, kind: str, oid: Optional[str], result: Any) -> None:
+        """Store the (JSON-serialisable) result of analysing a blob"""
+        if not oid:
+            return
+        key = (kind, oid)
+        encoded = json.dumps(result)
+        with self._lock:
+            self._remember(key, result, len(encoded))
+            conn = self._connect()
+            if conn is None:
+                return
+            if len(encoded) > self.max_bytes:
+                return
+            previous = conn.execute(
+                "SELECT size FROM results WHERE kind = ? AND oid = ?", key).fetchone()
+            conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                         (kind, oid, encoded, len(encoded), time.time()))
+            self._accessed.pop(key, None)
+            self._disk_bytes += len(encoded) - (previous[0] if previous else 0)
+            if self._disk_bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+
+    def _touch(self, key: tuple) -> None:
+        """Note an access, writing the batch once ACCESS_FLUSH_EVERY are pending"""
+        self._accessed[key] = time.time()
+        if len(self._accessed) >= ACCESS_FLUSH_EVERY and self._conn is not None:
+            self._flush_access(self._conn)
+            self._conn.commit()
+
+    def _flush_access(self, conn: sqlite3.Connection) -> None:
+        if self._accessed:
+            conn.executemany("UPDATE results SET last_access = ? WHERE kind = ? AND oid = ?",
+                             [(accessed, kind, oid) for (kind, oid), accessed in self._accessed.items()])
+            self._accessed.clear()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used results until the table fits max_bytes"""
+        self._flush_access(conn)
+        rows = conn.execute(
+            "SELECT kind, oid, size FROM results ORDER BY last_access ASC"
+        )
+        evicted = []
+        for kind, oid, size in rows:
+            if self._disk_bytes <= self.max_bytes:
+                break
+            evicted.append((kind, oid))
+            self._disk_bytes -= size
+        conn.executemany("DELETE FROM results WHERE kind = ? AND oid = ?", evicted)
+        self.evictions += len(evicted)
+
+    def _remember(self, key: tuple, result: Any, size: int) -> None:
+        """Keep a result in memory, evicting the least recently used past MEMORY_BYTES"""
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[1]
+        if size > MEMORY_BYTES // 4:
+            return  # a few large READMEs must not push out every small result
+        self._memory[key] = (result, size)
+        self._memory_bytes += size
+        while self._memory_bytes > MEMORY_BYTES:
+            self._memory_bytes -= self._memory.popitem(last=False)[1][1]
+
+    def total_bytes(self) -> int:
+        """Encoded bytes of the results stored on disk"""
+        with self._lock:
+            return self._disk_bytes if self._connect() is not None else 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._flush_access(self._conn)
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[BlobCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_blob_cache() -> Optional[BlobCache]:
+    """Return the process-wide blob cache, or None if disabled by config"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            config = Config()
+            if not config.blob_cache_enabled:
+                return None
+            _default_cache = BlobCache(config.blob_cache_path, config.blob_cache_max_bytes)
+        return _default_cache
@@ -0,0 +1,171 @@
+# src/utils/code_archive.py
+"""
+Single-pass analysis of a repository tarball, streamed without extracting it
+"""
+
+import hashlib
+import posixpath
+import re
+import tarfile
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from .blob_cache import BlobCache
+from .python_analysis import ANALYSIS_KIND, analyze_sources
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11; pyproject dependencies are then not counted
+    tomllib = None
+
+# Larger files are skipped unread: generated code, vendored bundles, data
+MAX_FILE_BYTES = 512 * 1024
+
+DEPENDENCY_FILES = ('requirements.txt', 'pyproject.toml', 'setup.py', 'setup.cfg', 'pipfile', 'environment.yml')
+CI_FILES = ('.gitlab-ci.yml', '.travis.yml', 'azure-pipelines.yml', 'jenkinsfile', '.circleci/config.yml')
+CI_TEST_TERMS = ('pytest', 'unittest', 'tox', 'nox', 'make test')
+CI_LINT_TERMS = ('flake8', 'ruff', 'pylint', 'mypy', 'black', 'isort', 'pre-commit')
+# A requirement with any version constraint
+VERSIONED_REQUIREMENT = re.compile(r'(==|>=|<=|~=|!=|<|>)\s*\d')
+
+
+def archive_url(name: str, ref: Optional[str] = None) -> str:
+    """codeload URL of the tar.gz archive of a GitHub 'owner/repo' at a ref"""
+    return f"https://codeload.github.com/{name}/tar.gz/{ref or 'HEAD'}"
+
+
+def blob_oid(data: bytes) -> str:
+    """The git blob oid of file content, as the Hub tree reports for small files"""
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+
+class BudgetExceeded(Exception):
+    """Raised by CountingReader once more than its budget has been read"""
+
+
+class CountingReader:
+    """File object wrapper counting the bytes read through it.
+
+    With a budget, reads past it raise BudgetExceeded, so a single huge
+    member cannot pull in more than one read's worth over the budget.
+    """
+
+    def __init__(self, raw: IO[bytes], budget: Optional[int] = None):
+        self.raw = raw
+        self.budget = budget
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if self.budget is not None and self.bytes_read > self.budget:
+            raise BudgetExceeded(f"read {self.bytes_read} of a {self.budget} byte budget")
+        data = self.raw.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def analyze_archive(fileobj: IO[bytes], budget: int, python_budget: int,
+                    blob_cache: Optional[BlobCache] = None) -> Dict[str, Any]:
+    """Analyse the Python, dependency and CI files of a .tar.gz stream in one pass.
+
+    The archive is read sequentially with tarfile's stream mode: nothing is
+    written to disk and only files of interest up to MAX_FILE_BYTES are held
+    in memory. Reading stops once `budget` compressed bytes have been read;
+    Python sources are kept for analysis up to `python_budget` bytes, and
+    files already analysed under the same blob oid are not parsed again.
+    """
+    stream = CountingReader(fileobj, budget)
+    result: Dict[str, Any] = {
+        'files': 0,
+        'truncated': False,
+        'python': [],
+        'test_files': 0,
+        'dependency_files': [],
+        'dependencies': 0,
+        'versioned_dependencies': 0,
+        'ci_files': [],
+        'ci_runs_tests': False,
+        'ci_runs_linters': False,
+    }
+    pending: List[Dict[str, Any]] = []
+    sources: List[str] = []
+
+    try:
+        with tarfile.open(fileobj=stream, mode='r|gz') as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                result['files'] += 1
+                # GitHub archives nest everything under 'owner-repo-sha/'
+                path = member.name.split('/', 1)[1] if '/' in member.name else member.name
+                kind = _file_kind(path)
+                if kind is None or member.size > MAX_FILE_BYTES:
+                    continue
+
+                data = archive.extractfile(member).read()
+                if kind == 'python':
+                    if _is_test_file(path):
+                        result['test_files'] += 1
+                    oid = blob_oid(data)
+                    cached = blob_cache.get(ANALYSIS_KIND, oid) if blob_cache is not None else None
+                    if cached is not None:
+                        result['python'].append(dict(cached, path=path, oid=oid))
+                    elif len(data) <= python_budget:
+                        python_budget -= len(data)
+                        pending.append({'path': path, 'oid': oid})
+                        sources.append(data.decode('utf-8', errors='replace'))
+                if kind == 'dependencies' or posixpath.basename(path).lower() in DEPENDENCY_FILES:
+                    result['dependency_files'].append(path)
+                    total, versioned = _count_requirements(path, data.decode('utf-8', errors='replace'))
+                    result['dependencies'] += total
+                    result['versioned_dependencies'] += versioned
+                elif kind == 'ci':
+                    result['ci_files'].append(path)
+                    text = data.decode('utf-8', errors='replace').lower()
+                    result['ci_runs_tests'] |= any(term in text for term in CI_TEST_TERMS)
+                    result['ci_runs_linters'] |= any(term in text for term in CI_LINT_TERMS)
+    except BudgetExceeded:
+        result['truncated'] = True
+
+    for item, analysis in zip(pending, analyze_sources(sources)):
+        if blob_cache is not None:
+            blob_cache.put(ANALYSIS_KIND, item['oid'], analysis)
+        result['python'].append(dict(analysis, **item))
+    return result
+
+
+def _file_kind(path: str) -> Optional[str]:
+    """'python', 'dependencies', 'ci' or None for files that are not analysed"""
+    lower = path.lower()
+    name = posixpath.basename(lower)
+    if lower.endswith('.py'):
+        return 'python'
+    if name in DEPENDENCY_FILES or (name.startswith('requirements') and name.endswith('.txt')):
+        return 'dependencies'
+    if lower.startswith('.github/workflows/') and lower.endswith(('.yml', '.yaml')):
+        return 'ci'
+    if lower in CI_FILES:
+        return 'ci'
+    return None
+
+
+def _is_test_file(path: str) -> bool:
+    parts = path.lower().split('/')
+    name = parts[-1]
+    return (any(part in ('tests', 'test') for part in parts[:-1])
+            or name.startswith('test_') or name.endswith('_test.py'))
+
+
+def _count_requirements(path: str, text: str) -> Tuple[int, int]:
+    """(dependencies, version-constrained dependencies) declared by a manifest"""
+    name = posixpath.basename(path).lower()
+    if name.endswith('.txt'):
+        requirements = [line.split('#', 1)[0].strip() for line in text.splitlines()]
+        requirements = [line for line in requirements if line and not line.startswith('-')]
+    elif name == 'pyproject.toml' and tomllib is not None:
+        try:
+            project = tomllib.loads(text).get('project', {})
+        except tomllib.TOMLDecodeError:
+            return 0, 0
+        requirements = [str(item) for item in project.get('dependencies', [])]
+    else:
+        return 0, 0
+    return len(requirements), sum(1 for line in requirements if VERSIONED_REQUIREMENT.search(line))
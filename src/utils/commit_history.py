@@ -0,0 +1,102 @@
+# src/utils/commit_history.py
+"""
+Author statistics of a Hugging Face repo from its commits API, read incrementally
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+# Feature store summary kind of per-repo commit summaries, stored under the repo id
+COMMITS_KIND = 'hf-commits:1'
+# Commits read before the author distribution is checked for stability
+MIN_COMMITS = 50
+# Commits between stability checks
+CHECK_EVERY = 50
+# Author shares that moved less than this (total variation distance) are stable
+STABLE_DISTANCE = 0.02
+# Never walk further back than this
+MAX_COMMITS = 2000
+# Per-author last commit times kept in a history
+MAX_AUTHORS = 100
+
+def summarize_commits(commits: Iterable[Dict[str, Any]], head: str,
+                      previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Commit counts and last commit time per author, newest commits first.
+
+    Reading stops at the head of a previous summary, whose counts are then
+    merged in, so a later run only reads the commits made since. Otherwise
+    it stops once every CHECK_EVERY commits move the author shares by less
+    than STABLE_DISTANCE, or after MAX_COMMITS. `commits` may be a lazy
+    stream such as hf_tree.iter_commits: unread pages are never fetched.
+    """
+    counts: Counter = Counter()
+    last_commit: Dict[str, int] = {}
+    seen = 0
+    complete = True
+    checkpoint: Optional[Dict[str, float]] = None
+
+    for commit in commits:
+        if previous is not None and commit.get('id') == previous['head']:
+            counts.update(previous['authors'])
+            for author, timestamp in previous['last_commits'].items():
+                last_commit[author] = max(last_commit.get(author, 0), timestamp)
+            seen += previous['commits']
+            complete = previous['complete']
+            break
+
+        seen += 1
+        timestamp = _timestamp(commit.get('date'))
+        for author in commit.get('authors') or []:
+            user = author.get('user') if isinstance(author, dict) else None
+            if user:
+                counts[user] += 1
+                last_commit[user] = max(last_commit.get(user, 0), timestamp)
+
+        if seen >= MAX_COMMITS:
+            complete = False
+            break
+        if seen >= MIN_COMMITS and seen % CHECK_EVERY == 0:
+            shares = _shares(counts)
+            if checkpoint is not None and _distance(shares, checkpoint) < STABLE_DISTANCE:
+                complete = False
+                break
+            checkpoint = shares
+
+    return {
+        'head': head,
+        'commits': seen,
+        'complete': complete,
+        'authors': dict(counts),
+        'last_commits': last_commit,
+    }
+
+
+def history(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """The summary in the shape BusFactorMetric scores, without author names"""
+    counts = summary['authors']
+    attributed = sum(counts.values())
+    return {
+        'commits': summary['commits'],
+        'authors': len(counts),
+        'top_author_share': max(counts.values()) / attributed if attributed else 0.0,
+        'last_commits': sorted(summary['last_commits'].values(), reverse=True)[:MAX_AUTHORS],
+    }
+
+
+def _timestamp(date: Optional[str]) -> int:
+    try:
+        return int(datetime.fromisoformat(date.replace('Z', '+00:00')).timestamp())
+    except (AttributeError, ValueError):
+        return 0
+
+
+def _shares(counts: Counter) -> Dict[str, float]:
+    total = sum(counts.values())
+    return {author: count / total for author, count in counts.items()} if total else {}
+
+
+def _distance(shares: Dict[str, float], other: Dict[str, float]) -> float:
+    """Total variation distance between two author share distributions"""
+    authors = set(shares) | set(other)
+    return 0.5 * sum(abs(shares.get(author, 0.0) - other.get(author, 0.0)) for author in authors)
@@ -4,7 +4,8 @@ Configuration management
 """
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
 
 class Config:
     """Configuration settings"""
@@ -19,13 +20,80 @@ class Config:
         self.request_timeout = 30
         self.max_workers = 8
         self.max_file_size = 10 * 1024 * 1024  # 10MB
-    
-    def get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers with authentication if available"""
+        self.max_in_flight = int(os.environ.get('MAX_IN_FLIGHT_REQUESTS', '16'))
+        self.model_workers = int(os.environ.get('MODEL_WORKERS', '4'))
+
+        # Per-host rate limits as "host=rate/burst,..." (requests per second)
+        self.rate_limits = os.environ.get('RATE_LIMITS', '')
+        self.rate_limit_max_wait = float(os.environ.get('RATE_LIMIT_MAX_WAIT', '300'))
+        self.rate_limit_retries = int(os.environ.get('RATE_LIMIT_RETRIES', '5'))
+
+        # Retries and request hedging for idempotent requests
+        self.http_retries = int(os.environ.get('HTTP_RETRIES', '2'))
+        self.http_backoff_base = float(os.environ.get('HTTP_BACKOFF_BASE', '0.5'))
+        self.hedge_requests = os.environ.get('HEDGE_REQUESTS', '0') == '1'
+        self.hedge_percentile = float(os.environ.get('HEDGE_PERCENTILE', '95'))
+        self.hedge_min_samples = int(os.environ.get('HEDGE_MIN_SAMPLES', '20'))
+
+        # Persistent caches
+        self.cache_dir = os.environ.get(
+            'ML_EVAL_CACHE_DIR',
+            os.path.join(os.path.expanduser('~'), '.cache', 'ml-evaluator')
+        )
+        self.http_cache_enabled = os.environ.get('HTTP_CACHE', '1') != '0'
+        self.http_cache_dir = os.environ.get(
+            'HTTP_CACHE_DIR', os.path.join(self.cache_dir, 'http')
+        )
+        self.http_cache_max_bytes = int(os.environ.get('HTTP_CACHE_MAX_MB', '256')) * 1024 * 1024
+        self.feature_store_enabled = os.environ.get('FEATURE_STORE', '1') != '0'
+        self.feature_store_path = os.environ.get(
+            'FEATURE_STORE_PATH', os.path.join(self.cache_dir, 'features.sqlite')
+        )
+        self.incremental = os.environ.get('INCREMENTAL', '1') != '0'
+        self.blob_cache_enabled = os.environ.get('BLOB_CACHE', '1') != '0'
+        self.blob_cache_path = os.environ.get(
+            'BLOB_CACHE_PATH', os.path.join(self.cache_dir, 'blobs.sqlite')
+        )
+        self.blob_cache_max_bytes = int(os.environ.get('BLOB_CACHE_MAX_MB', '256')) * 1024 * 1024
+        
+        # Python files fetched per model for code analysis, and parser processes
+        self.code_fetch_budget = int(os.environ.get('CODE_FETCH_BUDGET_KB', '1024')) * 1024
+        self.analysis_processes = int(os.environ.get(
+            'ANALYSIS_PROCESSES', str(min(4, os.cpu_count() or 1))))
+        # Compressed bytes of a linked GitHub repo's tarball read for code analysis
+        self.code_archive_budget = int(os.environ.get('CODE_ARCHIVE_BUDGET_MB', '32')) * 1024 * 1024
+        
+        # Parquet sample profiling of datasets: on/off, and uncompressed bytes read per file
+        self.dataset_profile_enabled = os.environ.get('DATASET_PROFILE', '1') != '0'
+        self.dataset_profile_budget = int(os.environ.get('DATASET_PROFILE_BUDGET_MB', '32')) * 1024 * 1024
+        
+        # Blobless clones of model and code repos for commit-graph bus factor
+        self.repo_history_enabled = os.environ.get('REPO_HISTORY', '1') != '0'
+        self.repo_history_commits = int(os.environ.get('REPO_HISTORY_COMMITS', '1000'))
+        # Hub commits API author statistics, when no repo could be cloned
+        self.commit_history_enabled = os.environ.get('COMMIT_HISTORY', '1') != '0'
+        
+        # YAML or JSON file of named net score weight profiles
+        self.weight_profiles_path = os.environ.get('WEIGHT_PROFILES', '')
+
+    def get_headers(self, url: Optional[str] = None) -> Dict[str, str]:
+        """Get HTTP headers with authentication if available
+        
+        When a URL is given only the token belonging to that host is used, so
+        the Hugging Face token is never sent to GitHub and vice versa.
+        """
         headers = {
             'User-Agent': 'ACME-ML-Evaluator/1.0'
         }
         
+        if url is not None:
+            host = (urlparse(url).hostname or '').lower()
+            if self.github_token and (host == 'github.com' or host.endswith('.github.com')):
+                headers['Authorization'] = f'token {self.github_token}'
+            elif self.hf_token and (host == 'huggingface.co' or host.endswith('.huggingface.co')):
+                headers['Authorization'] = f'Bearer {self.hf_token}'
+            return headers
+        
         if self.github_token:
             headers['Authorization'] = f'token {self.github_token}'
         
@@ -0,0 +1,172 @@
+# src/utils/feature_store.py
+"""
+Persistent store of extracted metric features, keyed by model revision
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+from .config import Config
+from .logger import setup_logger
+
+# Rows fetched from the cursor at a time by latest()
+FETCH_ROWS = 1000
+
+class FeatureStore:
+    """SQLite table of per-model metric features.
+
+    One row is kept per (model, revision). Scores are never stored: they
+    are recomputed from the features, so changing a weight only needs a
+    re-score, not a re-download.
+
+    A second table holds summaries that later runs extend rather than
+    recompute, such as a model's Hub commit history. They are keyed by
+    (kind, model) and replaced on every write.
+    """
+
+    def __init__(self, path: str):
+        self.logger = setup_logger()
+        self.path = path
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database lazily so merely constructing a store touches no disk"""
+        if self._conn is None and not self._disabled:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(self.path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS features ("
+                    " name TEXT, revision TEXT, features TEXT, latencies TEXT,"
+                    " updated_at REAL, PRIMARY KEY (name, revision))"
+                )
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS summaries ("
+                    " kind TEXT, name TEXT, summary TEXT, updated_at REAL, PRIMARY KEY (kind, name))"
+                )
+                self._conn.commit()
+            except Exception as e:
+                self.logger.warning(f"Feature store disabled ({self.path}): {str(e)}")
+                self._disabled = True
+                self._conn = None
+        return self._conn
+
+    def put(self, name: str, revision: str, features: Dict[str, Any],
+            latencies: Dict[str, int]) -> None:
+        """Store (or replace) the features extracted for one model revision"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO features VALUES (?, ?, ?, ?, ?)",
+                (name, revision or '', json.dumps(features), json.dumps(latencies), time.time())
+            )
+            conn.commit()
+
+    def get(self, name: str, revision: str) -> Optional[Dict[str, Any]]:
+        """Stored entry for a model revision, or None"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT name, revision, features, latencies, updated_at FROM features"
+                " WHERE name = ? AND revision = ?", (name, revision or '')
+            ).fetchone()
+        return self._entry(row) if row is not None else None
+
+    def get_summary(self, kind: str, name: str) -> Optional[Any]:
+        """The latest summary of a kind stored for a model, or None"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT summary FROM summaries WHERE kind = ? AND name = ?", (kind, name)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put_summary(self, kind: str, name: str, summary: Any) -> None:
+        """Replace a model's summary of a kind"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)",
+                (kind, name, json.dumps(summary), time.time())
+            )
+            conn.commit()
+
+    def latest(self, fetch_rows: int = FETCH_ROWS) -> Iterator[Dict[str, Any]]:
+        """The most recently extracted revision of every model, by name
+        
+        Rows are read from the cursor fetch_rows at a time, so a caller
+        consuming the entries in batches holds only about one batch.
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            cursor = conn.execute(
+                "SELECT name, revision, features, latencies, MAX(updated_at) FROM features"
+                " GROUP BY name ORDER BY name"
+            )
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(fetch_rows)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._entry(row)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _entry(row) -> Dict[str, Any]:
+        return {
+            'name': row[0],
+            'revision': row[1],
+            'features': json.loads(row[2]),
+            'latencies': json.loads(row[3]),
+            'updated_at': row[4],
+        }
+
+    def count(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            return conn.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_store: Optional[FeatureStore] = None
+_default_store_lock = threading.Lock()
+
+def get_feature_store() -> Optional[FeatureStore]:
+    """Return the process-wide feature store, or None if disabled by config"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            config = Config()
+            if not config.feature_store_enabled:
+                return None
+            _default_store = FeatureStore(config.feature_store_path)
+        return _default_store
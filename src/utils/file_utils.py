@@ -6,20 +6,17 @@ File handling utilities
 import tempfile
 import os
 import shutil
-import requests
 from pathlib import Path
 from typing import Optional, Dict, Any
 from .logger import setup_logger
+from .http_client import get_http_client
 
 class FileUtils:
     """Utilities for file operations"""
     
     def __init__(self):
         self.logger = setup_logger()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'ACME-ML-Evaluator/1.0'
-        })
+        self.session = get_http_client()
     
     def download_file(self, url: str, max_size: int = 10 * 1024 * 1024) -> Optional[str]:
         """Download a file and return temporary path"""
@@ -0,0 +1,143 @@
+# src/utils/hf_tree.py
+"""
+Streaming walkers for the Hugging Face repository tree and commits APIs
+"""
+
+import codecs
+import itertools
+import json
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import requests
+
+HF_API_BASE = "https://huggingface.co/api"
+CHUNK_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+# Characters skipped between tokens before / after the opening bracket
+_SKIP_CHARS = {False: ' \t\r\n', True: ' \t\r\n,'}
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a JSON array as its bytes arrive.
+
+    Only the element currently being decoded is buffered, so a page with
+    thousands of entries is never held as one parsed list.
+    """
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    pos = 0
+    started = finished = False
+
+    for chunk in itertools.chain(chunks, [None]):
+        final = chunk is None
+        buffer = buffer[pos:] + utf8.decode(b'' if final else chunk, final=final)
+        pos = 0
+
+        while not finished:
+            while pos < len(buffer) and buffer[pos] in _SKIP_CHARS[started]:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError("Expected a JSON array")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == ']':
+                finished = True
+                break
+            try:
+                element, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise ValueError("Truncated JSON array")
+                break  # element not complete yet, wait for more bytes
+            if end == len(buffer) and not final:
+                break  # a scalar could still continue in the next chunk
+            yield element
+            pos = end
+
+    if not finished:
+        raise ValueError("Truncated JSON array")
+
+
+def file_size(entry: Dict[str, Any]) -> int:
+    """Size of the real file, using the LFS object size for LFS pointers"""
+    lfs = entry.get('lfs')
+    if isinstance(lfs, dict) and 'size' in lfs:
+        return int(lfs['size'])
+    return int(entry.get('size', 0) or 0)
+
+
+def file_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim a tree entry or model-info sibling to path, size, oid and lfs"""
+    return {
+        'path': entry.get('path', entry.get('rfilename')),
+        'size': file_size(entry),
+        'oid': entry.get('oid', entry.get('blobId')),
+        'lfs': entry.get('lfs'),
+    }
+
+
+def iter_repo_tree(session: requests.Session, repo_id: str, repo_type: str = 'models',
+                   revision: str = 'main', recursive: bool = True,
+                   timeout: int = 30) -> Iterator[Dict[str, Any]]:
+    """Yield every entry of a repo tree, following cursor pagination.
+
+    Pages are requested with recursive=true so files in subfolders are
+    listed without one request per directory, and each page is parsed as
+    a stream. Raises requests.HTTPError if a page cannot be fetched.
+    """
+    url: Optional[str] = f"{HF_API_BASE}/{repo_type}/{repo_id}/tree/{revision}"
+    params: Optional[Dict[str, str]] = {'recursive': 'true' if recursive else 'false'}
+
+    while url:
+        response = session.get(url, params=params, stream=True, timeout=timeout)
+        try:
+            if response.status_code != 200:
+                raise requests.HTTPError(
+                    f"Tree listing failed with HTTP {response.status_code}: {url}",
+                    response=response
+                )
+            for entry in iter_json_array(response.iter_content(chunk_size=CHUNK_SIZE)):
+                if isinstance(entry, dict):
+                    yield entry
+            url = _next_page_url(response)
+            params = None  # the cursor URL already carries the query
+        finally:
+            response.close()
+
+
+def iter_commits(session: requests.Session, repo_id: str, repo_type: str = 'models',
+                 revision: str = 'main', timeout: int = 30) -> Iterator[Dict[str, Any]]:
+    """Yield a repo's commits, newest first, following the pagination links.
+
+    Like iter_repo_tree, each page is parsed as a stream and the next page
+    is only requested once the caller has consumed this one, so a caller
+    that stops early never fetches the rest of a long history.
+    """
+    url: Optional[str] = f"{HF_API_BASE}/{repo_type}/{repo_id}/commits/{revision}"
+
+    while url:
+        response = session.get(url, stream=True, timeout=timeout)
+        try:
+            if response.status_code != 200:
+                raise requests.HTTPError(
+                    f"Commit listing failed with HTTP {response.status_code}: {url}",
+                    response=response
+                )
+            for commit in iter_json_array(response.iter_content(chunk_size=CHUNK_SIZE)):
+                if isinstance(commit, dict):
+                    yield commit
+            url = _next_page_url(response)
+        finally:
+            response.close()
+
+
+def _next_page_url(response: requests.Response) -> Optional[str]:
+    links = getattr(response, 'links', None)
+    if not isinstance(links, dict):
+        return None
+    next_link = links.get('next') or {}
+    return next_link.get('url')
@@ -0,0 +1,244 @@
+# src/utils/http_cache.py
+"""
+Persistent HTTP response cache with ETag / Last-Modified revalidation
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .config import Config
+from .logger import setup_logger
+
+# Response headers worth keeping alongside a cached body
+STORED_HEADERS = ('content-type', 'etag', 'last-modified', 'link')
+# Cache hits whose access times are held in memory before one batched write
+ACCESS_FLUSH_EVERY = 256
+
+class HTTPCache:
+    """Disk-backed, size-capped LRU store of GET responses.
+
+    Only responses that carry a validator (ETag or Last-Modified) are
+    stored, because the cache never serves an entry without first
+    revalidating it with a conditional request. Entries are keyed by URL
+    and the credentials the request was sent with, so a response fetched
+    with one token is never offered to a request made with another.
+
+    Lookups don't write: access times are kept in memory and written in
+    one batch before evicting, every ACCESS_FLUSH_EVERY hits, and on close.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        self.logger = setup_logger()
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._accessed: Dict[str, float] = {}
+
+    @property
+    def db_path(self) -> str:
+        return os.path.join(self.cache_dir, 'responses.sqlite')
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the index lazily so merely constructing a cache touches no disk"""
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " key TEXT PRIMARY KEY, url TEXT, status INTEGER,"
+                    " headers TEXT, body BLOB, size INTEGER, last_access REAL)"
+                )
+                self._conn.commit()
+            except Exception as e:
+                self.logger.warning(f"HTTP cache disabled ({self.cache_dir}): {str(e)}")
+                self._disabled = True
+                self._conn = None
+        return self._conn
+
+    @staticmethod
+    def make_key(url: str, auth: Optional[str] = None) -> str:
+        """Entry key of a URL fetched with the given Authorization header, if any"""
+        identity = url if auth is None else f"{url}\0{auth}"
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def get(self, url: str, auth: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for a URL and mark it recently used"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            key = self.make_key(url, auth)
+            row = conn.execute(
+                "SELECT status, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= ACCESS_FLUSH_EVERY:
+                self._flush_access(conn)
+                conn.commit()
+            return {'status': row[0], 'headers': json.loads(row[1]), 'body': row[2]}
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes,
+            auth: Optional[str] = None) -> None:
+        """Store a response body, evicting least recently used entries if needed"""
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            key = self.make_key(url, auth)
+            self._accessed.pop(key, None)
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(headers), body, size, time.time())
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def record(self, hit: bool) -> None:
+        """Count a revalidated hit or a miss"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _flush_access(self, conn: sqlite3.Connection) -> None:
+        """Write the access times of entries served since the last flush"""
+        if self._accessed:
+            conn.executemany("UPDATE responses SET last_access = ? WHERE key = ?",
+                             [(accessed, key) for key, accessed in self._accessed.items()])
+            self._accessed.clear()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        self._flush_access(conn)
+        rows = conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._flush_access(self._conn)
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
+
+
+class CachedSession(requests.Session):
+    """requests.Session that revalidates GETs against an HTTPCache.
+
+    A cached entry is never served blindly: the request is sent with
+    If-None-Match / If-Modified-Since and a 304 answer is turned back into
+    the stored 200 response.
+    """
+
+    def __init__(self, cache: Optional[HTTPCache] = None):
+        super().__init__()
+        self.cache = cache if cache is not None else get_http_cache()
+
+    def request(self, method, url, **kwargs):
+        if not self._is_cacheable(method, kwargs):
+            return super().request(method, url, **kwargs)
+
+        # Prepared with the session's auth, so per-host tokens are part of the key
+        prepared = self.prepare_request(requests.Request(
+            'GET', url, params=kwargs.get('params'), headers=kwargs.get('headers'), auth=kwargs.get('auth')))
+        full_url = prepared.url
+        auth = prepared.headers.get('Authorization')
+        entry = self.cache.get(full_url, auth)
+
+        if entry is not None:
+            headers = dict(kwargs.get('headers') or {})
+            if entry['headers'].get('etag'):
+                headers['If-None-Match'] = entry['headers']['etag']
+            if entry['headers'].get('last-modified'):
+                headers['If-Modified-Since'] = entry['headers']['last-modified']
+            kwargs['headers'] = headers
+
+        response = super().request(method, url, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.record(hit=True)
+            return self._build_response(entry, response)
+
+        self.cache.record(hit=False)
+        if response.status_code == 200:
+            stored = {k: response.headers[k] for k in STORED_HEADERS if k in response.headers}
+            if 'etag' in stored or 'last-modified' in stored:
+                self.cache.put(full_url, response.status_code, stored, response.content, auth)
+        return response
+
+    def _is_cacheable(self, method: str, kwargs: Dict[str, Any]) -> bool:
+        if self.cache is None or method.upper() != 'GET' or kwargs.get('stream'):
+            return False
+        headers = kwargs.get('headers') or {}
+        # Partial content and caller-driven conditionals are left alone
+        return not any(h.lower() in ('range', 'if-none-match', 'if-modified-since')
+                       for h in headers)
+
+    @staticmethod
+    def _build_response(entry: Dict[str, Any], revalidation: requests.Response) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body']
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = revalidation.url
+        response.request = revalidation.request
+        response.reason = 'OK'
+        response.from_cache = True
+        return response
+
+
+_default_cache: Optional[HTTPCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """Return the process-wide HTTP cache, or None if disabled by config"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            config = Config()
+            if not config.http_cache_enabled:
+                return None
+            _default_cache = HTTPCache(config.http_cache_dir, config.http_cache_max_bytes)
+        return _default_cache
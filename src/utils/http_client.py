@@ -0,0 +1,231 @@
+# src/utils/http_client.py
+"""
+Process-wide pooled HTTP client shared by the parser, utilities and metrics
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, wait, FIRST_COMPLETED
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+
+from .config import Config
+from .http_cache import CachedSession, HTTPCache
+from .logger import setup_logger
+from .rate_limiter import DEFAULT_RATE_LIMITS, RateLimiter, parse_rate_limits
+from .retry import LatencyTracker, RequestStats, RetryPolicy
+
+# Distinct hosts we talk to (huggingface.co, api.github.com, LFS CDN, ...)
+POOL_CONNECTIONS = 10
+RANGE_CHUNK_SIZE = 64 * 1024
+
+class HostTokenAuth(AuthBase):
+    """Attach the API token that belongs to the request's host"""
+
+    def __init__(self, config: Config):
+        self.config = config
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        headers = self.config.get_headers(request.url)
+        if 'Authorization' in headers and 'Authorization' not in request.headers:
+            request.headers['Authorization'] = headers['Authorization']
+        return request
+
+
+class HTTPClient(CachedSession):
+    """Cached session with connection pools sized for concurrent metric threads.
+
+    Connections are kept alive in per-host pools, so repeated calls to
+    huggingface.co or api.github.com reuse an open TLS connection instead
+    of paying a new handshake per request. At most Config.max_in_flight
+    requests are on the wire at once, whichever engine issues them, and
+    every request first waits for its host's rate limiter. Throttled
+    replies (429, or 403 with an exhausted GitHub quota) pause the host
+    and are re-sent instead of being handed back to the metrics.
+
+    Idempotent requests that fail with a connection error, a timeout or a
+    5xx are retried with jittered exponential backoff. With hedging on, a
+    GET still unanswered after the host's p95 latency gets a duplicate,
+    and whichever copy answers first wins.
+    """
+
+    def __init__(self, config: Optional[Config] = None, cache: Optional[HTTPCache] = None,
+                 pool_size: Optional[int] = None, rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        super().__init__(cache)
+        self.logger = setup_logger()
+        self.config = config or Config()
+        self.rate_limiter = rate_limiter or RateLimiter(
+            {**DEFAULT_RATE_LIMITS, **parse_rate_limits(self.config.rate_limits)},
+            max_pause=self.config.rate_limit_max_wait
+        )
+        self.pool_size = pool_size or max(self.config.max_workers, self.config.max_in_flight)
+        self._in_flight = threading.BoundedSemaphore(self.config.max_in_flight)
+        self._local = threading.local()
+
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=self.config.http_retries, backoff_base=self.config.http_backoff_base
+        )
+        self.request_stats = RequestStats()
+        self.sleep = time.sleep
+        self._latencies: Dict[str, LatencyTracker] = {}
+        self._latencies_lock = threading.Lock()
+        self._hedge_executor = None
+        if self.config.hedge_requests:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=self.pool_size * 2,
+                                                      thread_name_prefix='http-hedge')
+
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                              pool_maxsize=self.pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+        self.headers.update({'User-Agent': self.config.get_headers()['User-Agent']})
+        self.auth = HostTokenAuth(self.config)
+
+    def send(self, request, **kwargs):
+        # Redirects re-enter send() on the same thread while holding a slot
+        if getattr(self._local, 'holding_slot', False):
+            return super().send(request, **kwargs)
+
+        self.request_stats.add(requests=1)
+        attempt = 0
+        while True:
+            try:
+                response = self._send_hedged(request, kwargs)
+            except Exception as e:
+                if not self.retry_policy.should_retry_error(request.method, e, attempt):
+                    raise
+                self.logger.debug(f"Retrying {request.url} after error: {str(e)}")
+            else:
+                if not self.retry_policy.should_retry_response(request.method, response, attempt):
+                    return response
+                self.logger.debug(f"Retrying {request.url} after HTTP {response.status_code}")
+                response.close()
+
+            self.sleep(self.retry_policy.delay(attempt))
+            self.request_stats.add(retries=1)
+            attempt += 1
+
+    def latency_tracker(self, url: str) -> LatencyTracker:
+        host = RateLimiter.host_of(url)
+        with self._latencies_lock:
+            return self._latencies.setdefault(host, LatencyTracker())
+
+    def _hedge_delay(self, request, kwargs) -> Optional[float]:
+        """Seconds to wait before hedging this request, or None to never hedge"""
+        if self._hedge_executor is None or request.method.upper() != 'GET' or kwargs.get('stream'):
+            return None
+        tracker = self.latency_tracker(request.url)
+        if len(tracker) < self.config.hedge_min_samples:
+            return None
+        return tracker.percentile(self.config.hedge_percentile)
+
+    def _send_hedged(self, request, kwargs):
+        delay = self._hedge_delay(request, kwargs)
+        if delay is None:
+            return self._send_throttled(request, kwargs)
+
+        primary = self._hedge_executor.submit(self._send_throttled, request, kwargs)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeout:
+            pass
+
+        self.request_stats.add(hedges=1)
+        hedge = self._hedge_executor.submit(self._send_throttled, request.copy(), kwargs)
+
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winners = [future for future in done if future.exception() is None]
+            if winners:
+                winner = winners[0]
+                if winner is hedge:
+                    self.request_stats.add(hedge_wins=1)
+                # The losing copy cannot be cancelled mid-flight; release it when done
+                for loser in list(pending) + winners[1:]:
+                    loser.add_done_callback(_close_response)
+                return winner.result()
+            error = next(iter(done)).exception()
+        raise error
+
+    def _send_throttled(self, request, kwargs):
+        """Send once on the wire, honouring the rate limiter and in-flight cap"""
+        attempts = 0
+        while True:
+            # Wait for the host's bucket before taking an in-flight slot, so a
+            # paused host never blocks requests to other hosts
+            self.rate_limiter.acquire(request.url)
+            with self._in_flight:
+                self._local.holding_slot = True
+                started = time.monotonic()
+                try:
+                    response = super().send(request, **kwargs)
+                finally:
+                    self._local.holding_slot = False
+                self.request_stats.add(attempts=1)
+
+            delay = self.rate_limiter.observe(request.url, response)
+            if not self.rate_limiter.is_throttled(response):
+                self.latency_tracker(request.url).record(time.monotonic() - started)
+                return response
+            if attempts >= self.config.rate_limit_retries or (delay or 0) > self.config.rate_limit_max_wait:
+                self.logger.warning(f"Giving up on rate-limited request {request.url}")
+                return response
+            attempts += 1
+            response.close()
+
+
+def read_prefix(session: requests.Session, url: str, length: int, timeout: int = 10) -> bytes:
+    """Read at most the first `length` bytes of a remote file.
+
+    Servers that ignore the Range header answer 200 with the full body, so
+    the body is streamed and the connection dropped once enough is read.
+    """
+    return read_range(session, url, 0, length, timeout)
+
+
+def read_range(session: requests.Session, url: str, start: int, length: int, timeout: int = 10) -> bytes:
+    """Read at most `length` bytes of a remote file from offset `start`.
+
+    Past the start of the file a server that ignores the Range header is an
+    error, since honouring the read would mean downloading what precedes it.
+    """
+    response = session.get(url, headers={'Range': f'bytes={start}-{start + length - 1}'},
+                           stream=True, timeout=timeout)
+    try:
+        if response.status_code != 206 and not (response.status_code == 200 and start == 0):
+            raise requests.HTTPError(
+                f"Range read failed with HTTP {response.status_code}: {url}",
+                response=response
+            )
+        data = bytearray()
+        for chunk in response.iter_content(chunk_size=min(length, RANGE_CHUNK_SIZE)):
+            data += chunk
+            if len(data) >= length:
+                break
+        return bytes(data[:length])
+    finally:
+        response.close()
+
+
+def _close_response(future) -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+def get_http_client() -> HTTPClient:
+    """Return the shared HTTP client, creating it on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient()
+        return _client
@@ -0,0 +1,120 @@
+# src/utils/keyword_matcher.py
+"""
+Single-pass multi-keyword matching with section context
+"""
+
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+class KeywordMatcher:
+    """Find every occurrence of many keywords in one scan.
+
+    The keywords are merged into a trie (the goto structure of an
+    Aho-Corasick automaton) and compiled into a single regular expression,
+    so the scan runs inside the C regex engine rather than a Python loop.
+    Matching is plain substring matching, overlaps included: 'eval' is
+    found inside 'evaluation' just as `'eval' in text` would find it.
+    Markdown headings are picked up by the same scan to give each hit
+    its section.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms = frozenset(term for term in terms if term)
+        # Every term that is a prefix of (or equal to) a given term
+        self._prefixes = {
+            term: [other for other in self.terms if term.startswith(other)]
+            for term in self.terms
+        }
+        self._pattern = re.compile(
+            rf"(?=(?P<term>{self._trie_pattern(self.terms)}))"
+            r"|^(?=#{1,6}[ \t]*(?P<heading>[^\n]*))",
+            re.MULTILINE
+        )
+
+    @staticmethod
+    def _trie_pattern(terms: Iterable[str]) -> str:
+        trie: Dict[str, dict] = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def build(node: Dict[str, dict]) -> str:
+            branches = [re.escape(char) + build(child)
+                        for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            pattern = '(?:' + '|'.join(branches) + ')'
+            # A term ending here makes the longer continuations optional
+            return pattern + '?' if '' in node else pattern
+
+        return build(trie) if trie else '(?!)'
+
+    def scan(self, text: str) -> 'KeywordHits':
+        """Scan the text once and collect every keyword hit"""
+        positions: Dict[str, List[int]] = {}
+        headings: List[Tuple[int, str]] = []
+
+        for match in self._pattern.finditer(text):
+            longest = match.group('term')
+            if longest is not None:
+                # The regex reports the longest term starting here; shorter
+                # terms that start at the same place are its prefixes
+                for term in self._prefixes[longest]:
+                    positions.setdefault(term, []).append(match.start())
+            else:
+                headings.append((match.start(), match.group('heading').strip().rstrip('#').strip()))
+
+        return KeywordHits(self.terms, positions, headings)
+
+
+class KeywordHits:
+    """Result of one KeywordMatcher scan"""
+
+    def __init__(self, terms: frozenset, positions: Dict[str, List[int]],
+                 headings: List[Tuple[int, str]]):
+        self.terms = terms
+        self.positions = positions
+        self.headings = headings
+        self._heading_offsets = [offset for offset, _ in headings]
+
+    def _check(self, term: str) -> None:
+        if term not in self.terms:
+            raise KeyError(f"'{term}' is not a compiled keyword")
+
+    def __contains__(self, term: str) -> bool:
+        self._check(term)
+        return term in self.positions
+
+    def count(self, term: str) -> int:
+        """Number of occurrences of a term"""
+        self._check(term)
+        return len(self.positions.get(term, ()))
+
+    def found(self, terms: Iterable[str]) -> int:
+        """How many of the given terms occur at least once"""
+        return sum(1 for term in terms if term in self)
+
+    def any(self, terms: Iterable[str]) -> bool:
+        return any(term in self for term in terms)
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return {term: len(offsets) for term, offsets in self.positions.items()}
+
+    def section_at(self, offset: int) -> Optional[str]:
+        """Heading of the section containing a text offset, if any"""
+        index = bisect.bisect_right(self._heading_offsets, offset) - 1
+        return self.headings[index][1] if index >= 0 else None
+
+    def sections(self, term: str) -> List[str]:
+        """Headings of the sections a term occurs in, in document order"""
+        self._check(term)
+        seen: List[str] = []
+        for offset in self.positions.get(term, ()):
+            section = self.section_at(offset)
+            if section is not None and section not in seen:
+                seen.append(section)
+        return seen
@@ -0,0 +1,56 @@
+# src/utils/ndjson.py
+"""
+Streaming NDJSON output
+"""
+
+import json
+import sys
+import threading
+from typing import Any, Dict, Optional, TextIO
+
+class NDJSONWriter:
+    """Write result records as NDJSON lines as soon as they are ready.
+
+    In ordered mode records are tagged with their input position and held
+    in a small reorder buffer until every earlier position has been
+    written. A position whose record is None (a model that failed) is
+    skipped without producing a line.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, ordered: bool = False):
+        self.stream = stream or sys.stdout
+        self.ordered = ordered
+        self.lines_written = 0
+
+        self._next_index = 0
+        self._buffer: Dict[int, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def write(self, index: int, record: Optional[Dict[str, Any]]) -> None:
+        """Emit a record, or buffer it until its turn in ordered mode"""
+        with self._lock:
+            if not self.ordered:
+                self._emit(record)
+                return
+
+            self._buffer[index] = record
+            while self._next_index in self._buffer:
+                self._emit(self._buffer.pop(self._next_index))
+                self._next_index += 1
+
+    def close(self) -> None:
+        """Flush anything still buffered, in input order"""
+        with self._lock:
+            for index in sorted(self._buffer):
+                self._emit(self._buffer.pop(index))
+
+    @property
+    def buffered(self) -> int:
+        return len(self._buffer)
+
+    def _emit(self, record: Optional[Dict[str, Any]]) -> None:
+        if record is None:
+            return
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
+        self.lines_written += 1
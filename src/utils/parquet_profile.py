@@ -0,0 +1,218 @@
+# src/utils/parquet_profile.py
+"""
+Profile a bounded sample of a parquet file: its footer and first row groups
+"""
+
+import io
+import json
+import math
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import requests
+
+from .http_client import read_range
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # optional; datasets are simply not profiled without it
+    pa = pc = pq = None
+
+# Version of the profile stored in the blob cache; bump when it changes
+PROFILE_KIND = 'parquet-profile:1'
+# Rows profiled per file, taken from at most this many leading row groups
+MAX_SAMPLE_ROWS = 10000
+MAX_ROW_GROUPS = 4
+# Smallest HTTP Range request; the parquet reader's small footer reads share one
+RANGE_BLOCK_BYTES = 1024 * 1024
+# Column names that usually hold a classification target
+LABEL_COLUMNS = ('label', 'labels', 'class', 'target', 'category')
+# A column with more distinct values than this is not a label
+MAX_LABEL_CLASSES = 1000
+
+def available() -> bool:
+    """Whether the optional pyarrow dependency is installed"""
+    return pq is not None
+
+
+class RangeFile(io.RawIOBase):
+    """Read-only, seekable remote file backed by HTTP Range requests.
+
+    Only the byte ranges the parquet reader asks for are downloaded. Reads
+    are widened to RANGE_BLOCK_BYTES (towards the start of the file when
+    near its end) and the last block is kept, so the footer length and the
+    footer itself come from a single request.
+    """
+
+    def __init__(self, session: requests.Session, url: str, size: int, timeout: int = 10):
+        super().__init__()
+        self.session = session
+        self.url = url
+        self.size = size
+        self.timeout = timeout
+        self.position = 0
+        self.bytes_read = 0
+        self._block_start = 0
+        self._block = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self.position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), self.size - self.position)
+        if length <= 0:
+            return 0
+        end = self.position + length
+        if not (self._block_start <= self.position and end <= self._block_start + len(self._block)):
+            start = min(self.position, max(0, self.size - RANGE_BLOCK_BYTES))
+            fetch = min(max(end - start, RANGE_BLOCK_BYTES), self.size - start)
+            self._block = read_range(self.session, self.url, start, fetch, self.timeout)
+            self._block_start = start
+            self.bytes_read += len(self._block)
+
+        offset = self.position - self._block_start
+        data = self._block[offset:offset + length]
+        buffer[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+
+def profile_parquet(source: Any, budget: int = 32 * 1024 * 1024) -> Dict[str, Any]:
+    """Profile the leading row groups of a parquet path or file object.
+
+    Row groups are read while their uncompressed size stays within budget,
+    so memory is bounded even for files with huge row groups; when the first
+    group alone is too large only the footer statistics are reported.
+    """
+    parquet = pq.ParquetFile(source)
+    metadata = parquet.metadata
+
+    groups: List[int] = []
+    rows = 0
+    size = 0
+    for index in range(min(metadata.num_row_groups, MAX_ROW_GROUPS)):
+        row_group = metadata.row_group(index)
+        if rows >= MAX_SAMPLE_ROWS or size + row_group.total_byte_size > budget:
+            break
+        groups.append(index)
+        rows += row_group.num_rows
+        size += row_group.total_byte_size
+
+    if groups:
+        table = parquet.read_row_groups(groups).slice(0, MAX_SAMPLE_ROWS)
+    else:
+        table = parquet.schema_arrow.empty_table()
+    profile = profile_table(table)
+    profile['num_rows'] = metadata.num_rows
+    return profile
+
+
+def profile_table(table: 'pa.Table') -> Dict[str, Any]:
+    """Null, duplicate, text length and label statistics of an Arrow table"""
+    rows = table.num_rows
+    profile: Dict[str, Any] = {
+        'sampled_rows': rows,
+        'columns': table.num_columns,
+        'null_rate': None,
+        'duplicate_rate': None,
+        'text_length': None,
+        'empty_text_rate': None,
+        'label_balance': None,
+        'label_classes': 0,
+    }
+    if rows == 0 or table.num_columns == 0:
+        return profile
+
+    profile['null_rate'] = sum(column.null_count for column in table.columns) / (rows * table.num_columns)
+    profile['duplicate_rate'] = _duplicate_rate(table)
+
+    lengths = _text_lengths(table)
+    if lengths is not None and len(lengths):
+        p5, p50, p95 = np.percentile(lengths, [5, 50, 95])
+        profile['text_length'] = {'p5': float(p5), 'p50': float(p50), 'p95': float(p95),
+                                  'mean': float(lengths.mean())}
+        profile['empty_text_rate'] = float((lengths == 0).mean())
+
+    counts = _label_counts(table)
+    if counts is not None:
+        profile['label_classes'] = len(counts)
+        profile['label_balance'] = _balance(counts)
+    return profile
+
+
+def _duplicate_rate(table: 'pa.Table') -> Optional[float]:
+    """Share of rows repeating an earlier row, over the hashable columns"""
+    keys = [field.name for field in table.schema if not pa.types.is_nested(field.type)]
+    if not keys:
+        return None
+    distinct = table.select(keys).group_by(keys).aggregate([]).num_rows
+    return 1.0 - distinct / table.num_rows
+
+
+def _text_lengths(table: 'pa.Table') -> Optional[np.ndarray]:
+    """Character lengths of every non-null value of the string columns"""
+    lengths = [
+        pc.utf8_length(pc.drop_null(column)).to_numpy()
+        for field, column in zip(table.schema, table.columns)
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type)
+    ]
+    if not lengths:
+        return None
+    return np.concatenate(lengths)
+
+
+def _label_counts(table: 'pa.Table') -> Optional[np.ndarray]:
+    """Class sizes of the label column: a datasets ClassLabel, or a label-like name"""
+    labels = _class_label_columns(table.schema)
+    labels += [field.name for field in table.schema
+               if field.name.lower() in LABEL_COLUMNS and field.name not in labels]
+    for name in labels:
+        column = table.column(name)
+        if pa.types.is_nested(column.type) or pa.types.is_floating(column.type):
+            continue
+        counts = pc.value_counts(pc.drop_null(column)).field('counts').to_numpy()
+        if 0 < len(counts) <= MAX_LABEL_CLASSES:
+            return counts
+    return None
+
+
+def _class_label_columns(schema: 'pa.Schema') -> List[str]:
+    """Columns the datasets library declared as ClassLabel in the schema metadata"""
+    try:
+        metadata = json.loads((schema.metadata or {}).get(b'huggingface', b'{}'))
+        features = metadata.get('info', {}).get('features', {})
+        return [name for name, feature in features.items()
+                if isinstance(feature, dict) and feature.get('_type') == 'ClassLabel'
+                and name in schema.names]
+    except (ValueError, AttributeError):
+        return []
+
+
+def _balance(counts: np.ndarray) -> float:
+    """Normalised entropy of the class sizes: 1.0 balanced, 0.0 a single class"""
+    if len(counts) < 2:
+        return 0.0
+    shares = counts / counts.sum()
+    return float(-(shares * np.log(shares)).sum() / math.log(len(counts)))
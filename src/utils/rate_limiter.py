@@ -0,0 +1,200 @@
+# src/utils/rate_limiter.py
+"""
+Per-host token-bucket rate limiting driven by server rate-limit headers
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from .logger import setup_logger
+
+# Requests per second and burst size for hosts we know about
+DEFAULT_RATE_LIMITS = {
+    'huggingface.co': (10.0, 20.0),
+    'api.github.com': (5.0, 10.0),
+}
+DEFAULT_HOST_LIMIT = (20.0, 40.0)
+
+class TokenBucket:
+    """Classic token bucket that can also be paused until a deadline"""
+
+    def __init__(self, rate: float, capacity: float,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping as long as needed; returns the time waited"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                else:
+                    delay = (1.0 - self._tokens) / self.rate
+            self.sleep(delay)
+            waited += delay
+
+    def pause_until(self, deadline: float) -> None:
+        """Hold back every caller until the (monotonic) deadline passes"""
+        with self._lock:
+            if deadline > self._paused_until:
+                self._paused_until = deadline
+                self._tokens = 0.0
+
+
+class RateLimiter:
+    """Shared scheduler that keeps one token bucket per host.
+
+    Responses are fed back through observe(): Retry-After and an exhausted
+    X-RateLimit-Remaining pause the host until the server says it may be
+    called again, so callers wait instead of receiving a throttled reply.
+    A pause is cut to max_pause seconds: callers give up on waits longer
+    than that, and a reset an hour away must not stall the host meanwhile.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None,
+                 default: Tuple[float, float] = DEFAULT_HOST_LIMIT,
+                 clock: Callable[[], float] = time.monotonic,
+                 wall_clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep,
+                 max_pause: Optional[float] = None):
+        self.logger = setup_logger()
+        self.limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self.max_pause = max_pause
+        self.default = default
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.sleep = sleep
+
+        self.throttled = 0
+        self.total_wait = 0.0
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return (urlparse(url).hostname or '').lower()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._limit_for(host)
+                bucket = TokenBucket(rate, burst, self.clock, self.sleep)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _limit_for(self, host: str) -> Tuple[float, float]:
+        for known_host, limit in self.limits.items():
+            if host == known_host or host.endswith('.' + known_host):
+                return limit
+        return self.default
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to this URL's host may be sent"""
+        waited = self.bucket_for(url).acquire()
+        if waited:
+            with self._lock:
+                self.total_wait += waited
+
+    def observe(self, url: str, response) -> Optional[float]:
+        """Update the host's schedule from a response.
+
+        Returns the number of seconds the server asked to wait, or None if
+        the response carried no back-off instruction. The host itself is
+        paused for at most max_pause seconds.
+        """
+        delay = self.backoff_delay(response)
+        if delay is None:
+            return None
+        if self.is_throttled(response):
+            with self._lock:
+                self.throttled += 1
+            self.logger.warning(f"Rate limited by {self.host_of(url)}, pausing {delay:.1f}s")
+        pause = delay if self.max_pause is None else min(delay, self.max_pause)
+        self.bucket_for(url).pause_until(self.clock() + pause)
+        return delay
+
+    def backoff_delay(self, response) -> Optional[float]:
+        """Seconds to wait according to Retry-After / X-RateLimit-* headers"""
+        headers = response.headers
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            delay = self._parse_retry_after(retry_after)
+            if delay is not None:
+                return delay
+
+        remaining = headers.get('X-RateLimit-Remaining', headers.get('RateLimit-Remaining'))
+        reset = headers.get('X-RateLimit-Reset', headers.get('RateLimit-Reset'))
+        try:
+            if remaining is not None and reset is not None and int(remaining) <= 0:
+                reset_value = float(reset)
+                # GitHub sends an epoch timestamp, the IETF draft a delta in seconds
+                if reset_value > 1e9:
+                    return max(0.0, reset_value - self.wall_clock())
+                return max(0.0, reset_value)
+        except (TypeError, ValueError):
+            pass
+
+        if response.status_code == 429:
+            return 1.0
+        return None
+
+    def _parse_retry_after(self, value: str) -> Optional[float]:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - self.wall_clock())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def is_throttled(response) -> bool:
+        """Whether the server refused the request because of rate limiting"""
+        if response.status_code == 429:
+            return True
+        if response.status_code == 403:
+            remaining = response.headers.get('X-RateLimit-Remaining')
+            return remaining is not None and remaining.strip() == '0'
+        return False
+
+    def stats(self) -> Dict[str, float]:
+        return {'throttled': self.throttled, 'wait_seconds': round(self.total_wait, 3)}
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """Parse 'host=rate/burst,host=rate' into a limits table"""
+    limits: Dict[str, Tuple[float, float]] = {}
+    for item in spec.split(','):
+        if '=' not in item:
+            continue
+        host, value = item.split('=', 1)
+        rate_text, _, burst_text = value.partition('/')
+        rate = float(rate_text)
+        burst = float(burst_text) if burst_text else max(1.0, rate)
+        limits[host.strip().lower()] = (rate, burst)
+    return limits
@@ -0,0 +1,149 @@
+# src/utils/repo_history.py
+"""
+Maintainer statistics from a repository's commit graph, read from a blobless clone
+"""
+
+import os
+import tempfile
+from collections import Counter, defaultdict
+from typing import Any, Dict, Optional, Set
+
+try:
+    import git
+except ImportError:  # optional; without GitPython repo history is not analysed
+    git = None
+
+# Version of the history summary stored in the blob cache; bump when it changes
+HISTORY_KIND = 'repo-history:1'
+# Commits of history cloned and analysed, newest first
+MAX_COMMITS = 1000
+# Per-author last commit times kept in the summary
+MAX_AUTHORS = 100
+# Seconds any single git command may run
+GIT_TIMEOUT = 120
+# A project stalls once the owners of more than this share of its files are gone
+ORPHANED_SHARE = 0.5
+# git never prompts for credentials; a private or missing repo fails instead of hanging
+GIT_ENV = {'GIT_TERMINAL_PROMPT': '0', 'GIT_ASKPASS': ''}
+# stderr of git commands that failed because the remote wants credentials
+AUTH_ERRORS = ('terminal prompts disabled', 'could not read username', 'could not read password',
+               'authentication failed', 'permission denied', 'repository not found')
+
+def available() -> bool:
+    """Whether the optional GitPython dependency is installed"""
+    return git is not None
+
+
+def _git_env() -> Dict[str, str]:
+    return {**os.environ, **GIT_ENV}
+
+
+def _auth_failed(error: Exception) -> bool:
+    """Whether a git command failed because the remote asked for credentials"""
+    stderr = str(getattr(error, 'stderr', '') or '').lower()
+    return any(marker in stderr for marker in AUTH_ERRORS)
+
+
+def remote_head(url: str, timeout: int = GIT_TIMEOUT) -> Optional[str]:
+    """Commit sha of a remote repository's HEAD, without cloning it.
+
+    None when the repository is empty or requires credentials.
+    """
+    try:
+        output = git.Git().ls_remote(url, 'HEAD', env=_git_env(), kill_after_timeout=timeout)
+    except git.GitCommandError as e:
+        if _auth_failed(e):
+            return None
+        raise
+    return output.split()[0] if output else None
+
+
+def analyze_history(url: str, max_commits: int = MAX_COMMITS,
+                    timeout: int = GIT_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """Summarise who maintains a repository from its recent commit graph.
+
+    The clone is bare, shallow (max_commits deep) and partial with
+    --filter=blob:none: commits and trees are downloaded, file contents
+    never are. Authors are identified by email but only counts and times
+    are returned. None when the repository requires credentials.
+    """
+    with tempfile.TemporaryDirectory(prefix='ml-eval-history-') as path:
+        env = _git_env()
+        try:
+            git.Git().clone('--bare', '--filter=blob:none', f'--depth={max_commits}', '--no-tags',
+                            '--single-branch', '--', url, path, env=env, kill_after_timeout=timeout)
+        except git.GitCommandError as e:
+            if _auth_failed(e):
+                return None
+            raise
+        log = git.Git(path).log(f'-n{max_commits}', '--no-renames', '--name-only',
+                                '--format=%x00%H%x09%ae%x09%at', env=env, kill_after_timeout=timeout)
+        return summarize_log(log, _shallow_commits(path))
+
+
+def _shallow_commits(path: str) -> Set[str]:
+    """Boundary commits of a shallow clone; their parents are missing"""
+    try:
+        with open(os.path.join(path, 'shallow'), 'r', encoding='ascii') as f:
+            return {line.strip() for line in f if line.strip()}
+    except OSError:
+        return set()
+
+
+def summarize_log(log: str, boundary: Set[str] = frozenset()) -> Dict[str, Any]:
+    """Author concentration, last commit times and truck factor of a git log.
+
+    log is the output of `git log --name-only --format=%x00%H%x09%ae%x09%at`.
+    The files of boundary commits are ignored: without a parent every file
+    in the tree would look like it was written by that commit's author.
+    """
+    commits: Counter = Counter()
+    last_commit: Dict[str, int] = {}
+    file_authors: Dict[str, Counter] = defaultdict(Counter)
+
+    for record in log.split('\x00'):
+        lines = record.strip('\n').split('\n')
+        fields = lines[0].split('\t')
+        if len(fields) != 3:
+            continue
+        sha, author, timestamp = fields[0], fields[1].lower(), int(fields[2])
+        commits[author] += 1
+        last_commit[author] = max(last_commit.get(author, 0), timestamp)
+        if sha in boundary:
+            continue
+        for path in lines[1:]:
+            if path:
+                file_authors[path][author] += 1
+
+    total = sum(commits.values())
+    return {
+        'commits': total,
+        'authors': len(commits),
+        'top_author_share': max(commits.values()) / total if total else 0.0,
+        'last_commits': sorted(last_commit.values(), reverse=True)[:MAX_AUTHORS],
+        'truck_factor': truck_factor(file_authors),
+    }
+
+
+def truck_factor(file_authors: Dict[str, Counter]) -> int:
+    """Fewest authors whose departure orphans most of the files.
+
+    A file is owned by every author with at least half as many commits to
+    it as its top author. Owners of the most remaining files are removed
+    greedily until more than ORPHANED_SHARE of the files have no owner left.
+    """
+    owners = []
+    for counts in file_authors.values():
+        top = max(counts.values())
+        owners.append({author for author, count in counts.items() if count * 2 >= top})
+    if not owners:
+        return 0
+
+    removed: Set[str] = set()
+    while True:
+        remaining = [owner - removed for owner in owners]
+        orphaned = sum(1 for owner in remaining if not owner)
+        if orphaned > len(owners) * ORPHANED_SHARE:
+            return len(removed)
+        coverage = Counter(author for owner in remaining for author in owner)
+        removed.add(coverage.most_common(1)[0][0])
@@ -0,0 +1,95 @@
+# src/utils/retry.py
+"""
+Retry policy with exponential backoff and jitter, plus latency tracking
+used to decide when to hedge a slow request
+"""
+
+import random
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, Optional
+
+import requests
+
+# Statuses that usually mean "try again", not "this resource is missing"
+RETRY_STATUSES = (500, 502, 503, 504)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for idempotent requests"""
+
+    def __init__(self, max_retries: int = 2, backoff_base: float = 0.5,
+                 backoff_max: float = 8.0, retry_statuses: Iterable[int] = RETRY_STATUSES,
+                 rng: Callable[[], float] = random.random):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = tuple(retry_statuses)
+        self.rng = rng
+
+    def delay(self, attempt: int) -> float:
+        """Sleep before retry number `attempt` (0-based): U(0, base * 2^attempt)"""
+        return self.rng() * min(self.backoff_max, self.backoff_base * (2 ** attempt))
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS and attempt < self.max_retries
+
+    def should_retry_response(self, method: str, response, attempt: int) -> bool:
+        return self.can_retry(method, attempt) and response.status_code in self.retry_statuses
+
+    def should_retry_error(self, method: str, error: Exception, attempt: int) -> bool:
+        retryable = isinstance(error, (requests.ConnectionError, requests.Timeout))
+        return retryable and self.can_retry(method, attempt)
+
+
+class LatencyTracker:
+    """Thread-safe sliding window of latencies (seconds) with percentiles"""
+
+    def __init__(self, window: Optional[int] = 1000):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Nearest-rank percentile, or None with no samples"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(0, min(len(samples) - 1, int(round(p / 100.0 * len(samples))) - 1))
+        return samples[rank]
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        return {f"p{p}": self.percentile(p) for p in (50, 95, 99)}
+
+
+class RequestStats:
+    """Counters describing how retries and hedges behaved during a run"""
+
+    def __init__(self):
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'requests': self.requests,
+            'attempts': self.attempts,
+            'retries': self.retries,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+        }
@@ -0,0 +1,63 @@
+# src/utils/safetensors.py
+"""
+Read safetensors headers over HTTP Range requests without downloading weights
+"""
+
+import json
+import struct
+from typing import Any, Dict
+
+import requests
+
+from .http_client import read_prefix
+
+# Bytes per element for each safetensors dtype
+DTYPE_BYTES = {
+    'F64': 8, 'I64': 8, 'U64': 8,
+    'F32': 4, 'I32': 4, 'U32': 4,
+    'F16': 2, 'BF16': 2, 'I16': 2, 'U16': 2,
+    'F8_E4M3': 1, 'F8_E5M2': 1, 'I8': 1, 'U8': 1, 'BOOL': 1,
+}
+
+# First read; covers the whole header of almost every file in one request
+PREFETCH_BYTES = 64 * 1024
+# The format allows up to 100MB, but a header this large is not worth reading
+MAX_HEADER_BYTES = 16 * 1024 * 1024
+
+def read_header(session: requests.Session, url: str, timeout: int = 10) -> Dict[str, Any]:
+    """Fetch and decode the JSON header of a remote .safetensors file"""
+    data = read_prefix(session, url, PREFETCH_BYTES, timeout)
+    if len(data) < 8:
+        raise ValueError(f"Not a safetensors file: {url}")
+
+    header_len = struct.unpack('<Q', data[:8])[0]
+    if header_len > MAX_HEADER_BYTES:
+        raise ValueError(f"Safetensors header too large ({header_len} bytes): {url}")
+    if len(data) < 8 + header_len:
+        data = read_prefix(session, url, 8 + header_len, timeout)
+        if len(data) < 8 + header_len:
+            raise ValueError(f"Truncated safetensors header: {url}")
+
+    header = json.loads(data[8:8 + header_len].decode('utf-8'))
+    if not isinstance(header, dict):
+        raise ValueError(f"Invalid safetensors header: {url}")
+    return header
+
+
+def count_parameters(header: Dict[str, Any]) -> Dict[str, int]:
+    """Number of parameters per dtype described by a safetensors header"""
+    counts: Dict[str, int] = {}
+    for name, tensor in header.items():
+        if name == '__metadata__' or not isinstance(tensor, dict):
+            continue
+        elements = 1
+        for dim in tensor.get('shape', []):
+            elements *= int(dim)
+        dtype = tensor.get('dtype', 'F32')
+        counts[dtype] = counts.get(dtype, 0) + elements
+    return counts
+
+
+def parameter_bytes(counts: Dict[str, int]) -> int:
+    """Bytes needed to hold the parameters in their stored dtypes"""
+    return sum(count * DTYPE_BYTES.get(dtype, 4) for dtype, count in counts.items())
@@ -0,0 +1,61 @@
+# src/utils/weight_profiles.py
+"""
+Named net score weight profiles loaded from a YAML or JSON file
+"""
+
+import re
+from typing import Dict, Iterable
+
+import yaml
+
+from .logger import setup_logger
+
+PROFILE_NAME = re.compile(r'^[a-z0-9_]+$')
+
+def load_weight_profiles(path: str, metrics: Iterable[str]) -> Dict[str, Dict[str, float]]:
+    """Read {profile: {metric: weight}} from a file.
+
+    The file maps profile names to metric weights, e.g.
+
+        security:
+          license: 0.5
+          bus_factor: 0.3
+          code_quality: 0.2
+
+    JSON is valid YAML, so either format works. Each profile is reported
+    as net_score_<profile>. Profiles with invalid names, unknown metrics or
+    non-numeric weights are skipped with a warning; a missing or unreadable
+    file yields no profiles.
+    """
+    logger = setup_logger()
+    metrics = set(metrics)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.error(f"Loading weight profiles from {path} failed: {str(e)}")
+        return {}
+    if not isinstance(data, dict):
+        logger.error(f"Weight profiles in {path} must be a mapping of profile names to weights")
+        return {}
+
+    profiles = {}
+    for name, weights in data.items():
+        name = str(name)
+        if not PROFILE_NAME.match(name) or name == 'latency':
+            logger.warning(f"Skipping weight profile '{name}': use lowercase letters, digits and '_' "
+                           "(and not 'latency')")
+            continue
+        if not isinstance(weights, dict) or not weights:
+            logger.warning(f"Skipping weight profile '{name}': expected a mapping of metric weights")
+            continue
+        unknown = [metric for metric in weights if metric not in metrics]
+        if unknown:
+            logger.warning(f"Skipping weight profile '{name}': unknown metrics {', '.join(map(str, unknown))}")
+            continue
+        if not all(isinstance(weight, (int, float)) and not isinstance(weight, bool) and weight >= 0
+                   for weight in weights.values()):
+            logger.warning(f"Skipping weight profile '{name}': weights must be non-negative numbers")
+            continue
+        profiles[name] = {metric: float(weight) for metric, weight in weights.items()}
+    return profiles
@@ -0,0 +1,27 @@
+# tests/conftest.py
+"""
+Shared test configuration
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+# The suite runs largely offline; don't spend backoff sleeps retrying
+# requests that can never succeed. Retry behaviour has its own tests.
+os.environ.setdefault('HTTP_RETRIES', '0')
+
+# Keep test responses and models out of the user's persistent caches; any
+# cache a test does open lands in a throwaway directory
+os.environ.setdefault('HTTP_CACHE', '0')
+os.environ.setdefault('FEATURE_STORE', '0')
+os.environ.setdefault('BLOB_CACHE', '0')
+
+_cache_dir = tempfile.mkdtemp(prefix='ml-evaluator-tests-')
+atexit.register(shutil.rmtree, _cache_dir, ignore_errors=True)
+os.environ.setdefault('ML_EVAL_CACHE_DIR', _cache_dir)
+
+# No git clones of real repositories; history analysis is tested on local repos
+os.environ.setdefault('REPO_HISTORY', '0')
+os.environ.setdefault('COMMIT_HISTORY', '0')
@@ -91,7 +91,7 @@ class TestLicenseMetricComprehensive:
         result = metric.calculate(model_info)
         assert result == 0.1, f"Unknown license should score 0.1, got {result}"
     
-    @patch('src.metrics.license_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_license_metric_readme_parsing(self, mock_get):
         """Test license parsing from README"""
         metric = LicenseMetric()
@@ -191,7 +191,7 @@ class TestSizeMetricComprehensive:
             last_modified=None
         )
         
-        with patch('src.metrics.size_metric.requests.Session.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = []
@@ -288,7 +288,7 @@ class TestPerformanceMetricComprehensive:
         # Model with structured results should get good score
         assert result > 0.3
     
-    @patch('src.metrics.performance_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_performance_with_readme_benchmarks(self, mock_get):
         """Test performance with README benchmarks"""
         metric = PerformanceMetric()
@@ -367,7 +367,7 @@ class TestDatasetCodeMetricComprehensive:
         # Model with dataset info should get good score
         assert result >= 0.3
     
-    @patch('src.metrics.dataset_code_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_dataset_code_with_readme(self, mock_get):
         """Test dataset code with README documentation"""
         metric = DatasetCodeMetric()
@@ -410,7 +410,7 @@ class TestDatasetCodeMetricComprehensive:
 class TestDatasetQualityMetricComprehensive:
     """Comprehensive tests for Dataset Quality Metric"""
     
-    @patch('src.metrics.dataset_quality_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_dataset_quality_with_readme(self, mock_get):
         """Test dataset quality with README"""
         metric = DatasetQualityMetric()
@@ -448,7 +448,7 @@ class TestDatasetQualityMetricComprehensive:
 class TestCodeQualityMetricComprehensive:
     """Comprehensive tests for Code Quality Metric"""
     
-    @patch('src.metrics.code_quality_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_code_quality_with_files(self, mock_get):
         """Test code quality with file analysis"""
         metric = CodeQualityMetric()
@@ -463,6 +463,9 @@ class TestCodeQualityMetricComprehensive:
             {'path': 'inference.py'},
             {'path': 'README.md'}
         ]
+        files_response.iter_content.return_value = [
+            json.dumps(files_response.json.return_value).encode()
+        ]
         
         # Mock file content response
         file_response = Mock()
@@ -498,7 +501,7 @@ class TestCodeQualityMetricComprehensive:
 class TestRampUpMetricComprehensive:
     """Comprehensive tests for Ramp Up Metric"""
     
-    @patch('src.metrics.rampup_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_rampup_with_readme(self, mock_get):
         """Test ramp up with README"""
         metric = RampUpMetric()
@@ -0,0 +1,112 @@
+# tests/test_artifacts.py
+"""
+Tests for the shared per-model artifact layer
+"""
+
+import pytest
+import json
+import sys
+import os
+from unittest.mock import Mock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.artifacts import ModelArtifacts
+from src.metrics.calculator import MetricsCalculator
+from src.models.model import ModelInfo
+
+
+def _make_response(url, **kwargs):
+    response = Mock()
+    response.status_code = 200
+    if url.endswith('README.md'):
+        response.text = "# Model\n\n## Usage\nTrained on Wikipedia. pip install transformers"
+    else:
+        response.iter_content.return_value = [json.dumps([
+            {'type': 'file', 'path': 'config.json', 'size': 100},
+            {'type': 'directory', 'path': 'weights', 'size': 0},
+            {'type': 'file', 'path': 'weights/model.safetensors', 'size': 134,
+             'lfs': {'oid': 'abc', 'size': 1024 ** 3}},
+        ]).encode()]
+        response.links = {}
+    return response
+
+
+class TestModelArtifacts:
+
+    def setup_method(self):
+        self.model_info = ModelInfo(
+            name="test/model",
+            url="https://huggingface.co/test/model",
+            api_data={}
+        )
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_readme_fetched_once(self, mock_get):
+        """README is downloaded once and lowercased once"""
+        mock_get.side_effect = _make_response
+        artifacts = ModelArtifacts(self.model_info)
+
+        assert artifacts.readme.startswith("# Model")
+        assert artifacts.readme_lower == artifacts.readme.lower()
+        assert artifacts.readme_lower is artifacts.readme_lower
+        assert mock_get.call_count == 1
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_failed_fetch_is_cached_as_none(self, mock_get):
+        """A non-200 response is remembered instead of retried by every metric"""
+        mock_get.return_value = Mock(status_code=404)
+        artifacts = ModelArtifacts(self.model_info)
+
+        assert artifacts.readme is None
+        assert artifacts.readme_lower is None
+        assert artifacts.readme is None
+        assert mock_get.call_count == 1
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_invalid_tree_payload(self, mock_get):
+        """A tree payload that is not a list is treated as missing"""
+        response = Mock(status_code=200)
+        response.iter_content.return_value = [b'{"error": "not found"}']
+        mock_get.return_value = response
+
+        assert ModelArtifacts(self.model_info).tree is None
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_tree_is_recursive_with_lfs_sizes(self, mock_get):
+        """Directories are dropped and LFS files report their real size"""
+        mock_get.side_effect = _make_response
+        tree = ModelArtifacts(self.model_info).tree
+
+        assert [item['path'] for item in tree] == ['config.json', 'weights/model.safetensors']
+        assert tree[1]['size'] == 1024 ** 3
+        assert mock_get.call_args.kwargs['params'] == {'recursive': 'true'}
+        assert mock_get.call_args.kwargs['stream'] is True
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_tree_from_siblings_skips_request(self, mock_get):
+        """Siblings hydrated by the URL parser replace the tree request"""
+        self.model_info.siblings = [
+            {'rfilename': 'config.json', 'size': 100, 'blobId': 'c1'},
+            {'rfilename': 'model.safetensors', 'size': 1024, 'blobId': 'w1',
+             'lfs': {'size': 1024}},
+        ]
+        tree = ModelArtifacts(self.model_info).tree
+
+        assert [item['path'] for item in tree] == ['config.json', 'model.safetensors']
+        assert tree[1]['oid'] == 'w1'
+        mock_get.assert_not_called()
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_calculator_shares_artifacts(self, mock_get):
+        """All metrics together fetch README and tree exactly once each"""
+        mock_get.side_effect = _make_response
+        calculator = MetricsCalculator()
+
+        result = calculator.calculate_all_metrics(self.model_info)
+
+        fetched = [call.args[0] for call in mock_get.call_args_list]
+        assert fetched.count(
+            "https://huggingface.co/test/model/raw/main/README.md") == 1
+        assert fetched.count(
+            "https://huggingface.co/api/models/test/model/tree/main") == 1
+        assert result["name"] == "test/model"
@@ -0,0 +1,116 @@
+# tests/test_async_engine.py
+"""
+Tests for the asyncio evaluation engine
+"""
+
+import asyncio
+import io
+import pytest
+import sys
+import os
+import threading
+from unittest.mock import patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.async_engine import AsyncEvaluator
+from src.metrics.calculator import MetricsCalculator
+from src.models.model import ModelInfo
+from src.utils.ndjson import NDJSONWriter
+
+
+def _model_info(url):
+    name = url.split('huggingface.co/')[1]
+    return ModelInfo(name=name, url=url, api_data={})
+
+
+class TestAsyncEvaluator:
+
+    def setup_method(self):
+        self.calculator = MetricsCalculator()
+        self.urls = [f"https://huggingface.co/test/model-{i}" for i in range(3)]
+
+    def _patch_metrics(self):
+        calc = self.calculator
+        return [
+            patch.object(calc.license_metric, 'calculate', return_value=1.0),
+            patch.object(calc.size_metric, 'calculate', return_value={
+                'raspberry_pi': 1.0, 'jetson_nano': 1.0, 'desktop_pc': 1.0, 'aws_server': 1.0}),
+            patch.object(calc.rampup_metric, 'calculate', return_value=0.5),
+            patch.object(calc.busfactor_metric, 'calculate', return_value=0.5),
+            patch.object(calc.performance_metric, 'calculate', return_value=0.5),
+            patch.object(calc.dataset_code_metric, 'calculate', return_value=0.5),
+            patch.object(calc.dataset_quality_metric, 'calculate', return_value=0.5),
+            patch.object(calc.code_quality_metric, 'calculate', return_value=0.5),
+        ]
+
+    def test_models_evaluated_concurrently(self):
+        """All models are in flight at once and results keep input order"""
+        barrier = threading.Barrier(len(self.urls), timeout=5)
+
+        def parse(url):
+            barrier.wait()  # only passes if every model is being parsed at once
+            return _model_info(url)
+
+        evaluator = AsyncEvaluator(metrics_calculator=self.calculator, max_in_flight=8)
+        patches = self._patch_metrics()
+        for p in patches:
+            p.start()
+        try:
+            with patch.object(evaluator.url_parser, 'parse_model_url', side_effect=parse):
+                results = evaluator.run(self.urls)
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert [r['name'] for r in results] == ["test/model-0", "test/model-1", "test/model-2"]
+        assert all(r['license'] == 1.0 for r in results)
+        assert all(0.0 <= r['net_score'] <= 1.0 for r in results)
+
+    def test_failed_parse_yields_none(self):
+        """A model that cannot be parsed does not abort the batch"""
+        evaluator = AsyncEvaluator(metrics_calculator=self.calculator)
+        with patch.object(evaluator.url_parser, 'parse_model_url', return_value=None):
+            assert evaluator.run(self.urls[:1]) == [None]
+
+    def test_streaming_window_bounds_reorder_buffer(self):
+        """A slow first model holds back at most a window of results in ordered mode"""
+        urls = [f"https://huggingface.co/test/model-{i}" for i in range(20)]
+        writer = NDJSONWriter(io.StringIO(), ordered=True)
+        evaluator = AsyncEvaluator(metrics_calculator=self.calculator, max_in_flight=2)
+        started = []
+        peak_buffered = 0
+
+        async def evaluate(url, executor):
+            nonlocal peak_buffered
+            started.append(url)
+            await asyncio.sleep(0.2 if url == urls[0] else 0.001)
+            peak_buffered = max(peak_buffered, writer.buffered)
+            return {'name': url}
+
+        with patch.object(evaluator, 'evaluate_model', side_effect=evaluate):
+            evaluator.run_streaming(urls, writer)
+
+        assert writer.lines_written == 20 and len(started) == 20
+        assert peak_buffered < 4  # window of 2 * max_in_flight
+
+    def test_async_matches_sync_schema(self):
+        """The coroutine calculator produces the same fields as the threaded one"""
+        import asyncio
+        model_info = _model_info(self.urls[0])
+        patches = self._patch_metrics()
+        for p in patches:
+            p.start()
+        try:
+            sync_result = self.calculator.calculate_all_metrics(model_info)
+            loop = asyncio.new_event_loop()
+            try:
+                async_result = loop.run_until_complete(
+                    self.calculator.calculate_all_metrics_async(model_info))
+            finally:
+                loop.close()
+        finally:
+            for p in patches:
+                p.stop()
+
+        assert set(sync_result) == set(async_result)
+        assert sync_result['net_score'] == async_result['net_score']
@@ -0,0 +1,108 @@
+# tests/test_batch_scoring.py
+"""
+Tests for the vectorised batch scorer
+"""
+
+import pytest
+import random
+import sys
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.calculator import MetricsCalculator
+
+LICENSES = ['mit', 'Apache-2.0', 'gpl-3.0', 'cc-by-4.0', 'llama2', None]
+
+
+def random_features(rng: random.Random) -> dict:
+    """Features shaped like those stored by the extractors"""
+    def signal():
+        return rng.choice([0.0, 0.1, 0.2, 0.3, 0.5, 0.7, 1.0, rng.random()])
+    age = timedelta(days=rng.randint(0, 800))
+    last_modified = rng.choice([
+        (datetime.now(timezone.utc) - age).isoformat().replace('+00:00', 'Z'), '', 'not a date'])
+    counts = rng.choice([None, {}, {'BF16': rng.randint(10 ** 6, 10 ** 11)}])
+    return {
+        'license': {'license': rng.choice(LICENSES)},
+        'size_score': {'size_gb': rng.choice([0.2, 0.9, 3.5, 15.0, 20.0, 90.0, rng.random() * 100]),
+                       'parameter_counts': counts},
+        'ramp_up_time': {'known_model': rng.random() < 0.3, 'readme': signal(), 'examples': signal(),
+                         'model_card': signal(), 'popularity': signal()},
+        'bus_factor': {'known_model': rng.random() < 0.3, 'last_modified': last_modified,
+                       'maintainers': signal(), 'community': signal(),
+                       'repo_history': rng.choice([None, {
+                           'commits': rng.randint(0, 500), 'top_author_share': rng.random(),
+                           'truck_factor': rng.randint(0, 6),
+                           # Half a day away from the activity window edge
+                           'last_commits': [time.time() - rng.randint(0, 400) * 86400 - 43200
+                                            for _ in range(rng.randint(0, 5))]}]),
+                       'commit_history': rng.choice([None, {
+                           'commits': rng.randint(0, 500), 'top_author_share': rng.random(),
+                           'last_commits': [time.time() - rng.randint(0, 400) * 86400 - 43200
+                                            for _ in range(rng.randint(0, 5))]}])},
+        'performance_claims': {'known_model': rng.random() < 0.3, 'model_index': signal(),
+                               'readme': signal(), 'tags': signal()},
+        'dataset_and_code_score': {'dataset_info': signal(), 'code_availability': signal()},
+        'dataset_quality': {'documentation': signal(), 'preprocessing': signal(), 'known_datasets': signal(),
+                            'sample_profile': rng.choice([None, {
+                                'null_rate': rng.random(), 'duplicate_rate': rng.choice([None, rng.random()]),
+                                'empty_text_rate': rng.choice([None, rng.random()]),
+                                'label_balance': rng.choice([None, rng.random()])}])},
+        'code_quality': {'known_model': rng.random() < 0.3, 'structure': signal(),
+                         'documentation': signal(), 'best_practices': signal()},
+    }
+
+
+class TestBatchScorer:
+
+    def setup_method(self):
+        self.calculator = MetricsCalculator(feature_store=Mock())
+
+    def _compare(self, entries):
+        batch = self.calculator.score_features_batch(entries)
+        single = [self.calculator.score_features(entry['name'], entry['features'], entry['latencies'])
+                  for entry in entries]
+        for record in batch + single:
+            record.pop('net_score_latency')
+        assert batch == single
+
+    def test_matches_per_model_scoring(self):
+        """Vectorised records equal the per-model ones exactly"""
+        rng = random.Random(7)
+        entries = [{'name': f'org/model-{index}', 'features': random_features(rng),
+                    'latencies': {'license': index}} for index in range(300)]
+
+        self._compare(entries)
+
+    def test_missing_and_malformed_features(self):
+        """Rows with missing or malformed features get the failure defaults"""
+        rng = random.Random(1)
+        broken = [random_features(rng) for _ in range(4)]
+        del broken[0]['ramp_up_time']
+        broken[1]['size_score']['size_gb'] = None
+        broken[2]['code_quality'] = {'structure': 0.5}
+        broken[3]['license'] = None
+        entries = [{'name': f'org/{index}', 'features': features, 'latencies': {}}
+                   for index, features in enumerate(broken)]
+
+        self._compare(entries)
+        records = self.calculator.score_features_batch(entries)
+        assert records[0]['ramp_up_time_latency'] == 1000
+        assert records[1]['size_score']['desktop_pc'] == 0.5
+
+    def test_quantized_fit_with_exact_counts(self):
+        """Exact parameter counts decide the 0.3 bucket"""
+        features = random_features(random.Random(3))
+        features['size_score'] = {'size_gb': 1.2, 'parameter_counts': {'F32': 300 * 10 ** 6}}
+        record = self.calculator.score_features_batch(
+            [{'name': 'org/model', 'features': features, 'latencies': {}}])[0]
+
+        assert record['size_score']['raspberry_pi'] == 0.3
+        assert record['size_score']['jetson_nano'] == 1.0
+
+    def test_empty_batch(self):
+        """No entries, no records"""
+        assert self.calculator.score_features_batch([]) == []
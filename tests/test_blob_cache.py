@@ -0,0 +1,119 @@
+# tests/test_blob_cache.py
+"""
+Tests for the content-addressed blob cache
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.artifacts import README_KIND, ModelArtifacts
+from src.models.model import ModelInfo
+from src.utils import blob_cache as blob_cache_module
+from src.utils.blob_cache import BlobCache
+
+
+class TestBlobCache:
+
+    def test_persists_across_instances(self, tmp_path):
+        """Results outlive the process that computed them"""
+        path = str(tmp_path / 'blobs.sqlite')
+        cache = BlobCache(path)
+        cache.put('kind:1', 'oid1', {'functions': 3})
+        cache.close()
+
+        reopened = BlobCache(path)
+
+        assert reopened.get('kind:1', 'oid1') == {'functions': 3}
+        assert reopened.get('kind:2', 'oid1') is None
+        assert (reopened.hits, reopened.misses) == (1, 1)
+
+    def test_without_oid(self, tmp_path):
+        """Files without an oid are never cached"""
+        cache = BlobCache(str(tmp_path / 'blobs.sqlite'))
+        cache.put('kind:1', None, {'x': 1})
+
+        assert cache.get('kind:1', None) is None
+        assert cache.misses == 0
+
+    def test_memory_is_bounded(self, tmp_path, monkeypatch):
+        """The in-memory front evicts the least recently used entries past its byte budget"""
+        monkeypatch.setattr(blob_cache_module, 'MEMORY_BYTES', 40)
+        cache = BlobCache(str(tmp_path / 'blobs.sqlite'))
+        for oid in ['a', 'b', 'c', 'd']:
+            cache.put('kind:1', oid, oid * 8)  # 10 bytes of JSON each
+        cache.put('kind:1', 'big', 'x' * 20)  # over a quarter of the budget
+
+        assert [oid for _, oid in cache._memory] == ['a', 'b', 'c', 'd']
+        cache.put('kind:1', 'e', 'e' * 8)
+        assert [oid for _, oid in cache._memory] == ['b', 'c', 'd', 'e']
+        assert cache._memory_bytes == 40
+        assert cache.get('kind:1', 'a') == 'a' * 8  # still on disk
+        assert cache.get('kind:1', 'big') == 'x' * 20
+
+    def test_disk_is_capped(self, tmp_path):
+        """Results past the byte cap are evicted from disk least recently used first"""
+        path = str(tmp_path / 'blobs.sqlite')
+        cache = BlobCache(path, max_bytes=30)
+        clock = iter(range(100))
+        with patch('src.utils.blob_cache.time.time', side_effect=lambda: next(clock)):
+            for oid in ['a', 'b', 'c']:
+                cache.put('kind:1', oid, oid * 8)  # 10 bytes of JSON each
+            assert cache.get('kind:1', 'a') == 'a' * 8
+            cache.put('kind:1', 'd', 'd' * 8)
+        assert cache.evictions == 1
+        assert cache.total_bytes() == 30
+        cache.close()
+
+        reopened = BlobCache(path, max_bytes=30)
+        assert reopened.get('kind:1', 'b') is None
+        assert [reopened.get('kind:1', oid) for oid in ['a', 'c', 'd']] == ['a' * 8, 'c' * 8, 'd' * 8]
+        assert reopened.total_bytes() == 30
+
+
+class TestSharedBlobs:
+
+    def make_model(self, name: str) -> ModelInfo:
+        return ModelInfo(
+            name=name, url=f"https://huggingface.co/{name}", api_data={}, sha="abc",
+            siblings=[{'rfilename': 'README.md', 'size': 20, 'blobId': 'readme-oid'},
+                      {'rfilename': 'modeling_x.py', 'size': 30, 'blobId': 'code-oid'}]
+        )
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_identical_files_analysed_once(self, mock_get, tmp_path):
+        """A fine-tune shipping its base model's files fetches none of them again"""
+        mock_get.return_value = Mock(status_code=200, text='def f(x: int) -> int:\n    """doc"""\n')
+        cache = BlobCache(str(tmp_path / 'blobs.sqlite'))
+
+        base = ModelArtifacts(self.make_model("org/base"), blob_cache=cache)
+        first = (base.readme, base.python_analysis)
+        calls = mock_get.call_count
+        tuned = ModelArtifacts(self.make_model("someone/fine-tune"), blob_cache=cache)
+
+        assert (tuned.readme, [dict(item) for item in tuned.python_analysis]) == first
+        assert calls == 2
+        assert mock_get.call_count == calls
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_readme_pinned_to_cached_oid(self, mock_get, tmp_path):
+        """The README is read at the commit whose tree gave the oid it is cached under"""
+        def respond(url, **kwargs):
+            if url.endswith('README.md'):
+                return Mock(status_code=200, text='# Model')
+            tree = b'[{"type": "file", "path": "README.md", "size": 7, "oid": "tree-oid"}]'
+            return Mock(status_code=200, links={}, iter_content=Mock(return_value=[tree]))
+
+        mock_get.side_effect = respond
+        cache = BlobCache(str(tmp_path / 'blobs.sqlite'))
+        model = ModelInfo(name="org/model", url="", api_data={}, sha="abc",
+                          siblings=[{'rfilename': 'README.md'}])
+
+        assert ModelArtifacts(model, blob_cache=cache).readme == '# Model'
+
+        urls = [call.args[0] for call in mock_get.call_args_list]
+        assert urls == ['https://huggingface.co/api/models/org/model/tree/abc',
+                        'https://huggingface.co/org/model/resolve/abc/README.md']
+        assert cache.get(README_KIND, 'tree-oid') == '# Model'
@@ -0,0 +1,127 @@
+# tests/test_code_archive.py
+"""
+Tests for streaming analysis of repository tarballs
+"""
+
+import io
+import pytest
+import sys
+import os
+import tarfile
+from unittest.mock import Mock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.artifacts import ModelArtifacts
+from src.metrics.code_quality_metric import CodeQualityMetric
+from src.models.model import CodeInfo, ModelInfo
+from src.utils import code_archive
+from src.utils.blob_cache import BlobCache
+from src.utils.code_archive import analyze_archive, blob_oid
+
+MODEL_SOURCE = b'''"""Model definition"""
+
+
+def forward(x: int) -> int:
+    """Run the model"""
+    return x
+'''
+
+REPO_FILES = {
+    'pkg/model.py': MODEL_SOURCE,
+    'tests/test_model.py': b'def test_forward():\n    assert True\n',
+    'requirements.txt': b'# runtime\ntorch>=2.0\nnumpy\n-r extra.txt\n',
+    '.github/workflows/ci.yml': b'jobs:\n  test:\n    steps:\n      - run: pytest -q\n',
+    'vendor/bundle.py': b'x = 1\n' * 200,
+    'weights.bin': b'\0' * 4096,
+}
+
+
+def make_archive(path, files=REPO_FILES) -> str:
+    """A GitHub-style tarball with every file under 'org-repo-abc123/'"""
+    with tarfile.open(str(path), 'w:gz') as archive:
+        for name, data in files.items():
+            info = tarfile.TarInfo(f'org-repo-abc123/{name}')
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+class TestAnalyzeArchive:
+
+    def test_single_pass_analysis(self, tmp_path, monkeypatch):
+        """Python, dependency and CI files are analysed; large files are skipped"""
+        monkeypatch.setattr(code_archive, 'MAX_FILE_BYTES', 1024)
+        with open(make_archive(tmp_path / 'repo.tar.gz'), 'rb') as f:
+            result = analyze_archive(f, budget=10 ** 6, python_budget=10 ** 6)
+
+        assert result['files'] == 6 and not result['truncated']
+        assert sorted(item['path'] for item in result['python']) == ['pkg/model.py', 'tests/test_model.py']
+        model = next(item for item in result['python'] if item['path'] == 'pkg/model.py')
+        assert (model['functions'], model['documented_functions'], model['annotated_returns']) == (1, 1, 1)
+        assert result['test_files'] == 1
+        assert (result['dependency_files'], result['dependencies'], result['versioned_dependencies']) == \
+            (['requirements.txt'], 2, 1)
+        assert result['ci_files'] == ['.github/workflows/ci.yml']
+        assert result['ci_runs_tests'] and not result['ci_runs_linters']
+
+    def test_budget_stops_reading(self, tmp_path):
+        """Huge repos are cut off once the byte budget has been read"""
+        files = {f'module_{index}.py': os.urandom(4096).hex().encode() for index in range(50)}
+        with open(make_archive(tmp_path / 'big.tar.gz', files), 'rb') as f:
+            result = analyze_archive(f, budget=64 * 1024, python_budget=10 ** 7)
+
+        assert result['truncated']
+        assert 0 < result['files'] < 50
+
+    def test_budget_within_one_member(self, tmp_path):
+        """A single member far larger than the budget is not read to its end"""
+        files = {'pkg/model.py': MODEL_SOURCE, 'weights.bin': os.urandom(8 * 1024 * 1024),
+                 'requirements.txt': b'torch\n'}
+        with open(make_archive(tmp_path / 'weights.tar.gz', files), 'rb') as f:
+            counted = code_archive.CountingReader(f)
+            result = analyze_archive(counted, budget=64 * 1024, python_budget=10 ** 6)
+
+        assert result['truncated']
+        assert result['files'] == 2 and result['dependency_files'] == []
+        assert len(result['python']) == 1  # sources read before the cut are still analysed
+        assert counted.bytes_read < 128 * 1024
+
+    def test_blob_cache(self, tmp_path):
+        """Files analysed before, in any repo, are not parsed again"""
+        assert blob_oid(b'') == 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'  # git hash-object
+        cache = BlobCache(str(tmp_path / 'blobs.sqlite'))
+        path = make_archive(tmp_path / 'repo.tar.gz')
+        with open(path, 'rb') as f:
+            first = analyze_archive(f, budget=10 ** 6, python_budget=10 ** 6, blob_cache=cache)
+
+        with open(path, 'rb') as f, patch('src.utils.code_archive.analyze_sources', return_value=[]) as analyze:
+            second = analyze_archive(f, budget=10 ** 6, python_budget=10 ** 6, blob_cache=cache)
+
+        analyze.assert_called_once_with([])
+        assert sorted(first['python'], key=lambda item: item['path']) == \
+            sorted(second['python'], key=lambda item: item['path'])
+
+
+class TestLinkedRepository:
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_code_quality_uses_archive(self, mock_get, tmp_path):
+        """The linked repo is streamed from codeload in one request"""
+        archive = open(make_archive(tmp_path / 'repo.tar.gz'), 'rb')
+        mock_get.return_value = Mock(status_code=200, raw=archive)
+        model_info = ModelInfo(name="org/model", url="", api_data={}, code=[
+            CodeInfo(name="org/repo", url="https://github.com/org/repo", api_data={'default_branch': 'dev'})])
+        artifacts = ModelArtifacts(model_info)
+        artifacts._values['tree'] = []
+        artifacts._values['python_analysis'] = []
+
+        metric = CodeQualityMetric()
+        structure = metric._check_code_structure(artifacts)
+        documentation = metric._check_code_documentation(model_info, artifacts)
+        archive.close()
+
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.args[0] == "https://codeload.github.com/org/repo/tar.gz/dev"
+        assert mock_get.call_args.kwargs['stream'] is True
+        assert structure == pytest.approx(1.0)
+        assert documentation > 0.5
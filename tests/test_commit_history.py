@@ -0,0 +1,120 @@
+# tests/test_commit_history.py
+"""
+Tests for the incrementally read Hub commit history
+"""
+
+import json
+import pytest
+import sys
+import os
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.artifacts import ModelArtifacts
+from src.metrics.busfactor_metric import BusFactorMetric
+from src.models.model import ModelInfo
+from src.utils import commit_history
+from src.utils.commit_history import history, summarize_commits
+from src.utils.feature_store import FeatureStore
+from src.utils.hf_tree import iter_commits
+
+PAGE_SIZE = 50
+
+
+def make_commits(count, start=0):
+    """Commits newest first, alternating between alice (2 of 3) and bob"""
+    now = time.time()
+    return [{
+        'id': f'c{index}',
+        'date': datetime.fromtimestamp(now - index * 3600, timezone.utc).isoformat(),
+        'authors': [{'user': 'bob' if index % 3 == 2 else 'alice'}],
+    } for index in range(start, start + count)]
+
+
+def paged_session(commits):
+    """A session serving the commits in linked pages of PAGE_SIZE; records page requests"""
+    session = Mock()
+    session.pages = []
+
+    def get(url, **kwargs):
+        page = int(url.rsplit('page=', 1)[1]) if 'page=' in url else 0
+        session.pages.append(page)
+        body = json.dumps(commits[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]).encode()
+        more = (page + 1) * PAGE_SIZE < len(commits)
+        links = {'next': {'url': f'https://huggingface.co/api/models/org/model/commits/main?page={page + 1}'}} if more else {}
+        return Mock(status_code=200, links=links,
+                    iter_content=lambda chunk_size: [body[i:i + 100] for i in range(0, len(body), 100)])
+
+    session.get.side_effect = get
+    return session
+
+
+class TestSummarizeCommits:
+
+    def test_stops_once_distribution_is_stable(self):
+        """A long history with a steady author mix is not read to the end"""
+        session = paged_session(make_commits(1000))
+
+        summary = summarize_commits(iter_commits(session, 'org/model'), head='c0')
+
+        assert summary['commits'] == 100 and not summary['complete']
+        assert session.pages == [0, 1]
+        assert history(summary)['top_author_share'] == pytest.approx(67 / 100)
+
+    def test_short_history_is_complete(self):
+        """Every page of a short history is read"""
+        session = paged_session(make_commits(70))
+
+        summary = summarize_commits(iter_commits(session, 'org/model'), head='c0')
+
+        assert summary['complete'] and summary['commits'] == 70
+        assert session.pages == [0, 1]
+        assert sum(summary['authors'].values()) == 70
+
+    def test_incremental_merge(self):
+        """Only commits newer than the previous head are read, then merged"""
+        previous = summarize_commits(make_commits(30, start=5), head='c5')
+        session = paged_session(make_commits(200))
+
+        summary = summarize_commits(iter_commits(session, 'org/model'), head='c0', previous=previous)
+
+        assert session.pages == [0]
+        assert summary == summarize_commits(make_commits(35), head='c0')
+
+
+class TestCachedCommitHistory:
+
+    def test_read_once_per_sha(self, tmp_path, monkeypatch):
+        """An unchanged model is served from the store; a new sha reads just the new commits"""
+        monkeypatch.setenv('COMMIT_HISTORY', '1')
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        old = ModelInfo(name="org/model", url="", api_data={}, sha='c5')
+        new = ModelInfo(name="org/model", url="", api_data={}, sha='c0')
+
+        with patch('src.metrics.artifacts.iter_commits', side_effect=lambda *args, **kwargs: (commit for commit in make_commits(30, start=5))):
+            first = ModelArtifacts(old, feature_store=store).commit_history
+        with patch('src.metrics.artifacts.iter_commits') as listing:
+            again = ModelArtifacts(old, feature_store=store).commit_history
+        listing.assert_not_called()
+        with patch('src.metrics.artifacts.iter_commits', side_effect=lambda *args, **kwargs: (commit for commit in make_commits(200))):
+            updated = ModelArtifacts(new, feature_store=store).commit_history
+
+        assert first == again and first['commits'] == 30
+        assert updated['commits'] == 35
+        assert store.get_summary(commit_history.COMMITS_KIND, 'org/model')['head'] == 'c0'
+        assert store.count() == 0  # summaries are not feature rows
+
+
+class TestBusFactorFromCommits:
+
+    def test_commit_history_without_truck_factor(self):
+        """Spread and active authors are reweighted when no truck factor is known"""
+        now = time.time()
+        commits = {'commits': 80, 'authors': 2, 'top_author_share': 0.75,
+                   'last_commits': [now - 86400, now - 400 * 86400]}
+        metric = BusFactorMetric()
+
+        assert metric.maintainers_score({'maintainers': 0.9, 'repo_history': None, 'commit_history': commits}) == \
+            pytest.approx((0.3 * 0.25 + 0.3 / 3) / 0.6)
@@ -0,0 +1,205 @@
+# tests/test_feature_store.py
+"""
+Tests for the feature store and offline re-scoring
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.calculator import MetricsCalculator
+from src.metrics.performance_metric import PerformanceMetric
+from src.models.model import ModelInfo
+from src.utils.feature_store import FeatureStore
+
+
+class TestFeatureStore:
+
+    def setup_method(self):
+        self.features = {'license': {'license': 'mit'}}
+        self.latencies = {'license': 12}
+
+    def test_put_and_get(self, tmp_path):
+        """Features round-trip per (model, revision)"""
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        store.put('org/model', 'abc', self.features, self.latencies)
+
+        entry = store.get('org/model', 'abc')
+
+        assert entry['features'] == self.features
+        assert entry['latencies'] == self.latencies
+        assert store.get('org/model', 'def') is None
+        store.close()
+
+    def test_latest_revision_per_model(self, tmp_path):
+        """latest() yields the newest revision of each model once"""
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        store.put('org/a', 'old', {'license': {'license': 'mit'}}, {})
+        store.put('org/a', 'new', {'license': {'license': 'gpl'}}, {})
+        store.put('org/b', 'abc', self.features, {})
+
+        entries = list(store.latest())
+
+        assert [(entry['name'], entry['revision']) for entry in entries] == [('org/a', 'new'), ('org/b', 'abc')]
+        assert store.count() == 3
+
+    def test_summaries_are_replaced(self, tmp_path):
+        """A model's summary of a kind is overwritten, not versioned"""
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        store.put_summary('commits:1', 'org/a', {'head': 'old'})
+        store.put_summary('commits:1', 'org/a', {'head': 'new'})
+
+        assert store.get_summary('commits:1', 'org/a') == {'head': 'new'}
+        assert store.get_summary('commits:1', 'org/b') is None
+        assert store.count() == 0
+
+    def test_latest_streams_rows(self, tmp_path):
+        """latest() is a generator reading the cursor a few rows at a time"""
+        import types
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        for index in range(5):
+            store.put(f'org/m{index}', 'abc', self.features, {})
+
+        entries = store.latest(fetch_rows=2)
+
+        assert isinstance(entries, types.GeneratorType)
+        assert next(entries)['name'] == 'org/m0'
+        assert [entry['name'] for entry in entries] == ['org/m1', 'org/m2', 'org/m3', 'org/m4']
+
+    def test_unwritable_path_disables_store(self, tmp_path):
+        """A store that cannot be opened is a no-op"""
+        blocker = tmp_path / 'file'
+        blocker.write_text('')
+        store = FeatureStore(str(blocker / 'features.sqlite'))
+
+        store.put('org/model', 'abc', self.features, {})
+
+        assert store.get('org/model', 'abc') is None
+        assert list(store.latest()) == []
+
+
+class TestRescore:
+
+    def setup_method(self):
+        self.model_info = ModelInfo(
+            name="google/bert-base", url="https://huggingface.co/google/bert-base",
+            api_data={'downloads': 5000, 'likes': 20, 'tags': ['eval']},
+            sha="abc123"
+        )
+
+    def test_score_is_pure(self):
+        """score() depends only on the extracted features"""
+        metric = PerformanceMetric()
+        features = {'known_model': True, 'model_index': 1.0, 'readme': 0.0, 'tags': 0.0}
+
+        assert metric.score(features) == pytest.approx(0.9)
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_rescore_matches_live_evaluation(self, mock_get, tmp_path):
+        """Scores recomputed from stored features equal the live ones"""
+        mock_get.return_value = Mock(status_code=404)
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        calculator = MetricsCalculator(feature_store=store)
+
+        live = calculator.calculate_all_metrics(self.model_info)
+        calls = mock_get.call_count
+        entry = store.get("google/bert-base", "abc123")
+        rescored = calculator.score_features(entry['name'], entry['features'], entry['latencies'])
+
+        assert mock_get.call_count == calls
+        live.pop('net_score_latency')
+        rescored.pop('net_score_latency')
+        assert rescored == live
+
+    def test_missing_features_use_defaults(self):
+        """A metric without stored features gets the failure default"""
+        calculator = MetricsCalculator(feature_store=Mock())
+
+        result = calculator.score_features("org/model", {'license': {'license': 'mit'}})
+
+        assert result['license'] == 1.0
+        assert result['bus_factor'] == 0.0
+        assert result['size_score']['aws_server'] == 1.0
+
+
+class TestIncrementalEvaluation:
+
+    def setup_method(self):
+        self.model_info = ModelInfo(
+            name="org/model", url="https://huggingface.co/org/model", api_data={}, sha="abc123"
+        )
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_unchanged_revision_skips_metrics(self, mock_get, tmp_path):
+        """A second run at the same sha makes no request and emits the same record"""
+        mock_get.return_value = Mock(status_code=404)
+        calculator = MetricsCalculator(feature_store=FeatureStore(str(tmp_path / 'features.sqlite')))
+        calculator.incremental = True
+
+        first = calculator.calculate_all_metrics(self.model_info)
+        calls = mock_get.call_count
+        second = calculator.calculate_all_metrics(self.model_info)
+
+        assert mock_get.call_count == calls
+        assert calculator.reused == 1
+        first.pop('net_score_latency')
+        second.pop('net_score_latency')
+        assert second == first
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_new_revision_is_evaluated(self, mock_get, tmp_path):
+        """A changed sha, or an unknown one, is evaluated again"""
+        mock_get.return_value = Mock(status_code=404)
+        calculator = MetricsCalculator(feature_store=FeatureStore(str(tmp_path / 'features.sqlite')))
+        calculator.incremental = True
+
+        calculator.calculate_all_metrics(self.model_info)
+        calls = mock_get.call_count
+        self.model_info.sha = "def456"
+        calculator.calculate_all_metrics(self.model_info)
+        self.model_info.sha = ""
+        calculator.calculate_all_metrics(self.model_info)
+
+        assert mock_get.call_count == 3 * calls
+        assert calculator.reused == 0
+
+    def test_incomplete_features_are_not_reused(self, tmp_path):
+        """Features missing a metric mean its extraction failed, so retry"""
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        store.put("org/model", "abc123", {'license': {'license': 'mit'}}, {})
+        calculator = MetricsCalculator(feature_store=store)
+        calculator.incremental = True
+
+        assert calculator._stored_record(self.model_info) is None
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_transient_failure_is_not_reused(self, mock_get, tmp_path):
+        """Features extracted while the Hub returned 503 are not stored for the revision"""
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        calculator = MetricsCalculator(feature_store=store)
+        calculator.incremental = True
+
+        mock_get.return_value = Mock(status_code=503)
+        calculator.calculate_all_metrics(self.model_info)
+        assert store.get("org/model", "abc123") is None
+
+        mock_get.return_value = Mock(status_code=404)
+        calculator.calculate_all_metrics(self.model_info)
+        calls = mock_get.call_count
+        calculator.calculate_all_metrics(self.model_info)
+
+        assert mock_get.call_count == calls
+        assert calculator.reused == 1
+
+    def test_failed_model_info_is_not_stored(self, tmp_path):
+        """A model whose info request failed is evaluated but never stored"""
+        store = FeatureStore(str(tmp_path / 'features.sqlite'))
+        calculator = MetricsCalculator(feature_store=store)
+        self.model_info.fetch_failures = ['model info']
+
+        with patch('src.metrics.artifacts.requests.Session.get', return_value=Mock(status_code=404)):
+            calculator.calculate_all_metrics(self.model_info)
+
+        assert store.count() == 0
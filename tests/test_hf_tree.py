@@ -0,0 +1,85 @@
+# tests/test_hf_tree.py
+"""
+Tests for the streaming repository tree walker
+"""
+
+import pytest
+import json
+import sys
+import os
+from unittest.mock import Mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import requests
+
+from src.utils.hf_tree import file_size, iter_json_array, iter_repo_tree
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _page(entries, next_url=None, status_code=200):
+    response = Mock(status_code=status_code)
+    response.iter_content.return_value = _chunks(json.dumps(entries).encode(), 7)
+    response.links = {'next': {'url': next_url}} if next_url else {}
+    return response
+
+
+class TestIterJsonArray:
+
+    def test_elements_split_across_chunks(self):
+        """Elements are decoded correctly whatever the chunk boundaries"""
+        entries = [{'path': f'dir/file{i}.py', 'size': i} for i in range(20)] + [12345, 'ü']
+        data = json.dumps(entries, ensure_ascii=False).encode('utf-8')
+
+        for size in (1, 2, 5, 64, len(data)):
+            assert list(iter_json_array(_chunks(data, size))) == entries
+
+    def test_empty_array(self):
+        """An empty listing yields nothing"""
+        assert list(iter_json_array([b' [ ] '])) == []
+
+    def test_truncated_array(self):
+        """A body cut off mid-array is an error, not a silently short listing"""
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'[{"path": "a"}, {"pa']))
+
+    def test_not_an_array(self):
+        """A JSON object payload is rejected"""
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"error": "x"}']))
+
+
+class TestIterRepoTree:
+
+    def test_follows_cursor_pagination(self):
+        """Pages are fetched until there is no next link"""
+        session = Mock()
+        session.get.side_effect = [
+            _page([{'type': 'file', 'path': 'a.py', 'size': 1}], next_url='https://hf/next?cursor=x'),
+            _page([{'type': 'file', 'path': 'sub/b.py', 'size': 2}]),
+        ]
+
+        paths = [entry['path'] for entry in iter_repo_tree(session, 'org/model')]
+
+        assert paths == ['a.py', 'sub/b.py']
+        first, second = session.get.call_args_list
+        assert first.args[0] == 'https://huggingface.co/api/models/org/model/tree/main'
+        assert first.kwargs['params'] == {'recursive': 'true'}
+        assert second.args[0] == 'https://hf/next?cursor=x'
+        assert second.kwargs['params'] is None
+
+    def test_http_error(self):
+        """A failed page raises instead of returning a partial tree"""
+        session = Mock()
+        session.get.return_value = _page([], status_code=404)
+
+        with pytest.raises(requests.HTTPError):
+            list(iter_repo_tree(session, 'org/model'))
+
+    def test_file_size_prefers_lfs(self):
+        """LFS pointers report the size of the stored object"""
+        assert file_size({'size': 134, 'lfs': {'size': 5_000_000}}) == 5_000_000
+        assert file_size({'size': 42}) == 42
+        assert file_size({}) == 0
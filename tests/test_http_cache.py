@@ -0,0 +1,136 @@
+# tests/test_http_cache.py
+"""
+Tests for the persistent HTTP response cache
+"""
+
+import pytest
+import sys
+import os
+import requests
+from requests.adapters import BaseAdapter
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.http_cache import HTTPCache, CachedSession
+
+
+class FakeAdapter(BaseAdapter):
+    """Serves a fixed body with an ETag and honours If-None-Match"""
+
+    def __init__(self, body=b"hello", etag='"v1"'):
+        super().__init__()
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if request.headers.get('If-None-Match') == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = self.body
+            response.headers['ETag'] = self.etag
+            response.headers['Content-Type'] = 'text/plain; charset=utf-8'
+        return response
+
+    def close(self):
+        pass
+
+
+def _session(cache, adapter):
+    session = CachedSession(cache)
+    session.mount('http://fake/', adapter)
+    return session
+
+
+class TestHTTPCache:
+
+    def test_revalidation_returns_cached_body(self, tmp_path):
+        """Second GET is sent conditionally and a 304 yields the stored body"""
+        cache = HTTPCache(str(tmp_path))
+        adapter = FakeAdapter()
+        session = _session(cache, adapter)
+
+        first = session.get('http://fake/readme')
+        second = session.get('http://fake/readme')
+
+        assert first.text == "hello"
+        assert second.status_code == 200
+        assert second.text == "hello"
+        assert getattr(second, 'from_cache', False)
+        assert adapter.requests[1].headers['If-None-Match'] == '"v1"'
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_changed_resource_is_replaced(self, tmp_path):
+        """A new ETag means a fresh 200 which replaces the stored entry"""
+        cache = HTTPCache(str(tmp_path))
+        adapter = FakeAdapter()
+        session = _session(cache, adapter)
+        session.get('http://fake/readme')
+
+        adapter.body, adapter.etag = b"changed", '"v2"'
+        response = session.get('http://fake/readme')
+
+        assert response.text == "changed"
+        assert cache.get('http://fake/readme')['body'] == b"changed"
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Entries survive a new HTTPCache pointed at the same directory"""
+        _session(HTTPCache(str(tmp_path)), FakeAdapter()).get('http://fake/a')
+
+        cache = HTTPCache(str(tmp_path))
+        _session(cache, FakeAdapter()).get('http://fake/a')
+        assert cache.hits == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """Least recently used entries are evicted once over the size cap"""
+        cache = HTTPCache(str(tmp_path), max_bytes=10)
+        cache.put('http://fake/a', 200, {'etag': 'a'}, b"12345")
+        cache.put('http://fake/b', 200, {'etag': 'b'}, b"12345")
+        cache.get('http://fake/a')
+        cache.put('http://fake/c', 200, {'etag': 'c'}, b"12345")
+
+        assert cache.get('http://fake/a') is not None
+        assert cache.get('http://fake/b') is None
+        assert cache.get('http://fake/c') is not None
+        assert cache.evictions == 1
+        assert cache.total_bytes() <= 10
+
+    def test_range_requests_bypass_cache(self, tmp_path):
+        """Partial-content requests are never stored"""
+        cache = HTTPCache(str(tmp_path))
+        session = _session(cache, FakeAdapter())
+        session.get('http://fake/blob', headers={'Range': 'bytes=0-7'})
+
+        assert cache.get('http://fake/blob') is None
+
+    def test_keyed_by_credentials(self, tmp_path):
+        """A response fetched with one token is not revalidated for another caller"""
+        cache = HTTPCache(str(tmp_path))
+        adapter = FakeAdapter()
+        session = _session(cache, adapter)
+
+        session.get('http://fake/private', headers={'Authorization': 'Bearer a'})
+        session.get('http://fake/private')
+        session.get('http://fake/private', headers={'Authorization': 'Bearer a'})
+
+        assert 'If-None-Match' not in adapter.requests[1].headers
+        assert adapter.requests[2].headers['If-None-Match'] == '"v1"'
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_lookups_defer_access_writes(self, tmp_path, monkeypatch):
+        """Hits only update access times in memory until a batch is flushed"""
+        monkeypatch.setattr('src.utils.http_cache.ACCESS_FLUSH_EVERY', 2)
+        cache = HTTPCache(str(tmp_path))
+        cache.put('http://fake/a', 200, {'etag': 'a'}, b"1")
+        cache.put('http://fake/b', 200, {'etag': 'b'}, b"1")
+
+        cache.get('http://fake/a')
+        assert len(cache._accessed) == 1
+        cache.get('http://fake/b')
+        assert cache._accessed == {}
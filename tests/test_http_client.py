@@ -0,0 +1,49 @@
+# tests/test_http_client.py
+"""
+Tests for the shared pooled HTTP client
+"""
+
+import pytest
+import sys
+import os
+import requests
+from unittest.mock import patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.config import Config
+from src.utils.http_client import HTTPClient, get_http_client
+from src.url_parser import URLParser
+from src.metrics.calculator import MetricsCalculator
+
+
+class TestHTTPClient:
+
+    def test_single_shared_client(self):
+        """Parser, calculator and metrics all use the same session"""
+        parser = URLParser()
+        calculator = MetricsCalculator()
+
+        assert parser.session is get_http_client()
+        assert calculator.session is get_http_client()
+        assert calculator.size_metric.session is get_http_client()
+        assert calculator.code_quality_metric.session is get_http_client()
+
+    def test_pool_sized_for_workers(self):
+        """Per-host pools hold as many connections as there are worker threads"""
+        client = HTTPClient(pool_size=12)
+        adapter = client.get_adapter('https://huggingface.co/api/models/x')
+        assert adapter._pool_maxsize == 12
+
+    @patch.dict(os.environ, {'GITHUB_TOKEN': 'gh_token', 'HF_TOKEN': 'hf_token'})
+    def test_auth_header_matches_host(self):
+        """Each host only receives its own token"""
+        client = HTTPClient(config=Config())
+
+        hf = client.prepare_request(requests.Request('GET', 'https://huggingface.co/api/models/x'))
+        gh = client.prepare_request(requests.Request('GET', 'https://api.github.com/repos/a/b'))
+        other = client.prepare_request(requests.Request('GET', 'https://example.com/'))
+
+        assert hf.headers['Authorization'] == 'Bearer hf_token'
+        assert gh.headers['Authorization'] == 'token gh_token'
+        assert 'Authorization' not in other.headers
+        assert hf.headers['User-Agent'] == 'ACME-ML-Evaluator/1.0'
@@ -0,0 +1,67 @@
+# tests/test_keyword_matcher.py
+"""
+Tests for the single-pass keyword matcher
+"""
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.keywords import README_MATCHER
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+
+    def test_overlapping_and_prefix_terms(self):
+        """Every term is found as a substring, including inside longer terms"""
+        matcher = KeywordMatcher(['eval', 'evaluation', 'arc', 'install', 'pip install'])
+        hits = matcher.scan("evaluation results. pip install it. research on arc")
+
+        assert hits.count('eval') == 1
+        assert hits.count('evaluation') == 1
+        assert hits.count('install') == 1
+        assert hits.count('pip install') == 1
+        assert hits.count('arc') == 2  # "research" and "arc"
+
+    def test_matches_substring_semantics(self):
+        """Presence agrees with `term in text` for every README term"""
+        text = ("# model\ntrained on the pile and c4 with pytest-based ci/cd. "
+                "see huggingface.co/datasets/foo; import torch\n")
+        hits = README_MATCHER.scan(text)
+
+        for term in README_MATCHER.terms:
+            assert (term in hits) == (term in text), term
+
+    def test_positions_and_sections(self):
+        """Hits carry their offsets and the heading of their section"""
+        text = "intro usage\n# Setup\npip install x\n## Usage ##\nusage here\n"
+        hits = KeywordMatcher(['usage', 'install']).scan(text.lower())
+
+        assert hits.positions['usage'][0] == text.index('usage')
+        assert hits.section_at(0) is None
+        assert hits.sections('install') == ['setup']
+        assert hits.sections('usage') == ['usage']
+        assert [title for _, title in hits.headings] == ['setup', 'usage']
+
+    def test_helpers(self):
+        """found() counts distinct terms and any() short-circuits"""
+        hits = KeywordMatcher(['a', 'b', 'c']).scan("a a b")
+
+        assert hits.found(['a', 'b', 'c']) == 2
+        assert hits.any(['c', 'b'])
+        assert hits.counts == {'a': 2, 'b': 1}
+
+    def test_unknown_term(self):
+        """Asking for a term the matcher was not built with is an error"""
+        hits = KeywordMatcher(['a']).scan("a")
+
+        with pytest.raises(KeyError):
+            'b' in hits
+
+    def test_empty_matcher(self):
+        """A matcher without terms still reports headings"""
+        hits = KeywordMatcher([]).scan("# title\ntext")
+
+        assert hits.headings == [(0, 'title')]
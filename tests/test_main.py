@@ -55,4 +55,76 @@ class TestMLEvaluator:
             result = self.evaluator.process_urls_file(temp_path)
             assert result == 0  # Should succeed
         finally:
-            os.unlink(temp_path)
\ No newline at end of file
+            os.unlink(temp_path)
+
+    def test_process_urls_streams_in_input_order(self, capsys):
+        """Ordered mode writes results in file order even when they finish out of order"""
+        import json
+        import time
+        from unittest.mock import patch
+        
+        urls = [f"https://huggingface.co/test/model-{i}\n" for i in range(5)]
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='ascii') as f:
+            f.writelines(urls)
+            temp_path = f.name
+        
+        def evaluate(url):
+            index = int(url.rsplit('-', 1)[1])
+            time.sleep(0.05 * (5 - index))  # later models finish first
+            return None if index == 2 else {"name": url}
+        
+        try:
+            with patch.object(self.evaluator, 'evaluate_model', side_effect=evaluate):
+                result = self.evaluator.process_urls_file(temp_path, ordered=True, workers=5)
+            assert result == 0
+            lines = capsys.readouterr().out.strip().split('\n')
+            names = [json.loads(line)["name"] for line in lines]
+            assert names == [u.strip() for i, u in enumerate(urls) if i != 2]
+        finally:
+            os.unlink(temp_path)
+
+    def test_ordered_window_bounds_reorder_buffer(self):
+        """A slow first model holds back at most a window of results in ordered mode"""
+        import io
+        import time
+        from unittest.mock import patch
+        from src.utils.ndjson import NDJSONWriter
+        
+        urls = [f"https://huggingface.co/test/model-{i}" for i in range(20)]
+        writer = NDJSONWriter(io.StringIO(), ordered=True)
+        peak_buffered = []
+        
+        def evaluate(url):
+            time.sleep(0.2 if url == urls[0] else 0.001)
+            peak_buffered.append(writer.buffered)
+            return {"name": url}
+        
+        with patch.object(self.evaluator, 'evaluate_model', side_effect=evaluate):
+            self.evaluator._evaluate_concurrently(urls, writer, workers=2)
+        
+        assert writer.lines_written == 20
+        assert max(peak_buffered) < 4  # window of 2 * workers
+
+    def test_buffered_results_flushed_when_evaluation_fails(self, capsys):
+        """A failing run still writes finished results and releases shared resources"""
+        import json
+        from unittest.mock import patch
+        
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='ascii') as f:
+            f.write("https://huggingface.co/test/a\nhttps://huggingface.co/test/b\n")
+            temp_path = f.name
+        
+        def evaluate(models, writer, workers):
+            writer.write(1, {"name": "test/b"})  # held back waiting for test/a
+            raise RuntimeError("worker pool died")
+        
+        try:
+            with patch.object(self.evaluator, '_evaluate_concurrently', side_effect=evaluate), \
+                    patch.object(self.evaluator.context, 'close') as close:
+                result = self.evaluator.process_urls_file(temp_path, ordered=True)
+            assert result == 1
+            assert close.called
+            lines = capsys.readouterr().out.strip().split('\n')
+            assert [json.loads(line)["name"] for line in lines] == ["test/b"]
+        finally:
+            os.unlink(temp_path)
@@ -98,7 +98,7 @@ class TestLicenseMetric:
         result = metric.calculate(model_info)
         assert result == 0.1
     
-    @patch('src.metrics.license_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_license_parsing_from_readme(self, mock_get):
         """Test license parsing from README"""
         metric = LicenseMetric()
@@ -203,7 +203,7 @@ class TestSizeMetric:
             last_modified=None
         )
         
-        with patch('src.metrics.size_metric.requests.Session.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = []
@@ -337,7 +337,7 @@ class TestPerformanceMetric:
         result = metric.calculate(model_info)
         assert 0.0 <= result <= 1.0
     
-    @patch('src.metrics.performance_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_performance_calculation_with_readme(self, mock_get):
         """Test performance calculation with README benchmarks"""
         metric = PerformanceMetric()
@@ -423,7 +423,7 @@ class TestDatasetCodeMetric:
         result = metric.calculate(model_info)
         assert 0.0 <= result <= 1.0
     
-    @patch('src.metrics.dataset_code_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_dataset_code_calculation_with_readme(self, mock_get):
         """Test dataset code calculation with README"""
         metric = DatasetCodeMetric()
@@ -477,7 +477,7 @@ class TestDatasetQualityMetric:
         metric = DatasetQualityMetric()
         assert metric is not None
     
-    @patch('src.metrics.dataset_quality_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_dataset_quality_calculation_with_readme(self, mock_get):
         """Test dataset quality calculation with README"""
         metric = DatasetQualityMetric()
@@ -526,7 +526,7 @@ class TestCodeQualityMetric:
         metric = CodeQualityMetric()
         assert metric is not None
     
-    @patch('src.metrics.code_quality_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_code_quality_calculation_with_files(self, mock_get):
         """Test code quality calculation with files"""
         metric = CodeQualityMetric()
@@ -541,6 +541,9 @@ class TestCodeQualityMetric:
             {'path': 'inference.py'},
             {'path': 'README.md'}
         ]
+        files_response.iter_content.return_value = [
+            json.dumps(files_response.json.return_value).encode()
+        ]
         
         # Mock file content response
         file_response = Mock()
@@ -587,7 +590,7 @@ class TestRampUpMetric:
         metric = RampUpMetric()
         assert metric is not None
     
-    @patch('src.metrics.rampup_metric.requests.Session.get')
+    @patch('requests.Session.get')
     def test_rampup_calculation_with_readme(self, mock_get):
         """Test ramp-up calculation with README"""
         metric = RampUpMetric()
@@ -0,0 +1,150 @@
+# tests/test_model_card.py
+"""
+Tests for the parsed model card document model
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.artifacts import ModelArtifacts
+from src.metrics.license_metric import LicenseMetric
+from src.models.model import ModelInfo
+from src.models.model_card import ModelCard, front_matter_from_prefix, split_front_matter
+
+README = """---
+license: apache-2.0
+datasets:
+  - wikipedia
+---
+# My Model
+See the [paper](https://arxiv.org/abs/1234) and https://huggingface.co/datasets/wikipedia.
+
+## Usage
+```python
+# a comment, not a heading
+from transformers import pipeline
+```
+
+### Results
+| task | score |
+|------|------:|
+| mmlu | 61.2 |
+
+## License
+Released under the MIT license.
+
+Second paragraph.
+"""
+
+
+class TestModelCard:
+
+    def setup_method(self):
+        self.card = ModelCard.parse(README)
+
+    def test_front_matter(self):
+        """The leading YAML block is parsed into a dict"""
+        assert self.card.front_matter == {'license': 'apache-2.0', 'datasets': ['wikipedia']}
+
+    def test_section_tree(self):
+        """Headings form a tree; comments inside code fences are not headings"""
+        assert [section.title for section in self.card.sections] == [
+            'My Model', 'Usage', 'Results', 'License']
+        top = self.card.section_tree
+        assert [section.title for section in top] == ['My Model']
+        assert [child.title for child in top[0].children] == ['Usage', 'License']
+        assert self.card.section('usage').children[0].title == 'Results'
+
+    def test_code_blocks(self):
+        """Fenced blocks keep their language and section"""
+        block = self.card.code_blocks[0]
+
+        assert len(self.card.code_blocks) == 1
+        assert block.language == 'python'
+        assert block.section == 'Usage'
+        assert 'from transformers import pipeline' in block.code
+
+    def test_links_and_tables(self):
+        """Markdown links, bare URLs and pipe tables are extracted"""
+        urls = [link.url for link in self.card.links]
+
+        assert urls == ['https://arxiv.org/abs/1234', 'https://huggingface.co/datasets/wikipedia']
+        assert self.card.links[0].text == 'paper'
+        table = self.card.tables[0]
+        assert table.headers == ['task', 'score']
+        assert table.rows == [['mmlu', '61.2']]
+        assert table.section == 'Results'
+
+    def test_first_paragraph(self):
+        """Section bodies stop at the next heading"""
+        assert self.card.section('license').first_paragraph == 'Released under the MIT license.'
+
+    def test_malformed_front_matter(self):
+        """Broken YAML yields an empty dict, and unterminated blocks are body text"""
+        assert split_front_matter("---\nkey: [unclosed\n---\n# T")[0] == {}
+        assert split_front_matter("---\nno end")[0] == {}
+
+    def test_front_matter_from_prefix(self):
+        """A prefix that stops inside the block asks for more text"""
+        assert front_matter_from_prefix(README[:60]) == {'license': 'apache-2.0', 'datasets': ['wikipedia']}
+        assert front_matter_from_prefix("---\nlicense: mit\n--") is None
+        assert front_matter_from_prefix("# No front matter") == {}
+
+    def test_unterminated_fence(self):
+        """A fence left open runs to the end of the document"""
+        card = ModelCard.parse("# A\n```bash\npip install x\n# B")
+
+        assert [section.title for section in card.sections] == ['A']
+        assert card.code_blocks[0].code == 'pip install x\n# B'
+
+
+class TestModelCardArtifact:
+
+    def setup_method(self):
+        self.model_info = ModelInfo(name="test/model", url="https://huggingface.co/test/model", api_data={})
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_license_from_partial_readme(self, mock_get):
+        """The license comes from the front matter of one small ranged read"""
+        response = Mock(status_code=206)
+        response.iter_content.return_value = [README.encode()[:8192]]
+        mock_get.return_value = response
+
+        artifacts = ModelArtifacts(self.model_info)
+
+        assert LicenseMetric()._parse_license_from_readme(artifacts) == 'apache-2.0'
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs['headers'] == {'Range': 'bytes=0-8191'}
+        assert 'readme' not in artifacts._values
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_full_readme_without_front_matter(self, mock_get):
+        """Without front matter the License section of the full README is used"""
+        body = "# Model\n\n## License\nMIT\n"
+        partial = Mock(status_code=206)
+        partial.iter_content.return_value = [body.encode()]
+        mock_get.side_effect = [partial, Mock(status_code=200, text=body)]
+
+        artifacts = ModelArtifacts(self.model_info)
+
+        assert LicenseMetric()._parse_license_from_readme(artifacts) == 'MIT'
+        assert artifacts.card is artifacts.card
+        assert mock_get.call_count == 2
+
+    def test_license_other_uses_license_name(self):
+        """license: other defers to license_name in the card metadata"""
+        metadata = {'license': 'other', 'license_name': 'llama2'}
+
+        assert LicenseMetric()._license_from_metadata(metadata) == 'llama2'
+        assert LicenseMetric()._license_from_metadata({}) is None
+
+    @patch('requests.Session.get')
+    def test_hydrated_card_data_needs_no_request(self, mock_get):
+        """cardData from the model info request answers the license lookup"""
+        self.model_info.card_data = {'license': 'mit'}
+
+        assert LicenseMetric().calculate(self.model_info) == 1.0
+        mock_get.assert_not_called()
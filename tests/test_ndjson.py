@@ -0,0 +1,62 @@
+# tests/test_ndjson.py
+"""
+Tests for the streaming NDJSON writer
+"""
+
+import pytest
+import io
+import json
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.ndjson import NDJSONWriter
+
+
+def _names(stream):
+    return [json.loads(line)["name"] for line in stream.getvalue().splitlines()]
+
+
+class TestNDJSONWriter:
+
+    def test_unordered_writes_immediately(self):
+        """Records are written in the order they arrive"""
+        stream = io.StringIO()
+        writer = NDJSONWriter(stream)
+        writer.write(2, {"name": "c"})
+        writer.write(0, {"name": "a"})
+
+        assert _names(stream) == ["c", "a"]
+
+    def test_ordered_reorder_buffer(self):
+        """Out-of-order records wait in the buffer until earlier ones arrive"""
+        stream = io.StringIO()
+        writer = NDJSONWriter(stream, ordered=True)
+        writer.write(2, {"name": "c"})
+        writer.write(1, {"name": "b"})
+        assert _names(stream) == []
+        assert writer.buffered == 2
+
+        writer.write(0, {"name": "a"})
+        assert _names(stream) == ["a", "b", "c"]
+        assert writer.buffered == 0
+
+    def test_failed_records_are_skipped(self):
+        """A None record advances the order without producing a line"""
+        stream = io.StringIO()
+        writer = NDJSONWriter(stream, ordered=True)
+        writer.write(1, {"name": "b"})
+        writer.write(0, None)
+
+        assert _names(stream) == ["b"]
+        assert writer.lines_written == 1
+
+    def test_close_flushes_remaining(self):
+        """Anything left in the buffer is written on close"""
+        stream = io.StringIO()
+        writer = NDJSONWriter(stream, ordered=True)
+        writer.write(3, {"name": "d"})
+        writer.write(1, {"name": "b"})
+        writer.close()
+
+        assert _names(stream) == ["b", "d"]
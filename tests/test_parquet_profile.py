@@ -0,0 +1,108 @@
+# tests/test_parquet_profile.py
+"""
+Tests for the parquet sample profiler
+"""
+
+import json
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+from src.metrics.dataset_quality_metric import DatasetQualityMetric
+from src.models.model import DatasetInfo
+from src.utils import parquet_profile
+from src.utils.parquet_profile import RangeFile, profile_parquet
+
+
+def write_fixture(path, rows: int = 4000, row_group_size: int = 1000) -> str:
+    """Reviews with a ClassLabel sentiment, a few empty texts, nulls and duplicates"""
+    table = pa.table({
+        'review': [f"review number {index % 3000}" if index % 100 else '' for index in range(rows)],
+        'sentiment': [index % 4 == 0 for index in range(rows)],
+        'stars': [None if index % 10 == 0 else index % 5 for index in range(rows)],
+    })
+    features = {'sentiment': {'_type': 'ClassLabel', 'names': ['negative', 'positive']}}
+    table = table.replace_schema_metadata({b'huggingface': json.dumps({'info': {'features': features}}).encode()})
+    pq.write_table(table, str(path), row_group_size=row_group_size)
+    return str(path)
+
+
+def range_session(data: bytes) -> Mock:
+    """A session answering Range requests from local bytes, recording each range"""
+    session = Mock()
+    session.ranges = []
+
+    def get(url, headers=None, stream=False, timeout=None):
+        start, end = (int(value) for value in headers['Range'][len('bytes='):].split('-'))
+        session.ranges.append((start, end))
+        response = Mock(status_code=206)
+        response.iter_content = lambda chunk_size: iter([data[start:end + 1]])
+        return response
+
+    session.get.side_effect = get
+    return session
+
+
+class TestProfileParquet:
+
+    def test_statistics(self, tmp_path):
+        """Nulls, duplicates, text lengths and label balance of the sampled rows"""
+        profile = profile_parquet(write_fixture(tmp_path / 'train.parquet', rows=2000))
+
+        assert profile['num_rows'] == profile['sampled_rows'] == 2000
+        assert profile['null_rate'] == pytest.approx(200 / 6000)
+        assert profile['duplicate_rate'] == pytest.approx(19 / 2000)  # the empty reviews
+        assert profile['empty_text_rate'] == pytest.approx(20 / 2000)
+        assert profile['text_length']['p95'] == len("review number 1000")
+        assert profile['label_classes'] == 2
+        assert profile['label_balance'] == pytest.approx(0.811, abs=1e-3)  # 1:3 split
+
+    def test_sample_is_bounded(self, tmp_path, monkeypatch):
+        """Only leading row groups within the row and byte budgets are read"""
+        monkeypatch.setattr(parquet_profile, 'MAX_SAMPLE_ROWS', 1500)
+        path = write_fixture(tmp_path / 'train.parquet')
+
+        profile = profile_parquet(path)
+        assert (profile['num_rows'], profile['sampled_rows']) == (4000, 1500)
+        assert profile['duplicate_rate'] == pytest.approx(14 / 1500)
+
+        footer_only = profile_parquet(path, budget=1)
+        assert (footer_only['num_rows'], footer_only['sampled_rows']) == (4000, 0)
+        assert footer_only['null_rate'] is None
+
+    def test_remote_file_reads_ranges_only(self, tmp_path, monkeypatch):
+        """Over HTTP only the footer and the sampled row group are downloaded"""
+        monkeypatch.setattr(parquet_profile, 'RANGE_BLOCK_BYTES', 1024)
+        monkeypatch.setattr(parquet_profile, 'MAX_SAMPLE_ROWS', 1000)
+        data = open(write_fixture(tmp_path / 'train.parquet', rows=200000), 'rb').read()
+        session = range_session(data)
+        remote = RangeFile(session, 'https://example.com/train.parquet', len(data))
+
+        profile = profile_parquet(remote)
+
+        assert profile['sampled_rows'] == 1000
+        assert profile == dict(profile_parquet(pa.BufferReader(data)), sampled_rows=1000)
+        assert remote.bytes_read < len(data) / 10
+        assert all(end < len(data) for _, end in session.ranges)
+
+
+class TestSampleQuality:
+
+    def test_profile_raises_preprocessing(self, tmp_path):
+        """A clean sample counts as preprocessing evidence the README lacks"""
+        metric = DatasetQualityMetric()
+        profile = profile_parquet(write_fixture(tmp_path / 'train.parquet', rows=2000))
+        summary = metric._summarize_profiles([DatasetInfo(name='org/reviews', url='', api_data={}, profile=profile)])
+        features = {'documentation': 0.0, 'preprocessing': 0.0, 'known_datasets': 0.0}
+
+        quality = metric.sample_quality(summary)
+
+        assert quality == pytest.approx(0.3 * (1 - 200 / 6000) + 0.3 * (1 - 19 / 2000) + 0.2 * 0.99 + 0.2 * 0.8113,
+                                        abs=1e-3)
+        assert metric.score(features) == 0.0
+        assert metric.score(dict(features, sample_profile=summary)) == pytest.approx(0.3 * quality)
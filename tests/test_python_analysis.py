@@ -0,0 +1,111 @@
+# tests/test_python_analysis.py
+"""
+Tests for AST-based Python code analysis
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.artifacts import ModelArtifacts
+from src.metrics.code_quality_metric import CodeQualityMetric
+from src.models.model import ModelInfo
+from src.utils import python_analysis
+from src.utils.python_analysis import analyze_source, analyze_sources, summarize
+
+SOURCE = '''"""Module docstring"""
+
+class Model:
+    """A model"""
+
+    def forward(self, x: int, *args, scale=1.0) -> int:
+        """Run the model"""
+        return x
+
+def helper(a, b):
+    return a + b
+''' + "\ndef long_one():\n" + "    x = 1\n" * 60
+
+
+class TestAnalyzeSource:
+
+    def test_counts(self):
+        """Docstrings, annotations and long functions are counted from the AST"""
+        stats = analyze_source(SOURCE)
+
+        assert stats['parsed'] and stats['module_docstring']
+        assert stats['functions'] == 3
+        assert stats['documented_functions'] == 1
+        assert stats['classes'] == stats['documented_classes'] == 1
+        assert stats['long_functions'] == 1
+        assert stats['arguments'] == 5  # x, args, scale, a, b; self is skipped
+        assert stats['annotated_arguments'] == 1
+        assert stats['annotated_returns'] == 1
+
+    def test_unparsable_source(self):
+        """Code that does not parse falls back to textual indicators"""
+        stats = analyze_source('print "python 2"\ndef f():\n    """doc"""\n')
+
+        assert stats == {'parsed': False, 'documented': True}
+
+    def test_summarize(self):
+        """Ratios are pooled over every parsed file"""
+        summary = summarize([analyze_source(SOURCE), {'parsed': False, 'documented': False}])
+
+        assert summary['files'] == 1
+        assert summary['docstring_coverage'] == pytest.approx(2 / 4)
+        assert summary['type_hint_ratio'] == pytest.approx(2 / 8)
+        assert summary['short_function_ratio'] == pytest.approx(2 / 3)
+        assert summarize([{'parsed': False, 'documented': True}]) is None
+
+    def test_process_pool(self, monkeypatch):
+        """Large batches are parsed in worker processes with the same result"""
+        monkeypatch.setenv('ANALYSIS_PROCESSES', '1')
+        monkeypatch.setattr(python_analysis, 'POOL_MIN_BYTES', 0)
+        monkeypatch.setattr(python_analysis, '_pool', None)
+
+        try:
+            assert analyze_sources([SOURCE, 'def (']) == [analyze_source(SOURCE), analyze_source('def (')]
+            assert python_analysis._pool is not None
+        finally:
+            if python_analysis._pool is not None:
+                python_analysis._pool.shutdown()
+
+
+class TestCodeFetching:
+
+    def setup_method(self):
+        self.model_info = ModelInfo(
+            name="org/model", url="https://huggingface.co/org/model", api_data={}, sha="abc",
+            siblings=[
+                {'rfilename': 'modeling.py', 'size': 600},
+                {'rfilename': 'src/deep/util.py', 'size': 100},
+                {'rfilename': 'huge.py', 'size': 5000},
+                {'rfilename': 'config.json', 'size': 10},
+            ]
+        )
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_byte_budget(self, mock_get, monkeypatch):
+        """Files are fetched shallowest first until the byte budget is spent"""
+        monkeypatch.setenv('CODE_FETCH_BUDGET_KB', '1')
+        mock_get.return_value = Mock(status_code=200, text=SOURCE)
+
+        analyses = ModelArtifacts(self.model_info).python_analysis
+
+        assert [analysis['path'] for analysis in analyses] == ['modeling.py', 'src/deep/util.py']
+        urls = sorted(call.args[0] for call in mock_get.call_args_list)
+        assert urls == ['https://huggingface.co/org/model/resolve/abc/modeling.py',
+                        'https://huggingface.co/org/model/resolve/abc/src/deep/util.py']
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_documentation_score(self, mock_get):
+        """Documentation blends docstring coverage, type hints and function sizes"""
+        mock_get.return_value = Mock(status_code=200, text=SOURCE)
+        self.model_info.siblings = self.model_info.siblings[:1]
+
+        score = CodeQualityMetric()._check_code_documentation(self.model_info, ModelArtifacts(self.model_info))
+
+        assert score == pytest.approx(0.5 * 0.5 + 0.25 * 0.25 + 0.25 * 2 / 3)
@@ -0,0 +1,142 @@
+# tests/test_rate_limiter.py
+"""
+Tests for the per-host rate limiter
+"""
+
+import pytest
+import sys
+import os
+import requests
+from requests.adapters import BaseAdapter
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.config import Config
+from src.utils.http_client import HTTPClient
+from src.utils.rate_limiter import RateLimiter, TokenBucket, parse_rate_limits
+
+
+class FakeClock:
+    """Deterministic clock whose sleep() just advances time"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _response(status=200, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = b""
+    return response
+
+
+class ThrottlingAdapter(BaseAdapter):
+    """Returns 429 with Retry-After for the first N requests"""
+
+    def __init__(self, throttle_count):
+        super().__init__()
+        self.throttle_count = throttle_count
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        if self.calls <= self.throttle_count:
+            response = _response(429, {'Retry-After': '2'})
+        else:
+            response = _response(200)
+            response._content = b"ok"
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class TestRateLimiter:
+
+    def test_token_bucket_spaces_requests(self):
+        """Once the burst is spent, callers wait for tokens to refill"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.5)
+
+    def test_retry_after_pauses_host(self):
+        """Retry-After pauses only the host that sent it"""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        delay = limiter.observe('https://huggingface.co/api/models/x',
+                                _response(429, {'Retry-After': '30'}))
+
+        assert delay == 30.0
+        limiter.acquire('https://api.github.com/repos/a/b')
+        assert clock.sleeps == []
+        limiter.acquire('https://huggingface.co/api/models/y')
+        assert sum(clock.sleeps) == pytest.approx(30.0)
+        assert limiter.stats()['throttled'] == 1
+
+    def test_exhausted_github_quota(self):
+        """X-RateLimit-Remaining of 0 waits until X-RateLimit-Reset"""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, wall_clock=lambda: 5_000_000_000.0, sleep=clock.sleep)
+        response = _response(200, {'X-RateLimit-Remaining': '0',
+                                   'X-RateLimit-Reset': '5000000060'})
+
+        assert limiter.observe('https://api.github.com/repos/a/b', response) == pytest.approx(60.0)
+        assert not limiter.is_throttled(response)
+
+    def test_distant_reset_does_not_stall_host(self):
+        """A reset further away than callers will wait pauses the host for max_pause only"""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, wall_clock=lambda: 5_000_000_000.0, sleep=clock.sleep,
+                              max_pause=300.0)
+        response = _response(403, {'X-RateLimit-Remaining': '0',
+                                   'X-RateLimit-Reset': '5000003500'})
+
+        assert limiter.observe('https://api.github.com/repos/a/b', response) == pytest.approx(3500.0)
+        limiter.acquire('https://api.github.com/repos/c/d')
+        assert sum(clock.sleeps) == pytest.approx(300.0)
+
+    def test_client_caps_host_pauses(self):
+        """The default client caps host pauses at rate_limit_max_wait"""
+        config = Config()
+        client = HTTPClient(config=config, cache=None)
+
+        assert client.rate_limiter.max_pause == config.rate_limit_max_wait
+
+    def test_plain_response_has_no_backoff(self):
+        """Ordinary responses leave the schedule alone"""
+        limiter = RateLimiter()
+        assert limiter.observe('https://huggingface.co/x', _response(200)) is None
+
+    def test_parse_rate_limits(self):
+        """Limits can be given as host=rate/burst pairs"""
+        limits = parse_rate_limits("huggingface.co=4/8, api.github.com=1")
+        assert limits == {'huggingface.co': (4.0, 8.0), 'api.github.com': (1.0, 1.0)}
+
+    def test_client_resends_throttled_request(self):
+        """The shared client waits out a 429 and returns the eventual success"""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        client = HTTPClient(config=Config(), cache=None, rate_limiter=limiter)
+        client.cache = None
+        adapter = ThrottlingAdapter(throttle_count=2)
+        client.mount('http://fake/', adapter)
+
+        response = client.get('http://fake/readme')
+
+        assert response.status_code == 200
+        assert response.text == "ok"
+        assert adapter.calls == 3
+        assert sum(clock.sleeps) >= 4.0
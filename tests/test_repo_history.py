@@ -0,0 +1,137 @@
+# tests/test_repo_history.py
+"""
+Tests for commit-graph bus factor analysis
+"""
+
+import pytest
+import sys
+import os
+import time
+from collections import Counter
+from unittest.mock import PropertyMock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+git = pytest.importorskip('git')
+
+from src.metrics.artifacts import ModelArtifacts
+from src.metrics.busfactor_metric import BusFactorMetric
+from src.models.model import ModelInfo
+from src.utils import repo_history
+from src.utils.blob_cache import BlobCache
+from src.utils.repo_history import analyze_history, summarize_log, truck_factor
+
+
+def make_bare_repo(tmp_path, commits) -> str:
+    """A bare repo from (author email, file) commits, oldest first; returns its file:// URL"""
+    work = git.Repo.init(str(tmp_path / 'work'))
+    for index, (email, path) in enumerate(commits):
+        with open(os.path.join(work.working_dir, path), 'a') as f:
+            f.write(f"change {index}\n")
+        work.index.add([path])
+        author = git.Actor(email.split('@')[0], email)
+        work.index.commit(f"commit {index}", author=author, committer=author)
+    bare = str(tmp_path / 'repo.git')
+    git.Repo.clone_from(work.working_dir, bare, bare=True)
+    return 'file://' + bare
+
+
+class TestRepoHistory:
+
+    def test_analyze_history(self, tmp_path):
+        """Concentration and truck factor of a repo one author mostly wrote"""
+        url = make_bare_repo(tmp_path, [
+            ('alice@x.org', 'model.py'), ('alice@x.org', 'train.py'), ('alice@x.org', 'data.py'),
+            ('bob@x.org', 'README.md'), ('alice@x.org', 'model.py'),
+        ])
+
+        history = analyze_history(url)
+
+        assert (history['commits'], history['authors']) == (5, 2)
+        assert history['top_author_share'] == pytest.approx(0.8)
+        assert history['truck_factor'] == 1
+        assert len(history['last_commits']) == 2
+        assert history['last_commits'][0] >= time.time() - 3600
+
+    def test_shallow_boundary(self, tmp_path):
+        """The oldest commit of a shallow clone does not claim every file"""
+        url = make_bare_repo(tmp_path, [
+            ('alice@x.org', 'a.py'), ('alice@x.org', 'b.py'), ('bob@x.org', 'c.py'), ('carol@x.org', 'd.py'),
+        ])
+
+        history = analyze_history(url, max_commits=3)
+
+        assert history['commits'] == 3
+        # bob and carol own one file each; alice's boundary commit owns none
+        assert history['truck_factor'] == 2
+
+    def test_truck_factor(self):
+        """Authors are removed until most files have no owner left"""
+        files = {f'f{index}': Counter({'a': 5, 'b': 1}) for index in range(4)}
+        files.update({f'g{index}': Counter({'c': 2, 'd': 2}) for index in range(4)})
+
+        # a orphans 4 of 8 files (not more than half); c alone still leaves d
+        assert truck_factor(files) == 3
+        assert truck_factor({}) == 0
+
+    def test_summarize_log(self):
+        """Records of git log --name-only are split on NUL bytes"""
+        log = "\x00s1\tA@x.org\t200\n\nx.py\ny.py\n\x00s2\tb@x.org\t100\n\nx.py\n"
+
+        history = summarize_log(log, boundary={'s2'})
+
+        assert history == {'commits': 2, 'authors': 2, 'top_author_share': 0.5,
+                           'last_commits': [200, 100], 'truck_factor': 1}
+
+
+class TestCachedHistory:
+
+    def test_cached_per_head(self, tmp_path, monkeypatch):
+        """A repo whose HEAD was analysed before is not cloned again"""
+        monkeypatch.setenv('REPO_HISTORY', '1')
+        url = make_bare_repo(tmp_path, [('alice@x.org', 'a.py'), ('bob@x.org', 'b.py')])
+        head = repo_history.remote_head(url)
+        cache = BlobCache(str(tmp_path / 'blobs.sqlite'))
+        model = ModelInfo(name="org/model", url="", api_data={}, sha=head)
+
+        with patch.object(ModelArtifacts, 'repo_url', new_callable=PropertyMock, return_value=url), \
+                patch('src.metrics.artifacts.repo_history.analyze_history', wraps=analyze_history) as analyze:
+            first = ModelArtifacts(model, blob_cache=cache).repo_history
+            second = ModelArtifacts(model, blob_cache=cache).repo_history
+
+        assert first == second and first['authors'] == 2
+        assert analyze.call_count == 1
+
+    def test_private_repo_has_no_history(self, tmp_path, monkeypatch):
+        """A clone that needs credentials fails fast and counts as no history, not a failed fetch"""
+        monkeypatch.setenv('REPO_HISTORY', '1')
+        model = ModelInfo(name="org/model", url="", api_data={}, sha="abc")
+        denied = git.GitCommandError(
+            ['git', 'clone'], 128,
+            stderr="fatal: could not read Username for 'https://huggingface.co': terminal prompts disabled")
+
+        with patch.object(ModelArtifacts, 'repo_url', new_callable=PropertyMock,
+                          return_value='https://huggingface.co/org/model'), \
+                patch('git.Git.execute', side_effect=denied) as execute:
+            artifacts = ModelArtifacts(model, blob_cache=BlobCache(str(tmp_path / 'blobs.sqlite')))
+            assert artifacts.repo_history is None
+
+        env = execute.call_args.kwargs['env']
+        assert (env['GIT_TERMINAL_PROMPT'], env['GIT_ASKPASS']) == ('0', '')
+        assert env['PATH'] == os.environ['PATH']
+        assert artifacts.complete
+
+
+class TestBusFactorFromHistory:
+
+    def setup_method(self):
+        self.metric = BusFactorMetric()
+
+    def test_history_replaces_org_score(self):
+        """Truck factor, author spread and active authors stand in for the org table"""
+        now = time.time()
+        history = {'commits': 40, 'authors': 4, 'top_author_share': 0.4, 'truck_factor': 2,
+                   'last_commits': [now - 86400, now - 30 * 86400, now - 400 * 86400]}
+
+        assert self.metric.maintainers_score({'maintainers': 0.9, 'repo_history': history}) == \
+            pytest.approx(0.4 * 2 / 3 + 0.3 * 0.6 + 0.3 * 2 / 3)
+        assert self.metric.maintainers_score({'maintainers': 0.9, 'repo_history': None}) == 0.9
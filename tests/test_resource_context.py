@@ -0,0 +1,158 @@
+# tests/test_resource_context.py
+"""
+Tests for sharing dataset and code URLs of a URL file with its models
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.calculator import MetricsCalculator
+from src.metrics.code_quality_metric import CodeQualityMetric
+from src.metrics.dataset_quality_metric import DatasetQualityMetric
+from src.models.model import CodeInfo, DatasetInfo, ModelInfo
+from src.resource_context import ResourceContext
+from src.url_parser import URLParser
+
+DATASET = "https://huggingface.co/datasets/allenai/c4"
+CODE = "https://github.com/org/repo"
+MODEL_A = "https://huggingface.co/org/model-a"
+MODEL_B = "https://huggingface.co/org/model-b"
+
+
+class TestGroupURLs:
+
+    def setup_method(self):
+        self.parser = URLParser()
+
+    def test_one_url_per_line(self):
+        """A model takes the dataset and code URLs listed since the previous model"""
+        groups = self.parser.group_urls([DATASET, CODE, MODEL_A, MODEL_B])
+
+        assert groups == [
+            {'model': MODEL_A, 'datasets': [DATASET], 'code': [CODE]},
+            {'model': MODEL_B, 'datasets': [], 'code': []},
+        ]
+
+    def test_csv_lines(self):
+        """'code, dataset, model' lines pair their own fields, blanks allowed"""
+        groups = self.parser.group_urls([f"{CODE}, {DATASET}, {MODEL_A}", f",, {MODEL_B}"])
+
+        assert groups == [
+            {'model': MODEL_A, 'datasets': [DATASET], 'code': [CODE]},
+            {'model': MODEL_B, 'datasets': [], 'code': []},
+        ]
+
+
+class TestResourceContext:
+
+    def setup_method(self):
+        self.parser = Mock()
+        self.parser.parse_dataset_url.side_effect = lambda url: DatasetInfo(
+            name="allenai/c4", url=url, api_data={'sha': 'd1'})
+        self.parser.parse_code_url.side_effect = lambda url: CodeInfo(
+            name="org/repo", url=url, api_data={'license': {'key': 'mit'}}, pushed_at='2024-01-01')
+        self.context = ResourceContext(self.parser)
+
+    def test_each_url_fetched_once(self):
+        """A dataset shared by many models is parsed once"""
+        self.context.load([
+            {'model': MODEL_A, 'datasets': [DATASET], 'code': [CODE]},
+            {'model': MODEL_B, 'datasets': [DATASET], 'code': []},
+        ])
+
+        assert self.parser.parse_dataset_url.call_count == 1
+        assert self.parser.parse_code_url.call_count == 1
+
+    def test_attach(self):
+        """Models get their own resources plus datasets their card declares"""
+        self.context.load([
+            {'model': MODEL_A, 'datasets': [DATASET], 'code': [CODE]},
+            {'model': MODEL_B, 'datasets': [], 'code': []},
+        ])
+        model_a = self.context.attach(ModelInfo(name="org/model-a", url=MODEL_A, api_data={}), MODEL_A)
+        model_b = self.context.attach(
+            ModelInfo(name="org/model-b", url=MODEL_B, api_data={}, card_data={'datasets': ['c4']}), MODEL_B)
+        model_c = self.context.attach(ModelInfo(name="org/model-c", url="", api_data={}), "unknown")
+
+        assert [dataset.name for dataset in model_a.datasets] == ["allenai/c4"]
+        assert [code.name for code in model_a.code] == ["org/repo"]
+        assert [dataset.name for dataset in model_b.datasets] == ["allenai/c4"]
+        assert model_b.code == []
+        assert model_c.datasets == [] and model_c.code == []
+
+    def test_revision_covers_attached_resources(self):
+        """A new push to the linked repo changes the model's feature store key"""
+        model = ModelInfo(name="org/model-a", url=MODEL_A, api_data={}, sha="abc")
+        assert MetricsCalculator.revision(model) == "abc"
+
+        self.context.load([{'model': MODEL_A, 'datasets': [DATASET], 'code': [CODE]}])
+        self.context.attach(model, MODEL_A)
+
+        assert MetricsCalculator.revision(model) == "abc+allenai/c4@d1+org/repo@2024-01-01"
+
+
+class TestDeclaredDatasets:
+
+    def setup_method(self):
+        self.parser = Mock()
+        self.parser.parse_dataset_url.side_effect = lambda url: DatasetInfo(
+            name=url.split('/datasets/')[1], url=url,
+            api_data={} if url.endswith('/custom') else {'sha': 's'}, num_rows=10)
+        self.context = ResourceContext(self.parser)
+
+    def test_card_and_model_index_datasets(self):
+        """Front matter and model-index datasets are resolved; unknown ids are dropped"""
+        model = ModelInfo(
+            name="org/model", url=MODEL_A, api_data={}, card_data={'datasets': ['wikipedia', 'not a dataset id']},
+            model_index=[{'results': [{'dataset': {'name': 'GLUE', 'type': 'glue'}},
+                                      {'dataset': {'type': 'custom'}}]}])
+
+        self.context.attach(model, MODEL_A)
+        self.context.close()
+
+        assert [dataset.name for dataset in model.datasets] == ['wikipedia', 'glue']
+
+    def test_fetched_once_per_run(self):
+        """Every model declaring c4 shares one lookup"""
+        for index in range(50):
+            self.context.attach(
+                ModelInfo(name=f"org/m{index}", url="", api_data={}, card_data={'datasets': ['C4']}), "")
+        self.context.close()
+
+        assert self.parser.parse_dataset_url.call_count == 1
+
+
+class TestMetricsUseResources:
+
+    def setup_method(self):
+        self.model_info = ModelInfo(
+            name="org/model", url="", api_data={},
+            datasets=[DatasetInfo(name="allenai/c4", url=DATASET, api_data={
+                'description': 'Colossal Clean Crawled Corpus',
+                'cardData': {'license': 'odc-by', 'language': ['en'], 'task_categories': ['text-generation'],
+                             'size_categories': ['100M<n<1B']}})],
+            code=[CodeInfo(name="org/repo", url=CODE, api_data={
+                'license': {'key': 'mit'}, 'description': 'Training code', 'topics': ['nlp'],
+                'archived': False, 'has_issues': True, 'stargazers_count': 50})]
+        )
+        self.artifacts = Mock(model_info=self.model_info, readme_lower=None, readme_hits=None)
+
+    def test_dataset_card_documentation(self):
+        """The dataset card documents the data when the README does not"""
+        metric = DatasetQualityMetric()
+
+        assert metric._check_dataset_documentation(self.artifacts) == pytest.approx(4 / 8 + 0.2)
+        assert metric._check_known_datasets(self.artifacts) == 0.8  # c4
+
+    def test_parquet_profile(self):
+        """Row counts from the datasets-server count as documentation"""
+        self.model_info.datasets[0].num_rows = 365000000
+
+        assert DatasetQualityMetric()._check_dataset_cards(self.model_info.datasets) == pytest.approx(0.9)
+
+    def test_code_repository_best_practices(self):
+        """The linked repository stands in for README best-practice hints"""
+        assert CodeQualityMetric()._check_best_practices(self.artifacts) == pytest.approx(1.0)
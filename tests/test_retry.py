@@ -0,0 +1,120 @@
+# tests/test_retry.py
+"""
+Tests for retries, backoff and request hedging
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+import requests
+from requests.adapters import BaseAdapter
+from unittest.mock import patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.config import Config
+from src.utils.http_client import HTTPClient
+from src.utils.retry import LatencyTracker, RetryPolicy
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Plays back a script of status codes / exceptions / delays"""
+
+    def __init__(self, script):
+        super().__init__()
+        self.script = list(script)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            step = self.script[min(self.calls, len(self.script) - 1)]
+            self.calls += 1
+        if isinstance(step, Exception):
+            raise step
+        status, delay = step if isinstance(step, tuple) else (step, 0)
+        time.sleep(delay)
+        response = requests.Response()
+        response.status_code = status
+        response._content = str(status).encode()
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def _client(adapter, **env):
+    with patch.dict(os.environ, env):
+        client = HTTPClient(config=Config(), retry_policy=RetryPolicy(max_retries=2, rng=lambda: 1.0))
+    client.cache = None
+    client.sleep = lambda seconds: None
+    client.mount('http://fake/', adapter)
+    return client
+
+
+class TestRetry:
+
+    def test_backoff_grows_and_is_capped(self):
+        """Delay doubles per attempt up to the cap, scaled by jitter"""
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=2.0, rng=lambda: 1.0)
+        assert [policy.delay(a) for a in range(4)] == [0.5, 1.0, 2.0, 2.0]
+        assert RetryPolicy(rng=lambda: 0.25).delay(1) == 0.25
+
+    def test_only_idempotent_methods_retry(self):
+        """POST is never retried"""
+        policy = RetryPolicy()
+        assert policy.can_retry('GET', 0)
+        assert not policy.can_retry('POST', 0)
+        assert not policy.can_retry('GET', 2)
+
+    def test_retries_server_errors(self):
+        """A 503 followed by a 200 returns the 200"""
+        adapter = ScriptedAdapter([503, 200])
+        client = _client(adapter)
+
+        assert client.get('http://fake/x').status_code == 200
+        assert adapter.calls == 2
+        assert client.request_stats.retries == 1
+
+    def test_retries_connection_errors(self):
+        """Connection errors are retried and re-raised once retries run out"""
+        adapter = ScriptedAdapter([requests.ConnectionError("boom")])
+        client = _client(adapter)
+
+        with pytest.raises(requests.ConnectionError):
+            client.get('http://fake/x')
+        assert adapter.calls == 3
+
+    def test_not_found_is_not_retried(self):
+        """4xx answers are final"""
+        adapter = ScriptedAdapter([404])
+        client = _client(adapter)
+
+        assert client.get('http://fake/x').status_code == 404
+        assert adapter.calls == 1
+
+    def test_hedged_request_wins(self):
+        """A slow request is hedged after the p95 delay and the fast copy wins"""
+        adapter = ScriptedAdapter([(200, 1.0), (200, 0)])
+        client = _client(adapter, HEDGE_REQUESTS='1', HEDGE_MIN_SAMPLES='1')
+        client.latency_tracker('http://fake/x').record(0.05)
+
+        started = time.monotonic()
+        response = client.get('http://fake/x')
+
+        assert response.status_code == 200
+        assert time.monotonic() - started < 0.9
+        assert client.request_stats.hedges == 1
+        assert client.request_stats.hedge_wins == 1
+
+    def test_latency_percentiles(self):
+        """Nearest-rank percentiles over the recorded window"""
+        tracker = LatencyTracker()
+        for value in range(1, 101):
+            tracker.record(value / 100.0)
+        assert tracker.percentile(50) == 0.5
+        assert tracker.percentile(99) == 0.99
+        assert LatencyTracker().percentile(95) is None
@@ -0,0 +1,138 @@
+# tests/test_safetensors.py
+"""
+Tests for safetensors header range reads and exact size scoring
+"""
+
+import pytest
+import json
+import struct
+import sys
+import os
+from unittest.mock import Mock, patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.artifacts import ModelArtifacts
+from src.metrics.size_metric import SizeMetric
+from src.models.model import ModelInfo
+from src.utils import safetensors
+from src.utils.safetensors import count_parameters, parameter_bytes, read_header
+
+
+def _safetensors_bytes(tensors, padding=0):
+    header = json.dumps(dict(tensors, __metadata__={'format': 'pt'})).encode() + b' ' * padding
+    return struct.pack('<Q', len(header)) + header + b'\0' * 64
+
+
+def _range_response(data):
+    def respond(url, headers=None, **kwargs):
+        start, end = headers['Range'][len('bytes='):].split('-')
+        response = Mock(status_code=206)
+        response.iter_content.return_value = [data[int(start):int(end) + 1]]
+        return response
+    return respond
+
+
+class TestSafetensorsHeader:
+
+    def test_count_parameters_per_dtype(self):
+        """Parameters are counted per dtype and metadata is ignored"""
+        header = {
+            '__metadata__': {'format': 'pt'},
+            'a': {'dtype': 'BF16', 'shape': [4, 8], 'data_offsets': [0, 64]},
+            'b': {'dtype': 'F32', 'shape': [8], 'data_offsets': [64, 96]},
+            'c': {'dtype': 'BF16', 'shape': [], 'data_offsets': [96, 98]},
+        }
+        counts = count_parameters(header)
+
+        assert counts == {'BF16': 33, 'F32': 8}
+        assert parameter_bytes(counts) == 33 * 2 + 8 * 4
+
+    def test_read_header_single_request(self):
+        """A small header is read with one ranged request"""
+        data = _safetensors_bytes({'w': {'dtype': 'F16', 'shape': [2, 3], 'data_offsets': [0, 12]}})
+        session = Mock()
+        session.get.side_effect = _range_response(data)
+
+        header = read_header(session, 'https://hf/model.safetensors')
+
+        assert header['w']['shape'] == [2, 3]
+        assert session.get.call_count == 1
+        assert session.get.call_args.kwargs['stream'] is True
+
+    def test_read_header_larger_than_prefetch(self):
+        """A header longer than the prefetch window takes a second read"""
+        data = _safetensors_bytes({'w': {'dtype': 'F16', 'shape': [1], 'data_offsets': [0, 2]}},
+                                  padding=safetensors.PREFETCH_BYTES)
+        session = Mock()
+        session.get.side_effect = _range_response(data)
+
+        assert read_header(session, 'https://hf/model.safetensors')['w']['dtype'] == 'F16'
+        assert session.get.call_count == 2
+
+
+class TestExactModelSize:
+
+    def setup_method(self):
+        self.model_info = ModelInfo(
+            name="test/model-7b",
+            url="https://huggingface.co/test/model-7b",
+            api_data={},
+            sha="abc",
+            siblings=[
+                {'rfilename': 'model.safetensors.index.json', 'size': 100},
+                {'rfilename': 'model-00001-of-00002.safetensors', 'size': 10},
+                {'rfilename': 'model-00002-of-00002.safetensors', 'size': 10},
+            ]
+        )
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_sharded_checkpoint_counts(self, mock_get):
+        """Every shard listed in the index is read once, pinned to the commit"""
+        shard = _safetensors_bytes({'w': {'dtype': 'BF16', 'shape': [1000, 1000], 'data_offsets': [0, 1]}})
+
+        def respond(url, headers=None, **kwargs):
+            if url.endswith('index.json'):
+                return Mock(status_code=200, json=Mock(return_value={'weight_map': {
+                    'a': 'model-00001-of-00002.safetensors',
+                    'b': 'model-00002-of-00002.safetensors',
+                    'c': 'model-00002-of-00002.safetensors',
+                }}))
+            return _range_response(shard)(url, headers)
+
+        mock_get.side_effect = respond
+        counts = ModelArtifacts(self.model_info).parameter_counts
+
+        assert counts == {'BF16': 2_000_000}
+        urls = sorted(call.args[0] for call in mock_get.call_args_list)
+        assert urls[0] == 'https://huggingface.co/test/model-7b/resolve/abc/model-00001-of-00002.safetensors'
+        assert len(urls) == 3
+
+    @patch('src.metrics.artifacts.requests.Session.get')
+    def test_counts_from_model_info(self, mock_get):
+        """Counts the Hub reports in the model info need no header reads"""
+        self.model_info.api_data = {'safetensors': {'parameters': {'BF16': 7_000_000, 'F32': 10}, 'total': 7_000_010}}
+
+        counts = ModelArtifacts(self.model_info).parameter_counts
+
+        assert counts == {'BF16': 7_000_000, 'F32': 10}
+        mock_get.assert_not_called()
+
+    def test_quantized_fit_scores(self):
+        """Exact counts replace the name guess and credit quantized fits"""
+        metric = SizeMetric()
+        artifacts = ModelArtifacts(self.model_info)
+        # 1.5B BF16 parameters: ~2.8GB native, ~0.7GB at int4
+        artifacts._values['parameter_counts'] = {'BF16': 1_500_000_000}
+
+        assert metric._estimate_model_size(self.model_info, artifacts) == pytest.approx(2.79, abs=0.01)
+        footprints = metric.project_memory(artifacts.parameter_counts)
+        assert footprints == pytest.approx({'fp16': 2.79, 'int8': 1.40, 'int4': 0.70}, abs=0.01)
+        scores = metric.calculate(self.model_info, artifacts)
+
+        assert scores['raspberry_pi'] == 0.3
+        assert scores['jetson_nano'] == 0.8
+        assert scores['desktop_pc'] == 1.0
+
+    def test_projection_without_counts(self):
+        """No safetensors headers means no projection"""
+        assert SizeMetric().project_memory(None) is None
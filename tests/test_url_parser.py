@@ -6,6 +6,7 @@ Tests for URL parser module
 import pytest
 import sys
 import os
+from unittest.mock import Mock, patch
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.url_parser import URLParser
@@ -47,4 +48,65 @@ class TestURLParser:
         """Test parsing invalid URLs"""
         invalid_url = "not-a-valid-url"
         result = self.parser.parse_model_url(invalid_url)
-        assert result is None
\ No newline at end of file
+        assert result is None
+    
+    @patch('requests.Session.get')
+    def test_parse_model_url_hydrates_siblings(self, mock_get):
+        """Siblings with sizes and the commit sha come back in the same call"""
+        response = Mock(status_code=200)
+        response.json.return_value = {
+            'sha': 'abc123',
+            'downloads': 10,
+            'cardData': {'license': 'mit'},
+            'siblings': [{'rfilename': 'model.safetensors', 'size': 1024,
+                          'blobId': 'b1', 'lfs': {'size': 1024}}],
+        }
+        mock_get.return_value = response
+
+        result = self.parser.parse_model_url("https://huggingface.co/test/model")
+
+        assert result.sha == 'abc123'
+        assert result.siblings[0]['rfilename'] == 'model.safetensors'
+        assert result.card_data == {'license': 'mit'}
+        # blobs=true alone: the Hub rejects it combined with expand[]
+        assert mock_get.call_args.kwargs['params'] == {'blobs': 'true'}
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_parse_model_url_records_failed_fetch(self, mock_get):
+        """A throttled model info request is recorded; a missing model is not"""
+        mock_get.return_value = Mock(status_code=503)
+        throttled = self.parser.parse_model_url("https://huggingface.co/test/model")
+        mock_get.return_value = Mock(status_code=404)
+        missing = self.parser.parse_model_url("https://huggingface.co/test/model")
+
+        assert throttled.api_data == {} and throttled.fetch_failures == ['model info']
+        assert missing.fetch_failures == []
+
+    @patch('requests.Session.get')
+    def test_parse_code_url_records_pushed_at(self, mock_get):
+        """The last push time identifies the revision of a code repository"""
+        response = Mock(status_code=200)
+        response.json.return_value = {'stargazers_count': 3, 'pushed_at': '2024-05-01T12:00:00Z'}
+        mock_get.return_value = response
+
+        result = self.parser.parse_code_url("https://github.com/org/repo")
+
+        assert result.pushed_at == '2024-05-01T12:00:00Z'
+        assert result.stars == 3
+
+    @patch('requests.Session.get')
+    def test_parse_dataset_url_profiles_parquet(self, mock_get):
+        """Canonical dataset names resolve to their owner, with parquet row and size stats"""
+        api = Mock(status_code=200)
+        api.json.return_value = {'id': 'allenai/c4', 'downloads': 500}
+        size = Mock(status_code=200)
+        size.json.return_value = {'size': {'dataset': {'num_rows': 365000000,
+                                                       'num_bytes_parquet_files': 300000000000}}}
+        mock_get.side_effect = [api, size]
+
+        result = self.parser.parse_dataset_url("https://huggingface.co/datasets/c4")
+
+        assert result.name == 'allenai/c4'
+        assert (result.num_rows, result.parquet_bytes) == (365000000, 300000000000)
+        assert mock_get.call_args.kwargs['params'] == {'dataset': 'allenai/c4'}
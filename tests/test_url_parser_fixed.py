@@ -126,7 +126,7 @@ class TestURLParserFixed:
         """Test parsing model URL with API data"""
         parser = URLParser()
         
-        with patch('src.url_parser.requests.get') as mock_get:
+        with patch('requests.get') as mock_get:
             # Mock API response
             mock_response = Mock()
             mock_response.status_code = 200
@@ -153,7 +153,7 @@ class TestURLParserFixed:
         """Test parsing model URL when API fails"""
         parser = URLParser()
         
-        with patch('src.url_parser.requests.get') as mock_get:
+        with patch('requests.get') as mock_get:
             # Mock API failure
             mock_response = Mock()
             mock_response.status_code = 404
@@ -170,7 +170,7 @@ class TestURLParserFixed:
         """Test parsing model URL with network error"""
         parser = URLParser()
         
-        with patch('src.url_parser.requests.get') as mock_get:
+        with patch('requests.get') as mock_get:
             mock_get.side_effect = Exception("Network error")
             
             url = "https://huggingface.co/test/model"
@@ -199,7 +199,7 @@ class TestURLParserFixed:
         """Test parsing model URL with timeout"""
         parser = URLParser()
         
-        with patch('src.url_parser.requests.get') as mock_get:
+        with patch('requests.get') as mock_get:
             mock_get.side_effect = Exception("Timeout")
             
             url = "https://huggingface.co/test/model"
@@ -213,7 +213,7 @@ class TestURLParserFixed:
         """Test parsing model URL with JSON error"""
         parser = URLParser()
         
-        with patch('src.url_parser.requests.get') as mock_get:
+        with patch('requests.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.side_effect = ValueError("Invalid JSON")
@@ -230,7 +230,7 @@ class TestURLParserFixed:
         """Test parsing model URL with partial data"""
         parser = URLParser()
         
-        with patch('src.url_parser.requests.get') as mock_get:
+        with patch('requests.get') as mock_get:
             # Mock partial API response
             mock_response = Mock()
             mock_response.status_code = 200
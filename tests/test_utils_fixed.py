@@ -109,7 +109,7 @@ class TestFileUtils:
         """Test successful file download"""
         file_utils = FileUtils()
         
-        with patch('src.utils.file_utils.requests.Session.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.headers = {'content-length': '100'}
@@ -128,7 +128,7 @@ class TestFileUtils:
         """Test file download failure"""
         file_utils = FileUtils()
         
-        with patch('src.utils.file_utils.requests.Session.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_response.raise_for_status.side_effect = Exception("404 Not Found")
@@ -141,7 +141,7 @@ class TestFileUtils:
         """Test file download with exception"""
         file_utils = FileUtils()
         
-        with patch('src.utils.file_utils.requests.Session.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = Exception("Network error")
             
             result = file_utils.download_file('http://example.com/test')
@@ -151,7 +151,7 @@ class TestFileUtils:
         """Test file download with file too large"""
         file_utils = FileUtils()
         
-        with patch('src.utils.file_utils.requests.Session.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.headers = {'content-length': '20000000'}  # 20MB
@@ -0,0 +1,92 @@
+# tests/test_weight_profiles.py
+"""
+Tests for named net score weight profiles
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import Mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics.calculator import MetricsCalculator
+from src.models.model import ModelInfo
+from src.utils.weight_profiles import load_weight_profiles
+
+PROFILES = """
+security:
+  license: 0.5
+  bus_factor: 0.5
+research:
+  performance_claims: 1
+"""
+
+METRICS = {
+    'license': 1.0, 'ramp_up_time': 0.5, 'bus_factor': 0.2, 'performance_claims': 0.8,
+    'dataset_and_code_score': 0.4, 'dataset_quality': 0.3, 'code_quality': 0.6,
+}
+
+
+class TestLoadWeightProfiles:
+
+    def test_yaml_profiles(self, tmp_path):
+        """Profiles map names to metric weights"""
+        path = tmp_path / 'profiles.yaml'
+        path.write_text(PROFILES)
+
+        profiles = load_weight_profiles(str(path), METRICS)
+
+        assert profiles == {'security': {'license': 0.5, 'bus_factor': 0.5},
+                            'research': {'performance_claims': 1.0}}
+
+    def test_invalid_profiles_are_skipped(self, tmp_path):
+        """Bad names, unknown metrics and non-numeric weights drop only that profile"""
+        path = tmp_path / 'profiles.json'
+        path.write_text('{"ok": {"license": 1}, "Bad Name": {"license": 1}, "latency": {"license": 1},'
+                        ' "typo": {"licence": 1}, "text": {"license": "high"}, "neg": {"license": -1}}')
+
+        assert list(load_weight_profiles(str(path), METRICS)) == ['ok']
+
+    def test_missing_file(self, tmp_path):
+        """A missing file yields no profiles"""
+        assert load_weight_profiles(str(tmp_path / 'none.yaml'), METRICS) == {}
+
+
+class TestProfileScores:
+
+    def setup_method(self):
+        self.calculator = MetricsCalculator(feature_store=Mock())
+        self.calculator.weight_profiles = {
+            'security': {'license': 0.5, 'bus_factor': 0.5},
+            'research': {'performance_claims': 1.0},
+        }
+
+    def test_profiles_in_record(self):
+        """Each profile is its own net_score_<profile> field from the same metric values"""
+        result = self.calculator._build_result(ModelInfo(name="org/model", url="", api_data={}), dict(METRICS))
+
+        assert result['net_score_security'] == pytest.approx(0.6)
+        assert result['net_score_research'] == pytest.approx(0.8)
+        assert result['net_score'] == self.calculator._calculate_net_score(METRICS)
+        assert list(result)[:6] == ['name', 'category', 'net_score', 'net_score_latency',
+                                    'net_score_security', 'net_score_research']
+
+    def test_no_profiles_keeps_schema(self):
+        """Without profiles the record has only the standard fields"""
+        self.calculator.weight_profiles = {}
+        result = self.calculator._build_result(ModelInfo(name="org/model", url="", api_data={}), dict(METRICS))
+
+        assert not [key for key in result if key.startswith('net_score_') and key != 'net_score_latency']
+
+    def test_batch_scorer_reports_profiles(self):
+        """The vectorised scorer reports the same profile scores"""
+        features = {
+            'license': {'license': 'mit'},
+            'bus_factor': {'known_model': False, 'last_modified': '', 'maintainers': 0.5, 'community': 0.3},
+            'performance_claims': {'known_model': True, 'model_index': 1.0, 'readme': 0.3, 'tags': 0.0},
+        }
+        single = self.calculator.score_features('org/model', features)
+        batch = self.calculator.score_features_batch([{'name': 'org/model', 'features': features, 'latencies': {}}])[0]
+
+        assert batch['net_score_security'] == single['net_score_security']
+        assert batch['net_score_research'] == single['net_score_research']